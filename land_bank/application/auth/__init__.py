@@ -1,4 +1,8 @@
-from .dependency import AuthenticationDependency, AuthorizationDependency
+from .dependency import (
+    AuthenticationDependency,
+    AuthorizationDependency,
+    authentication
+)
 from .hasher import Hasher
 from .refresh import RefreshSession
 from .token import TokenService
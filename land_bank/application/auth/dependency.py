@@ -6,14 +6,15 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from infrastructure.database.model import Employee
 from infrastructure.database.session import ASYNC_CONTEXT_SESSION
-from infrastructure.database.transaction import in_transaction
+from infrastructure.database.transaction import in_read_only_transaction
 from infrastructure.exception import rpc_exceptions
 from storage.employee import EmployeeRepository
 from .token import TokenService
 
 __all__ = [
     'AuthenticationDependency',
-    'AuthorizationDependency'
+    'AuthorizationDependency',
+    'authentication'
 ]
 
 
@@ -39,7 +40,7 @@ class AuthenticationDependency:
             return await self.__strict_auth(authorization)
         return await self.__soft_auth(authorization)
 
-    @in_transaction
+    @in_read_only_transaction
     async def __strict_auth(
             self,
             access_token: str,
@@ -48,9 +49,11 @@ class AuthenticationDependency:
             raise rpc_exceptions.AuthenticationError(
                 data='No access token there')
         payload = _get_token_payload(access_token)
-        employee: Optional[Employee] = await self.__repository.get_employee(
-            ASYNC_CONTEXT_SESSION.get(), Employee.email == payload.get('email')
-        )
+        email: Optional[str] = payload.get('email')
+        employee: Optional[Employee] = None
+        if email is not None:
+            employee = await self.__repository.get_employee_by_email(
+                ASYNC_CONTEXT_SESSION.get(), email)
         if employee is None:
             raise rpc_exceptions.AuthenticationError(
                 data='Access Token is invalid')
@@ -73,7 +76,7 @@ class AuthorizationDependency:
         self.__permission_name = permission_name
         self.__employee_repository: EmployeeRepository = EmployeeRepository()
 
-    @in_transaction
+    @in_read_only_transaction
     async def __call__(
             self,
             authorization: Optional[Annotated[str, Header()]] = None,
@@ -104,3 +107,9 @@ class AuthorizationDependency:
                 has_perm = True
                 break
         return has_perm
+
+
+# Общий экземпляр: FastAPI кэширует зависимости по вызываемому объекту,
+# поэтому в пределах HTTP запроса (в том числе пакетного) пользователь
+# загружается один раз
+authentication = AuthenticationDependency()
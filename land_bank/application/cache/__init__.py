@@ -0,0 +1,2 @@
+from .juristic_options import juristic_options_cache
+from .land_area_total import get_land_area_total
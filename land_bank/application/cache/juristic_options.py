@@ -0,0 +1,43 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from domain.juristic_data.schemas import (
+    JuristicDataResponseDTO,
+    LimitSchema,
+    PermittedUseSchema
+)
+from domain.trusted import construct_trusted
+from infrastructure.database.session import ASYNC_CONTEXT_SESSION
+from infrastructure.database.transaction import in_read_only_transaction
+from infrastructure.redis import VersionedCache
+from storage.limit import LimitRepository
+from storage.permitted_use import PermittedUseRepository
+
+__all__ = [
+    'juristic_options_cache'
+]
+
+limit_repository: LimitRepository = LimitRepository()
+permitted_use_repository: PermittedUseRepository = PermittedUseRepository()
+
+
+@in_read_only_transaction
+async def load_juristic_options() -> JuristicDataResponseDTO:
+    """Читает справочники ограничений и разрешенного пользования из БД"""
+    session: AsyncSession = ASYNC_CONTEXT_SESSION.get()
+    limits = await limit_repository.select_all(session)
+    permitted_uses = await permitted_use_repository.select_all(session)
+    return JuristicDataResponseDTO(
+        limits=[
+            construct_trusted(LimitSchema, _limit)
+            for _limit in limits
+        ],
+        permitted_uses=[
+            construct_trusted(PermittedUseSchema, use)
+            for use in permitted_uses
+        ]
+    )
+
+
+juristic_options_cache: VersionedCache[JuristicDataResponseDTO] = (
+    VersionedCache('juristic_options', load_juristic_options)
+)
@@ -0,0 +1,38 @@
+from typing import Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from domain.land_area.schema import PageTotalDTO
+from domain.request_params.schema import LandAreaFilterParams
+from infrastructure.redis import SignatureCache
+from infrastructure.settings import AppSettings
+from storage.land_area import LandAreaRepository
+
+__all__ = [
+    'get_land_area_total'
+]
+
+land_area_repository: LandAreaRepository = LandAreaRepository()
+land_area_total_cache: SignatureCache = SignatureCache(
+    'land_area_total', AppSettings.COUNT_CACHE_TTL_SECONDS)
+
+
+async def get_land_area_total(
+        session: AsyncSession,
+        filter_params: Optional[LandAreaFilterParams]
+) -> PageTotalDTO:
+    """
+    Количество участков по фильтрам, закэшированное в Redis на
+    COUNT_CACHE_TTL_SECONDS
+    :param session: Сессия БД
+    :param filter_params: Параметры фильтрации
+    :return: Количество и признак оценки
+    """
+    async def count() -> dict:
+        total, is_estimate = await land_area_repository.count_land_areas(
+            session, filter_params, AppSettings.EXACT_COUNT_LIMIT)
+        return {'total': total, 'is_estimate': is_estimate}
+
+    signature = filter_params.model_dump(mode='json') if filter_params \
+        else None
+    return PageTotalDTO(**await land_area_total_cache.get(signature, count))
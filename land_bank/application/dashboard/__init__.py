@@ -0,0 +1 @@
+from .refresh import refresh_rollups
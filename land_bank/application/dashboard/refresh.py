@@ -0,0 +1,24 @@
+import logging
+import time
+from datetime import datetime
+
+from infrastructure.database.session import isolated_session
+from storage.dashboard import DashboardRepository
+
+__all__ = [
+    'refresh_rollups'
+]
+
+dashboard_repository: DashboardRepository = DashboardRepository()
+
+
+async def refresh_rollups() -> None:
+    """Пересчитывает агрегаты дашборда в отдельной транзакции"""
+    started_at = time.perf_counter()
+    async with isolated_session() as session:
+        await dashboard_repository.refresh_rollups(session, datetime.now())
+        await session.commit()
+    logging.info(
+        'Dashboard rollups refreshed in %.1f ms',
+        (time.perf_counter() - started_at) * 1000
+    )
@@ -0,0 +1 @@
+from .exporter import EXPORT_MEDIA_TYPES, ExportFormat, export_land_areas
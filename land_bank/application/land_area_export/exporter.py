@@ -0,0 +1,98 @@
+import csv
+import io
+from typing import AsyncIterator, Callable, Dict, List, Literal, Optional
+
+from domain.land_area.schema import LandAreaExportDTO
+from domain.request_params.schema import LandAreaFilterParams
+from domain.trusted import construct_trusted
+from infrastructure.database.session import get_async_session
+from infrastructure.settings import AppSettings
+from storage.land_area import LandAreaRepository
+
+__all__ = [
+    'ExportFormat',
+    'EXPORT_MEDIA_TYPES',
+    'export_land_areas'
+]
+
+ExportFormat = Literal['csv', 'ndjson']
+
+EXPORT_MEDIA_TYPES: Dict[str, str] = {
+    'csv': 'text/csv',
+    'ndjson': 'application/x-ndjson'
+}
+
+# Плоские колонки CSV, связанные записи - через "; " в одной ячейке
+CSV_COLUMNS: List[str] = [
+    'id', 'name', 'cadastral_number', 'area_category', 'cadastral_cost',
+    'area_square', 'address', 'search_channel', 'working_status', 'stage',
+    'entered_at_base', 'owners', 'buildings', 'limits', 'permitted_uses'
+]
+
+land_area_repository: LandAreaRepository = LandAreaRepository()
+
+
+def _csv_row(land_area: LandAreaExportDTO) -> List:
+    return [
+        land_area.id, land_area.name, land_area.cadastral_number,
+        land_area.area_category, land_area.cadastral_cost,
+        land_area.area_square, land_area.address, land_area.search_channel,
+        land_area.working_status, land_area.stage,
+        land_area.entered_at_base.isoformat(),
+        '; '.join(
+            f'{owner.name or ""} ({owner.phone_number})'
+            for owner in land_area.owners
+        ),
+        '; '.join(building.name for building in land_area.area_buildings),
+        '; '.join(limit.name for limit in land_area.limits),
+        '; '.join(use.name for use in land_area.permitted_uses)
+    ]
+
+
+def _csv_encoder() -> Callable[[List[LandAreaExportDTO]], bytes]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    # BOM - чтобы Excel открыл кириллицу в UTF-8
+    buffer.write('\ufeff')
+    writer.writerow(CSV_COLUMNS)
+
+    def encode(land_areas: List[LandAreaExportDTO]) -> bytes:
+        writer.writerows(_csv_row(land_area) for land_area in land_areas)
+        chunk = buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+        return chunk.encode()
+
+    return encode
+
+
+def _ndjson_encode(land_areas: List[LandAreaExportDTO]) -> bytes:
+    return b''.join(
+        land_area.model_dump_json().encode() + b'\n'
+        for land_area in land_areas
+    )
+
+
+async def export_land_areas(
+        export_format: ExportFormat,
+        filter_params: Optional[LandAreaFilterParams] = None
+) -> AsyncIterator[bytes]:
+    """
+    Выгрузка участков для StreamingResponse: одна часть курсора - один
+    блок ответа. Сессия открывается здесь, а не в эндпоинте, так как
+    тело ответа отдается уже после выхода из него
+    :param export_format: csv или ndjson
+    :param filter_params: Параметры фильтрации
+    :return: Асинхронный итератор блоков ответа
+    """
+    encode = _csv_encoder() if export_format == 'csv' else _ndjson_encode
+    if export_format == 'csv':
+        yield encode([])
+    async with get_async_session() as session:
+        partitions = land_area_repository.stream_land_areas(
+            session, filter_params, AppSettings.EXPORT_PARTITION_SIZE)
+        async for partition in partitions:
+            yield encode([
+                construct_trusted(LandAreaExportDTO, land_area)
+                for land_area in partition
+            ])
@@ -0,0 +1,2 @@
+from .importer import LandAreaImporter, run_land_area_import
+from .reader import ImportFileError, is_supported_file, read_rows
@@ -0,0 +1,202 @@
+import logging
+import tempfile
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from pydantic import ValidationError
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from domain.land_area.schema import LandAreaRequestDTO, OwnerRequestDTO
+from domain.land_area_import.schema import ImportReportDTO, ImportRowErrorDTO
+from infrastructure.aws.s3_storage import S3Storage
+from infrastructure.database.session import isolated_session
+from infrastructure.settings import AppSettings
+from storage.land_area import LandAreaRepository
+from storage.owner import OwnerRepository
+from .reader import Row, read_rows
+
+__all__ = [
+    'LandAreaImporter',
+    'run_land_area_import'
+]
+
+# Колонки собственника в файле: owner_name, owner_phone_number, ...
+OWNER_PREFIX = 'owner_'
+# Поля, в которых допускается десятичная запятая: "12,5"
+_DECIMAL_FIELDS = ('area_square', 'cadastral_cost')
+
+land_area_repository: LandAreaRepository = LandAreaRepository()
+owner_repository: OwnerRepository = OwnerRepository()
+s3_storage: S3Storage = S3Storage()
+
+ProgressCallback = Callable[[ImportReportDTO], None]
+
+
+def _clean_row(row: Dict[str, Any]) -> Dict[str, Any]:
+    cleaned: Dict[str, Any] = {}
+    for name, value in row.items():
+        if isinstance(value, str):
+            value = value.strip()
+        if name and value not in (None, ''):
+            cleaned[name] = value
+    for name in _DECIMAL_FIELDS:
+        if isinstance(cleaned.get(name), str):
+            cleaned[name] = cleaned[name].replace(',', '.')
+    return cleaned
+
+
+def _parse_row(
+        row: Dict[str, Any]
+) -> Tuple[LandAreaRequestDTO, Optional[OwnerRequestDTO]]:
+    """
+    Проверяет строку файла теми же правилами, что и
+    create_cadastral_land_area
+    :param row: {колонка: значение}
+    :return: Участок и собственник, если в строке есть его колонки
+    """
+    cleaned = _clean_row(row)
+    land_area = LandAreaRequestDTO.model_validate({
+        name: value for name, value in cleaned.items()
+        if name in LandAreaRequestDTO.model_fields
+    })
+    owner_values = {
+        name[len(OWNER_PREFIX):]: value
+        for name, value in cleaned.items()
+        if name.startswith(OWNER_PREFIX)
+    }
+    owner = OwnerRequestDTO.model_validate(owner_values) if owner_values \
+        else None
+    return land_area, owner
+
+
+def _error_messages(error: ValidationError) -> List[str]:
+    return [
+        f"{'.'.join(map(str, detail['loc']))}: {detail['msg']}"
+        for detail in error.errors()
+    ]
+
+
+class _PendingArea:
+    """Участок, накопленный для записи, со всеми его строками файла"""
+    __slots__ = ('row_numbers', 'values', 'owners')
+
+    def __init__(self):
+        self.row_numbers: List[int] = []
+        self.values: Dict[str, Any] = {}
+        self.owners: Dict[str, OwnerRequestDTO] = {}
+
+
+class LandAreaImporter:
+    """
+    Импорт участков пачками. Участок с уже существующим кадастровым
+    номером обновляется, собственники добавляются, если у участка еще
+    нет собственника с тем же телефоном. Каждая пачка - отдельная
+    транзакция: ошибка записи отклоняет только строки этой пачки
+    """
+
+    def __init__(
+            self,
+            session: AsyncSession,
+            batch_size: int,
+            on_progress: Optional[ProgressCallback] = None
+    ):
+        self.__session: AsyncSession = session
+        self.__batch_size: int = batch_size
+        self.__on_progress: Optional[ProgressCallback] = on_progress
+        self.__pending: Dict[str, _PendingArea] = {}
+        self.__report: ImportReportDTO = ImportReportDTO()
+
+    async def run(self, rows: Iterable[Row]) -> ImportReportDTO:
+        """
+        :param rows: Пары (номер строки в файле, {колонка: значение})
+        :return: Отчет об импорте
+        """
+        for row_number, row in rows:
+            self.__report.processed += 1
+            self.__add_row(row_number, row)
+            if len(self.__pending) >= self.__batch_size:
+                await self.__flush()
+        await self.__flush()
+        return self.__report
+
+    def __add_row(self, row_number: int, row: Dict[str, Any]) -> None:
+        try:
+            land_area, owner = _parse_row(row)
+        except ValidationError as error:
+            self.__fail(row_number, _error_messages(error))
+            return
+        # Повторы номера в пределах пачки сливаются: один INSERT ... ON
+        # CONFLICT не может обновить одну строку дважды
+        pending = self.__pending.get(land_area.cadastral_number)
+        if pending is None:
+            pending = self.__pending[
+                land_area.cadastral_number] = _PendingArea()
+        pending.row_numbers.append(row_number)
+        pending.values = land_area.model_dump()
+        if owner is not None:
+            pending.owners[owner.phone_number] = owner
+
+    def __fail(self, row_number: int, messages: List[str]) -> None:
+        self.__report.failed += 1
+        if len(self.__report.errors) < AppSettings.IMPORT_MAX_REPORTED_ERRORS:
+            self.__report.errors.append(
+                ImportRowErrorDTO(row=row_number, errors=messages))
+
+    async def __flush(self) -> None:
+        if not self.__pending:
+            return
+        batch: List[_PendingArea] = list(self.__pending.values())
+        self.__pending = {}
+        try:
+            land_area_ids = await land_area_repository.upsert_land_areas(
+                self.__session, [pending.values for pending in batch])
+            owners_created: int = await owner_repository.create_missing_owners(
+                self.__session,
+                [
+                    {
+                        **owner.model_dump(),
+                        'land_area_id': land_area_ids[
+                            pending.values['cadastral_number']]
+                    }
+                    for pending in batch
+                    for owner in pending.owners.values()
+                ]
+            )
+            await self.__session.commit()
+        except SQLAlchemyError as error:
+            await self.__session.rollback()
+            message = str(getattr(error, 'orig', None) or error)
+            logging.warning('Land area import batch failed: %s', message)
+            for pending in batch:
+                for row_number in pending.row_numbers:
+                    self.__fail(row_number, [message])
+        else:
+            self.__report.land_areas += len(batch)
+            self.__report.owners += owners_created
+        if self.__on_progress is not None:
+            self.__on_progress(self.__report)
+
+
+async def run_land_area_import(
+        file_name: str,
+        on_progress: Optional[ProgressCallback] = None
+) -> ImportReportDTO:
+    """
+    Скачивает загруженный файл из s3 и импортирует его. Файл удаляется
+    из s3 и после ошибки импорта
+    :param file_name: Название файла в s3 хранилище
+    :param on_progress: Вызывается после записи каждой пачки
+    :return: Отчет об импорте
+    """
+    try:
+        with tempfile.TemporaryFile() as file:
+            await s3_storage.download_file(file_name, file)
+            file.seek(0)
+            async with isolated_session() as session:
+                importer = LandAreaImporter(
+                    session, AppSettings.IMPORT_BATCH_SIZE, on_progress)
+                report: ImportReportDTO = await importer.run(
+                    read_rows(file, file_name))
+    finally:
+        await s3_storage.delete_file(file_name)
+    return report
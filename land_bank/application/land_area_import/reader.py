@@ -0,0 +1,70 @@
+import csv
+import io
+import os
+from typing import Any, BinaryIO, Dict, Iterator, Optional, Tuple
+
+__all__ = [
+    'ImportFileError',
+    'is_supported_file',
+    'read_rows'
+]
+
+SUPPORTED_EXTENSIONS: Tuple[str, ...] = ('.csv',)
+_SNIFF_SIZE = 4096
+
+Row = Tuple[int, Dict[str, Any]]
+
+
+class ImportFileError(ValueError):
+    """Файл импорта не удалось прочитать"""
+
+
+def _extension(file_name: Optional[str]) -> str:
+    return os.path.splitext(file_name or '')[1].lower()
+
+
+def _normalize_header(name: Any) -> str:
+    return str(name).strip().lower() if name is not None else ''
+
+
+def is_supported_file(file_name: Optional[str]) -> bool:
+    """
+    :param file_name: Название файла
+    :return: True, если формат файла поддерживается импортом
+    """
+    return _extension(file_name) in SUPPORTED_EXTENSIONS
+
+
+def read_rows(file: BinaryIO, file_name: str) -> Iterator[Row]:
+    """
+    Построчно читает CSV файл, не загружая его в память целиком.
+    Первая строка - заголовок, названия колонок приводятся к нижнему
+    регистру
+    :param file: Файл, открытый в бинарном режиме
+    :param file_name: Название файла, по расширению определяется формат
+    :return: Итератор пар (номер строки в файле, {колонка: значение})
+    """
+    extension = _extension(file_name)
+    if extension == '.csv':
+        return _read_csv(file)
+    raise ImportFileError(f'Unsupported file format: "{extension}"')
+
+
+def _read_csv(file: BinaryIO) -> Iterator[Row]:
+    text = io.TextIOWrapper(file, encoding='utf-8-sig', newline='')
+    sample = text.read(_SNIFF_SIZE)
+    text.seek(0)
+    try:
+        dialect = csv.Sniffer().sniff(sample, delimiters=',;\t')
+    except csv.Error:
+        dialect = csv.excel
+    reader = csv.DictReader(text, dialect=dialect)
+    if reader.fieldnames is None:
+        return
+    reader.fieldnames = [_normalize_header(name) for name in reader.fieldnames]
+    try:
+        for row_number, row in enumerate(reader, start=2):
+            yield row_number, row
+    except (csv.Error, UnicodeDecodeError) as error:
+        raise ImportFileError(f'CSV file is malformed: {error}')
+
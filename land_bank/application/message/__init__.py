@@ -1,2 +1,3 @@
+from .deadline_reminder_message import DeadlineReminderMessage
 from .imessage import IMessage
 from .password_reset_message import PasswordResetMessage
@@ -0,0 +1 @@
+from .reminder import send_deadline_reminders
@@ -0,0 +1,59 @@
+import logging
+from datetime import datetime, timedelta
+from typing import Callable, Sequence
+
+from application.message import DeadlineReminderMessage, IMessage
+from infrastructure.database.model import LandAreaTask
+from infrastructure.database.session import isolated_session
+from infrastructure.settings import AppSettings, SMTPSettings
+from storage.scheduler_task import LandAreaTaskRepository
+
+__all__ = [
+    'send_deadline_reminders'
+]
+
+task_repository: LandAreaTaskRepository = LandAreaTaskRepository()
+
+
+def _reminder(task: LandAreaTask) -> IMessage:
+    return DeadlineReminderMessage(
+        sender=SMTPSettings.EMAIL,
+        receiver=task.executor.email,
+        task_name=task.name,
+        deadline=task.deadline.strftime('%d.%m.%Y %H:%M')
+    )
+
+
+async def send_deadline_reminders(
+        notify: Callable[[IMessage], None],
+        now: datetime
+) -> int:
+    """
+    Напоминает исполнителям о просроченных задачах и задачах, срок
+    которых наступит в ближайшие DEADLINE_REMINDER_HOURS часов. Задачи
+    обрабатываются пачками, каждая пачка - в своей транзакции: после
+    отправки напоминаний задачи отмечаются и в следующий раз не выбираются
+    :param notify: Отправка сообщения (постановка в очередь)
+    :param now: Текущий момент
+    :return: Число отправленных напоминаний
+    """
+    deadline_until = now + timedelta(hours=AppSettings.DEADLINE_REMINDER_HOURS)
+    sent = 0
+    async with isolated_session() as session:
+        while True:
+            tasks: Sequence[LandAreaTask] = (
+                await task_repository.lock_tasks_to_remind(
+                    session, deadline_until,
+                    AppSettings.DEADLINE_REMINDER_BATCH_SIZE)
+            )
+            if not tasks:
+                break
+            for task in tasks:
+                notify(_reminder(task))
+            await task_repository.mark_reminded(
+                session, [task.id for task in tasks])
+            await session.commit()
+            sent += len(tasks)
+            session.expunge_all()
+    logging.info('Deadline reminders sent: %d', sent)
+    return sent
@@ -1,9 +1,11 @@
 from datetime import datetime
+from typing import List, Optional
 from uuid import UUID
 
 from pydantic import BaseModel, field_validator
 
 from domain.employee import ShortEmployeeResponseDTO
+from domain.request_params.schema import KeysetCursor
 
 
 class AreaCommentRequestDTO(BaseModel):
@@ -26,3 +28,8 @@ class AreaCommentResponseDTO(AreaCommentRequestDTO):
 
 class AreaCommentRelatedResponseDTO(AreaCommentResponseDTO):
     employee: 'ShortEmployeeResponseDTO'
+
+
+class AreaCommentPageResponseDTO(BaseModel):
+    items: List['AreaCommentRelatedResponseDTO']
+    next_cursor: Optional['KeysetCursor'] = None
@@ -0,0 +1,63 @@
+from datetime import datetime
+from typing import List, Literal, Optional
+from uuid import UUID
+
+from pydantic import BaseModel
+
+from domain.land_area.schema import LandAreaResponseDTO
+from domain.scheduler_task.schema import TaskResponseDTO
+
+__all__ = [
+    'ChangeEntity',
+    'ChangePosition',
+    'ChangeCursor',
+    'LandAreaChangeDTO',
+    'TaskChangeDTO',
+    'DeletedRecordDTO',
+    'ChangesResponseDTO'
+]
+
+# Сущности, изменения которых отдает лента
+ChangeEntity = Literal['land_area', 'task']
+
+
+class ChangePosition(BaseModel):
+    """Последняя полученная запись одного потока ленты"""
+    changed_at: datetime
+    id: UUID
+
+
+class ChangeCursor(BaseModel):
+    """
+    Позиция клиента в ленте изменений. Потоки читаются независимо,
+    пустая позиция - поток читается с начала
+    """
+    land_areas: Optional[ChangePosition] = None
+    tasks: Optional[ChangePosition] = None
+    deleted: Optional[ChangePosition] = None
+
+
+class LandAreaChangeDTO(LandAreaResponseDTO):
+    updated_at: datetime
+
+
+class TaskChangeDTO(TaskResponseDTO):
+    updated_at: datetime
+
+
+class DeletedRecordDTO(BaseModel):
+    entity: ChangeEntity
+    id: UUID
+    deleted_at: datetime
+
+
+class ChangesResponseDTO(BaseModel):
+    """
+    Изменения после курсора. Если has_more, клиент сразу запрашивает
+    следующую порцию с next_cursor, иначе - повторяет запрос позже
+    """
+    land_areas: List[LandAreaChangeDTO]
+    tasks: List[TaskChangeDTO]
+    deleted: List[DeletedRecordDTO]
+    next_cursor: ChangeCursor
+    has_more: bool
@@ -0,0 +1,37 @@
+from datetime import datetime
+from typing import List, Optional
+from uuid import UUID
+
+from pydantic import BaseModel
+
+__all__ = [
+    'LandAreaRollupDTO',
+    'TaskRollupDTO',
+    'DashboardResponseDTO'
+]
+
+
+class LandAreaRollupDTO(BaseModel):
+    stage: str
+    working_status: str
+    area_category: str
+    land_area_count: int
+    area_square_sum: float
+    cadastral_cost_sum: float
+
+
+class TaskRollupDTO(BaseModel):
+    executor_id: UUID
+    status: str
+    is_overdue: bool
+    task_count: int
+
+
+class DashboardResponseDTO(BaseModel):
+    """
+    Сводка по участкам и задачам. Актуальна на момент refreshed_at,
+    просрочка задач считается на тот же момент
+    """
+    refreshed_at: Optional[datetime]
+    land_areas: List['LandAreaRollupDTO']
+    tasks: List['TaskRollupDTO']
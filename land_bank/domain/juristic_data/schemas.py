@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Optional
 from uuid import UUID
 
 from pydantic import BaseModel
@@ -6,7 +6,8 @@ from pydantic import BaseModel
 __all__ = [
     'LimitSchema',
     'PermittedUseSchema',
-    'JuristicDataResponseDTO'
+    'JuristicDataResponseDTO',
+    'JuristicOptionsResponseDTO'
 ]
 
 
@@ -23,3 +24,15 @@ PermittedUseSchema = _LimitPermittedUseResponseSchema
 class JuristicDataResponseDTO(BaseModel):
     limits: List[_LimitPermittedUseResponseSchema]
     permitted_uses: List[_LimitPermittedUseResponseSchema]
+
+
+class JuristicOptionsResponseDTO(BaseModel):
+    """
+    Справочники ограничений и разрешенного пользования.
+    Если переданный клиентом etag совпал с текущим, справочники не
+    передаются и not_modified=True
+    """
+    etag: str
+    not_modified: bool = False
+    limits: Optional[List[_LimitPermittedUseResponseSchema]] = None
+    permitted_uses: Optional[List[_LimitPermittedUseResponseSchema]] = None
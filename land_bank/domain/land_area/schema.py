@@ -1,12 +1,13 @@
 import re
 from datetime import datetime
-from typing import Optional, List, Union
+from typing import Literal, Optional, List, Tuple, Union
 from uuid import UUID
 
 from pydantic import BaseModel, EmailStr, Field, field_validator
 
 from domain.employee.schema import ShortEmployeeResponseDTO
 from domain.extra_data.schemas import ExtraDataResponseSchema
+from domain.juristic_data.schemas import LimitSchema, PermittedUseSchema
 
 __all__ = [
     'OwnerRequestDTO',
@@ -14,12 +15,26 @@ __all__ = [
     'BuildingRequestDTO',
     'LandAreaRelatedResponseDTO',
     'LandAreaListResponseDTO',
+    'LandAreaSearchResponseDTO',
+    'LandAreaPageResponseDTO',
+    'PageTotalDTO',
+    'LandAreaExportDTO',
     'ShortLandAreaResponseDTO',
     'LandAreaResponseDTO',
     'BuildingResponseDTO',
-    'OwnerResponseDTO'
+    'OwnerResponseDTO',
+    'LandAreaRelation',
+    'LAND_AREA_RELATIONS'
 ]
 
+# Отношения участка, которые можно запросить в get_land_area
+LandAreaRelation = Literal[
+    'area_buildings', 'owners', 'comments', 'extra_data'
+]
+LAND_AREA_RELATIONS: Tuple[LandAreaRelation, ...] = (
+    'area_buildings', 'owners', 'comments', 'extra_data'
+)
+
 
 def _phone_number_validator(field: Union[str, None]) -> Union[str, None]:
     if field is None:
@@ -53,6 +68,7 @@ class OwnerRequestDTO(BaseModel):
 class OwnerResponseDTO(OwnerRequestDTO):
     id: UUID
     land_area_id: UUID
+    version: int
 
 
 class BuildingRequestDTO(BaseModel):
@@ -115,12 +131,15 @@ class LandAreaResponseDTO(LandAreaRequestDTO):
     entered_at_base: datetime
     working_status: str
     stage: str
+    version: int
 
 
 class LandAreaRelatedResponseDTO(LandAreaResponseDTO):
     area_buildings: Optional[List['BuildingResponseDTO']] = None
     owners: Optional[List['OwnerResponseDTO']] = None
     comments: Optional[List['_InternalAreaCommentModel']] = None
+    # Заполняется, если запрошены только последние комментарии
+    comments_total: Optional[int] = None
     extra_data: Optional['ExtraDataResponseSchema'] = None
 
 
@@ -134,3 +153,26 @@ class LandAreaListResponseDTO(BaseModel):
     working_status: str
     stage: str
     owners: List['OwnerResponseDTO']
+
+
+class LandAreaSearchResponseDTO(LandAreaListResponseDTO):
+    rank: float
+
+
+class PageTotalDTO(BaseModel):
+    total: int
+    is_estimate: bool
+
+
+class LandAreaPageResponseDTO(BaseModel):
+    items: List['LandAreaListResponseDTO']
+    total: int
+    is_estimate: bool
+
+
+class LandAreaExportDTO(LandAreaResponseDTO):
+    """Участок со всеми связанными данными для выгрузки реестра"""
+    owners: List['OwnerResponseDTO']
+    area_buildings: List['BuildingResponseDTO']
+    limits: List['LimitSchema']
+    permitted_uses: List['PermittedUseSchema']
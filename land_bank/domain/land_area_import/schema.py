@@ -0,0 +1,38 @@
+from typing import List, Optional
+
+from pydantic import BaseModel
+
+__all__ = [
+    'ImportRowErrorDTO',
+    'ImportReportDTO',
+    'ImportStartedResponseDTO',
+    'ImportStatusResponseDTO'
+]
+
+
+class ImportRowErrorDTO(BaseModel):
+    row: int
+    errors: List[str]
+
+
+class ImportReportDTO(BaseModel):
+    """
+    Ход импорта: processed и failed считаются в строках файла,
+    land_areas и owners - в созданных или обновленных записях
+    """
+    processed: int = 0
+    failed: int = 0
+    land_areas: int = 0
+    owners: int = 0
+    errors: List['ImportRowErrorDTO'] = []
+
+
+class ImportStartedResponseDTO(BaseModel):
+    task_id: str
+
+
+class ImportStatusResponseDTO(BaseModel):
+    task_id: str
+    state: str
+    report: Optional['ImportReportDTO'] = None
+    error: Optional[str] = None
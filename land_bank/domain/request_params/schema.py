@@ -1,10 +1,15 @@
-from typing import List, Literal
+from datetime import datetime
+from typing import List, Literal, Optional, Tuple
+from uuid import UUID
 
-from pydantic import BaseModel, field_validator
+from pydantic import BaseModel, Field, field_validator, model_validator
 
 __all__ = [
     'SortParams',
-    'LimitOffset'
+    'LimitOffset',
+    'LandAreaFilterParams',
+    'KeysetCursor',
+    'KeysetParams'
 ]
 
 ORDER_FIELDS: List[str] = [
@@ -46,3 +51,79 @@ class LimitOffset(BaseModel):
         if field < 0:
             raise ValueError('Fields "offset" & "limit" must be gte 0')
         return field
+
+
+class LandAreaFilterParams(BaseModel):
+    """
+    Фильтры списка участков. Списки значений объединяются через "ИЛИ",
+    разные поля и границы диапазонов - через "И"
+    """
+    stage: Optional[List[str]] = Field(None, min_length=1)
+    working_status: Optional[List[str]] = Field(None, min_length=1)
+    area_category: Optional[List[str]] = Field(None, min_length=1)
+    search_channel: Optional[List[str]] = Field(None, min_length=1)
+    area_square_from: Optional[float] = None
+    area_square_to: Optional[float] = None
+    cadastral_cost_from: Optional[float] = None
+    cadastral_cost_to: Optional[float] = None
+    entered_from: Optional[datetime] = None
+    entered_to: Optional[datetime] = None
+
+    @field_validator(
+        'area_square_from', 'area_square_to',
+        'cadastral_cost_from', 'cadastral_cost_to'
+    )
+    @classmethod
+    def validate_to_positive(cls, field: Optional[float]) -> float | None:
+        if field is not None and field < 0:
+            raise ValueError('Range bounds must be gte 0')
+        return field
+
+    @field_validator('entered_from', 'entered_to')
+    @classmethod
+    def validate_to_naive_local(
+            cls, field: Optional[datetime]) -> datetime | None:
+        """
+        entered_at_base хранится без часового пояса в локальном времени
+        сервера (default=datetime.now): границы с часовым поясом
+        переводятся в локальное время и сравниваются без него
+        """
+        if field is None or field.tzinfo is None:
+            return field
+        return field.astimezone().replace(tzinfo=None)
+
+    @model_validator(mode='after')
+    def validate_ranges(self) -> 'LandAreaFilterParams':
+        ranges: List[Tuple[str, str]] = [
+            ('area_square_from', 'area_square_to'),
+            ('cadastral_cost_from', 'cadastral_cost_to'),
+            ('entered_from', 'entered_to')
+        ]
+        for lower_name, upper_name in ranges:
+            lower, upper = getattr(self, lower_name), getattr(self, upper_name)
+            if lower is not None and upper is not None and lower > upper:
+                raise ValueError(
+                    f'"{lower_name}" must be lte "{upper_name}"')
+        return self
+
+
+class KeysetCursor(BaseModel):
+    """Позиция в ленте: последняя полученная запись"""
+    created_at: datetime
+    id: UUID
+
+
+class KeysetParams(BaseModel):
+    """
+    Пагинация ленты от новых записей к старым. Первая страница - без
+    after, следующие - с next_cursor из предыдущего ответа
+    """
+    limit: int = 20
+    after: Optional[KeysetCursor] = None
+
+    @field_validator('limit')
+    @classmethod
+    def validate_limit(cls, field: int) -> int:
+        if not 1 <= field <= 100:
+            raise ValueError('Field "limit" must be between 1 and 100')
+        return field
@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import Optional, List
+from typing import Literal, Optional, List, Tuple
 from uuid import UUID
 
 from pydantic import BaseModel, field_validator, Field
@@ -13,9 +13,24 @@ __all__ = [
     'TaskListResponseDTO',
     'SchedulerTaskResponseDTO',
     'TaskResponseDTO',
-    'TaskEditRequestDTO'
+    'TaskEditRequestDTO',
+    'TaskRelation',
+    'TASK_RELATIONS',
+    'TaskBulkCreateResultDTO',
+    'TaskStatusChangeResultDTO',
+    'DeadlineTaskResponseDTO',
+    'MAX_BULK_TASKS'
 ]
 
+# Ограничение на число задач в одном пакетном вызове
+MAX_BULK_TASKS: int = 1000
+
+# Отношения задачи, которые можно запросить в get_task_by_id
+TaskRelation = Literal['executor', 'author', 'land_area', 'task_comments']
+TASK_RELATIONS: Tuple[TaskRelation, ...] = (
+    'executor', 'author', 'land_area', 'task_comments'
+)
+
 from domain.task_comment.schema import TaskCommentRelatedRequestDTO
 
 
@@ -51,17 +66,39 @@ class TaskResponseDTO(TaskRequestDTO):
     id: UUID
     author_id: UUID
     status: str
+    version: int
 
 
 class TaskRelatedResponseDTO(TaskResponseDTO):
     """
-    Схема для вывода полной информации по задаче с отношениями
+    Схема для вывода полной информации по задаче с отношениями.
+    Незапрошенные отношения остаются None
     """
-    executor: 'ShortEmployeeResponseDTO'
-    author: 'ShortEmployeeResponseDTO'
-    land_area: 'ShortLandAreaResponseDTO'
+    executor: Optional['ShortEmployeeResponseDTO'] = None
+    author: Optional['ShortEmployeeResponseDTO'] = None
+    land_area: Optional['ShortLandAreaResponseDTO'] = None
+
+    task_comments: Optional[List['TaskCommentRelatedRequestDTO']] = None
+    # Заполняется, если запрошены только последние комментарии
+    task_comments_total: Optional[int] = None
+
+
+class TaskBulkCreateResultDTO(BaseModel):
+    """
+    Результат создания одной задачи из пакета: задача либо ошибка
+    """
+    index: int
+    task: Optional[TaskResponseDTO] = None
+    error: Optional[str] = None
 
-    task_comments: List['TaskCommentRelatedRequestDTO']
+
+class TaskStatusChangeResultDTO(BaseModel):
+    """
+    Результат смены статуса одной задачи из пакета: задача либо ошибка
+    """
+    task_id: UUID
+    task: Optional[TaskResponseDTO] = None
+    error: Optional[str] = None
 
 
 class SchedulerTaskResponseDTO(TaskResponseDTO):
@@ -71,6 +108,14 @@ class SchedulerTaskResponseDTO(TaskResponseDTO):
     land_area: 'ShortLandAreaResponseDTO'
 
 
+class DeadlineTaskResponseDTO(TaskResponseDTO):
+    """
+    Схема для вывода просроченной или близкой к сроку задачи
+    """
+    executor: 'ShortEmployeeResponseDTO'
+    land_area: 'ShortLandAreaResponseDTO'
+
+
 class TaskListResponseDTO(TaskResponseDTO):
     """
     Схема для вывода информации по задаче в списке задач земельного участка
@@ -1,9 +1,11 @@
 from datetime import datetime
+from typing import List, Optional
 from uuid import UUID
 
 from pydantic import BaseModel, field_validator
 
 from domain.employee import ShortEmployeeResponseDTO
+from domain.request_params.schema import KeysetCursor
 
 
 class TaskCommentRequestDTO(BaseModel):
@@ -26,3 +28,8 @@ class TaskCommentResponseDTO(TaskCommentRequestDTO):
 
 class TaskCommentRelatedRequestDTO(TaskCommentResponseDTO):
     employee: 'ShortEmployeeResponseDTO'
+
+
+class TaskCommentPageResponseDTO(BaseModel):
+    items: List['TaskCommentRelatedRequestDTO']
+    next_cursor: Optional['KeysetCursor'] = None
@@ -0,0 +1 @@
+from .construct import construct_trusted
@@ -0,0 +1,153 @@
+import types
+from collections.abc import Mapping
+from typing import (
+    Any,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    cast,
+    get_args,
+    get_origin
+)
+
+from pydantic import BaseModel, TypeAdapter
+
+__all__ = [
+    'construct_trusted'
+]
+
+M = TypeVar('M', bound=BaseModel)
+
+_MISSING = object()
+_NO_ATTRIBUTES: Dict[str, Any] = {}
+_UNION_TYPES = (Union, types.UnionType)
+_LIST_TYPES = (list, List)
+_object_setattr = object.__setattr__
+
+
+def _is_model(annotation: Any) -> bool:
+    return isinstance(annotation, type) and issubclass(annotation, BaseModel)
+
+
+def _nested_model(annotation: Any) -> Optional[Tuple[bool, Type[BaseModel]]]:
+    """
+    Распознает Model, List[Model] и их Optional варианты
+    :return: (это список, схема) или None
+    """
+    origin = get_origin(annotation)
+    args = get_args(annotation)
+    if origin in _UNION_TYPES:
+        args = tuple(arg for arg in args if arg is not type(None))
+        return _nested_model(args[0]) if len(args) == 1 else None
+    if origin in _LIST_TYPES:
+        return (True, args[0]) if args and _is_model(args[0]) else None
+    return (False, annotation) if _is_model(annotation) else None
+
+
+def _mentions_model(annotation: Any) -> bool:
+    if _is_model(annotation):
+        return True
+    return any(_mentions_model(arg) for arg in get_args(annotation))
+
+
+class _Plan:
+    """
+    План заполнения схемы из доверенного объекта: какие поля копируются
+    как есть, а какие являются вложенными схемами
+    """
+    __slots__ = ('model', 'names', 'converters', 'is_plain')
+
+    def __init__(self, model: Type[BaseModel]):
+        if not model.__pydantic_complete__:
+            model.model_rebuild()
+        self.model: Type[BaseModel] = model
+        self.names: Tuple[str, ...] = tuple(model.model_fields)
+        self.converters: Dict[str, Any] = {}
+        for name, field in model.model_fields.items():
+            nested = _nested_model(field.annotation)
+            if nested is not None:
+                self.converters[name] = nested
+            elif _mentions_model(field.annotation):
+                # Сложные вложенные типы (Union схем и т.п.) валидируются
+                self.converters[name] = TypeAdapter(field.annotation)
+        # Экземпляр можно собрать напрямую, если схеме не нужны
+        # model_post_init, extra поля и RootModel
+        self.is_plain: bool = not (
+            model.__pydantic_root_model__
+            or model.__pydantic_post_init__
+            or model.model_config.get('extra') == 'allow'
+        )
+
+    def read(self, obj: Any) -> Dict[str, Any]:
+        # Загруженные атрибуты ORM объекта лежат в его __dict__: чтение
+        # оттуда минует дескрипторы SQLAlchemy. Незагруженные (и свойства)
+        # читаются обычным getattr
+        source = obj if isinstance(obj, Mapping) else getattr(
+            obj, '__dict__', _NO_ATTRIBUTES)
+        try:
+            values = {name: source[name] for name in self.names}
+        except KeyError:
+            values = self.read_partial(obj)
+        for name, converter in self.converters.items():
+            value = values.get(name)
+            if value is None:
+                continue
+            if isinstance(converter, TypeAdapter):
+                values[name] = converter.validate_python(
+                    value, from_attributes=True)
+            elif converter[0]:
+                values[name] = [
+                    construct_trusted(converter[1], item) for item in value
+                ]
+            else:
+                values[name] = construct_trusted(converter[1], value)
+        return values
+
+    def read_partial(self, obj: Any) -> Dict[str, Any]:
+        """Чтение, когда в источнике есть не все поля схемы"""
+        values: Dict[str, Any] = {}
+        for name in self.names:
+            if isinstance(obj, Mapping):
+                value = obj.get(name, _MISSING)
+            else:
+                value = getattr(obj, name, _MISSING)
+            if value is not _MISSING:
+                values[name] = value
+            elif self.model.model_fields[name].is_required():
+                raise ValueError(
+                    f'{self.model.__name__}.{name} is missing in {obj!r}')
+        return values
+
+    def build(self, values: Dict[str, Any]) -> BaseModel:
+        if not self.is_plain or len(values) != len(self.names):
+            return self.model.model_construct(**values)
+        # То же, что делает model_construct, без повторного обхода полей
+        instance = self.model.__new__(self.model)
+        _object_setattr(instance, '__dict__', values)
+        _object_setattr(instance, '__pydantic_fields_set__', set(values))
+        _object_setattr(instance, '__pydantic_extra__', None)
+        _object_setattr(instance, '__pydantic_private__', None)
+        return instance
+
+
+_PLANS: Dict[Type[BaseModel], _Plan] = {}
+
+
+def construct_trusted(model: Type[M], obj: Any) -> M:
+    """
+    Создает схему ответа из доверенного источника (ORM объект или строка
+    из БД) без валидации: валидаторы схем проверяют пользовательский ввод,
+    а данные из БД уже им соответствуют. Вложенные схемы создаются так же.
+    План заполнения полей строится один раз на класс
+    :param model: Класс схемы
+    :param obj: ORM объект или Mapping
+    :return: Экземпляр схемы
+    """
+    plan: Optional[_Plan] = _PLANS.get(model)
+    if plan is None:
+        plan = _PLANS[model] = _Plan(model)
+    return cast(M, plan.build(plan.read(obj)))
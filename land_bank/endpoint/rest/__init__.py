@@ -1 +1 @@
-from endpoint.rest import employee
+from endpoint.rest import employee, land_area, metrics
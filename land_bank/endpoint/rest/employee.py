@@ -3,7 +3,7 @@ from datetime import datetime, timedelta
 from fastapi import APIRouter, Depends, File, UploadFile, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from application.auth.dependency import AuthenticationDependency
+from application.auth.dependency import authentication
 from application.file.file_validator import FileValidator
 from domain.employee.schema import ProfilePhotoResponseDTO
 from infrastructure.aws.s3_storage import S3Storage
@@ -22,7 +22,7 @@ employee_repository: EmployeeRepository = EmployeeRepository()
 @router.post('/set_profile_avatar')
 @in_transaction
 async def set_employee_photo(
-        employee: Employee = Depends(AuthenticationDependency()),
+        employee: Employee = Depends(authentication),
         file: UploadFile = File(...),  # type(file) -> UploadFile,
 ) -> ProfilePhotoResponseDTO:
     """
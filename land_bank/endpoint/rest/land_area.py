@@ -0,0 +1,93 @@
+from typing import Optional
+
+from celery.result import AsyncResult
+from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile
+from fastapi.responses import StreamingResponse
+
+from application.auth.dependency import authentication
+from application.land_area_export import (
+    EXPORT_MEDIA_TYPES,
+    ExportFormat,
+    export_land_areas
+)
+from application.land_area_import import is_supported_file
+from domain.land_area_import.schema import (
+    ImportReportDTO,
+    ImportStartedResponseDTO,
+    ImportStatusResponseDTO
+)
+from domain.request_params.schema import LandAreaFilterParams
+from infrastructure.aws.s3_storage import S3Storage
+from infrastructure.celery import celery_client, import_land_areas
+from infrastructure.database.model import Employee
+
+router = APIRouter(prefix='/rest/api/v1/areas', tags=['AREAS REST'])
+
+s3_service: S3Storage = S3Storage()
+
+
+@router.post('/import')
+async def upload_land_areas_import(
+        employee: Employee = Depends(authentication),
+        file: UploadFile = File(...),
+) -> ImportStartedResponseDTO:
+    """
+    <b>REST - запрос</b>
+    Запускает фоновый импорт участков из CSV выгрузки реестра.
+    Колонки - поля участка (name, cadastral_number, area_category,
+    cadastral_cost, area_square, address, search_channel, working_status,
+    stage) и, опционально, собственника с префиксом "owner_"
+    (owner_name, owner_email, owner_phone_number, owner_location).
+    Участки с существующим кадастровым номером обновляются.
+    Ход импорта - GET /import/{task_id}
+    """
+    if not is_supported_file(file.filename):
+        raise HTTPException(
+            status_code=400, detail='Only CSV files are supported')
+    file_name = await s3_service.upload_file(file)
+    task: AsyncResult = import_land_areas.delay(file_name)
+    return ImportStartedResponseDTO(task_id=task.id)
+
+
+@router.get('/import/{task_id}')
+def get_land_areas_import(
+        task_id: str,
+        employee: Employee = Depends(authentication),
+) -> ImportStatusResponseDTO:
+    """
+    <b>REST - запрос</b>
+    Состояние импорта: PENDING, PROGRESS (report без ошибок строк),
+    SUCCESS (полный report) или FAILURE (error)
+    """
+    result: AsyncResult = AsyncResult(task_id, app=celery_client)
+    state: str = result.state
+    if state == 'FAILURE':
+        return ImportStatusResponseDTO(
+            task_id=task_id, state=state, error=str(result.info))
+    report = ImportReportDTO.model_validate(result.info) \
+        if isinstance(result.info, dict) else None
+    return ImportStatusResponseDTO(
+        task_id=task_id, state=state, report=report)
+
+
+@router.post('/export')
+async def export_land_areas_file(
+        export_format: ExportFormat = Query('ndjson', alias='format'),
+        filter_params: Optional[LandAreaFilterParams] = None,
+        employee: Employee = Depends(authentication),
+) -> StreamingResponse:
+    """
+    <b>REST - запрос</b>
+    Потоковая выгрузка участков с собственниками, строениями,
+    ограничениями и видами разрешенного пользования.
+    format=ndjson - один JSON объект на строку, format=csv - плоская
+    таблица. Тело запроса - необязательные фильтры, как в select_land_area
+    """
+    return StreamingResponse(
+        export_land_areas(export_format, filter_params),
+        media_type=EXPORT_MEDIA_TYPES[export_format],
+        headers={
+            'Content-Disposition':
+                f'attachment; filename="land_areas.{export_format}"'
+        }
+    )
@@ -0,0 +1,19 @@
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from infrastructure.metrics import registry
+
+router = APIRouter(tags=['METRICS'])
+
+
+@router.get('/metrics', response_class=PlainTextResponse)
+async def get_metrics() -> PlainTextResponse:
+    """
+    <b>REST - запрос</b>
+    Метрики воркера в текстовом формате Prometheus: количество, коды ошибок
+    и время выполнения каждого JSON-RPC метода, статистика SQL запросов
+    """
+    return PlainTextResponse(
+        registry.render(),
+        media_type='text/plain; version=0.0.4'
+    )
@@ -5,5 +5,8 @@ from endpoint.rpc import (
     auth,
     employee,
     juristic_data,
-    extra_data
+    extra_data,
+    batch,
+    dashboard,
+    change_feed
 )
@@ -1,27 +1,56 @@
 from uuid import UUID
 
 from fastapi import Depends
-from fastapi_jsonrpc import Entrypoint
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from application.auth.dependency import AuthenticationDependency
+from application.auth.dependency import authentication
 from domain.area_comment import (
+    AreaCommentPageResponseDTO,
     AreaCommentRequestDTO,
     AreaCommentRelatedResponseDTO
 )
+from domain.request_params.schema import KeysetCursor, KeysetParams
+from domain.trusted import construct_trusted
 from infrastructure.database.model import AreaComment, Employee
 from infrastructure.database.session import ASYNC_CONTEXT_SESSION
-from infrastructure.database.transaction import in_transaction
+from infrastructure.database.transaction import (
+    in_read_only_transaction,
+    in_transaction
+)
 from infrastructure.exception import rpc_exceptions
+from infrastructure.rpc import BatchEntrypoint
 from storage.area_comment import AreaCommentRepository
 
-router = Entrypoint(
+router = BatchEntrypoint(
     path='/api/v1/area_comment',
-    tags=['AREA COMMENT']
+    tags=['AREA COMMENT'],
+    dependencies=[Depends(authentication)]
 )
 area_comment_repository = AreaCommentRepository()
 
 
+@router.method(
+    errors=[rpc_exceptions.AuthenticationError]
+)
+@in_read_only_transaction
+async def get_area_comments(
+        land_area_id: UUID,
+        page: KeysetParams,
+) -> AreaCommentPageResponseDTO:
+    session: AsyncSession = ASYNC_CONTEXT_SESSION.get()
+    comments, has_next = await area_comment_repository.get_comment_page(
+        session, land_area_id, page.limit, page.after)
+    return AreaCommentPageResponseDTO(
+        items=[
+            construct_trusted(AreaCommentRelatedResponseDTO, comment)
+            for comment in comments
+        ],
+        next_cursor=KeysetCursor(
+            created_at=comments[-1].created_at, id=comments[-1].id
+        ) if has_next else None
+    )
+
+
 @router.method(
     errors=[
         rpc_exceptions.AuthenticationError,
@@ -31,16 +60,13 @@ area_comment_repository = AreaCommentRepository()
 @in_transaction
 async def upload_area_comment(
         comment: AreaCommentRequestDTO,
-        employee: Employee = Depends(AuthenticationDependency()),
+        employee: Employee = Depends(authentication),
 ) -> AreaCommentRelatedResponseDTO:
     session: AsyncSession = ASYNC_CONTEXT_SESSION.get()
     area_comment: AreaComment = await area_comment_repository.create_comment(
         session, employee_id=employee.id, **comment.model_dump()
     )
-    return AreaCommentRelatedResponseDTO.model_validate(
-        area_comment,
-        from_attributes=True
-    )
+    return construct_trusted(AreaCommentRelatedResponseDTO, area_comment)
 
 
 @router.method(
@@ -53,7 +79,7 @@ async def upload_area_comment(
 async def edit_area_comment(
         comment_id: UUID,
         comment_text: str,
-        employee: Employee = Depends(AuthenticationDependency()),
+        employee: Employee = Depends(authentication),
 ) -> AreaCommentRelatedResponseDTO:
     session: AsyncSession = ASYNC_CONTEXT_SESSION.get()
     comment: AreaComment = await area_comment_repository.get_comment(
@@ -65,10 +91,7 @@ async def edit_area_comment(
     area_comment = await area_comment_repository.edit_comment(
         session, comment.id, comment_text=comment_text
     )
-    return AreaCommentRelatedResponseDTO.model_validate(
-        area_comment,
-        from_attributes=True
-    )
+    return construct_trusted(AreaCommentRelatedResponseDTO, area_comment)
 
 
 @router.method(
@@ -80,7 +103,7 @@ async def edit_area_comment(
 @in_transaction
 async def delete_area_comment(
         comment_id: UUID,
-        employee: Employee = Depends(AuthenticationDependency()),
+        employee: Employee = Depends(authentication),
 ) -> None:
     session: AsyncSession = ASYNC_CONTEXT_SESSION.get()
     comment: AreaComment = await area_comment_repository.get_comment(
@@ -9,7 +9,7 @@ from application.auth import (
     Hasher,
     TokenService,
     RefreshSession,
-    AuthenticationDependency
+    authentication
 )
 from application.message import PasswordResetMessage
 from domain.email_message.schemas import (
@@ -19,6 +19,7 @@ from domain.employee.schema import (
     EmployeeCreateSchema, EmployeeReadSchema, EmployeeLoginSchema,
 )
 from domain.token import TokenResponseSchema
+from domain.trusted import construct_trusted
 from infrastructure.celery import send_message
 from infrastructure.database.model import Employee
 from infrastructure.database.session import ASYNC_CONTEXT_SESSION
@@ -40,7 +41,7 @@ async def register_user(
     session: AsyncSession = ASYNC_CONTEXT_SESSION.get()
     employee: Employee = await employee_repository.create_user(
         session, **user.model_dump())
-    return EmployeeReadSchema.model_validate(employee, from_attributes=True)
+    return construct_trusted(EmployeeReadSchema, employee)
 
 
 @router.method(errors=[rpc_exceptions.LoginError])
@@ -109,7 +110,7 @@ async def logout(
         response: Response,
         user_agent: Annotated[str, Header()],
         refresh_token: Annotated[str, Cookie()],
-        user: Employee = Depends(AuthenticationDependency()),
+        user: Employee = Depends(authentication),
 ) -> TokenResponseSchema:
     session: Optional[RefreshSession] = await redis_service.get_by_key(
         # type: ignore
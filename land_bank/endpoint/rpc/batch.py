@@ -0,0 +1,27 @@
+from fastapi import Depends
+
+from application.auth.dependency import authentication
+from endpoint.rpc import juristic_data, land_area, scheduler
+from infrastructure.exception import rpc_exceptions
+from infrastructure.rpc import BatchEntrypoint
+
+# Карточка земельного участка загружается одним пакетным запросом:
+# аутентификация выполняется один раз, методы - параллельно
+router = BatchEntrypoint(
+    path='/api/v1/batch',
+    tags=['BATCH'],
+    dependencies=[Depends(authentication)]
+)
+
+for method in (
+        land_area.get_land_area,
+        juristic_data.get_area_juristic_data,
+        scheduler.get_area_tasks,
+):
+    router.add_method_route(
+        method,
+        errors=[
+            rpc_exceptions.AuthenticationError,
+            rpc_exceptions.ObjectNotFoundError
+        ]
+    )
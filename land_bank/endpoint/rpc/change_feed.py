@@ -0,0 +1,86 @@
+from datetime import timedelta
+from typing import Optional, cast
+
+from fastapi import Body, Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from application.auth.dependency import authentication
+from domain.change_feed.schema import (
+    ChangeCursor,
+    ChangeEntity,
+    ChangePosition,
+    ChangesResponseDTO,
+    DeletedRecordDTO,
+    LandAreaChangeDTO,
+    TaskChangeDTO
+)
+from domain.trusted import construct_trusted
+from infrastructure.database.session import ASYNC_CONTEXT_SESSION
+from infrastructure.database.transaction import in_read_only_transaction
+from infrastructure.exception import rpc_exceptions
+from infrastructure.rpc import BatchEntrypoint
+from infrastructure.settings import AppSettings
+from storage.change_feed import ChangeFeedRepository
+
+router = BatchEntrypoint(
+    path='/api/v1/changes',
+    tags=['CHANGES'],
+    dependencies=[Depends(authentication)]
+)
+change_feed_repository: ChangeFeedRepository = ChangeFeedRepository()
+
+
+@router.method(
+    errors=[rpc_exceptions.AuthenticationError]
+)
+@in_read_only_transaction
+async def get_changes_since(
+        cursor: Optional[ChangeCursor] = Body(
+            None, description='next_cursor из предыдущего ответа'),
+        limit: int = Body(500, ge=1, le=1000)
+) -> ChangesResponseDTO:
+    """
+    Изменения участков и задач после курсора: измененные записи целиком
+    и удаления. Без курсора лента читается с начала, это первичная
+    загрузка. Удаления применяются после измененных записей
+    """
+    session: AsyncSession = ASYNC_CONTEXT_SESSION.get()
+    cursor = cursor or ChangeCursor()
+    lag: timedelta = timedelta(seconds=AppSettings.CHANGE_FEED_LAG_SECONDS)
+    land_areas, more_land_areas = (
+        await change_feed_repository.get_land_areas_changed(
+            session, cursor.land_areas, lag, limit))
+    tasks, more_tasks = await change_feed_repository.get_tasks_changed(
+        session, cursor.tasks, lag, limit)
+    deleted, more_deleted = await change_feed_repository.get_deleted(
+        session, cursor.deleted, lag, limit)
+    next_cursor = ChangeCursor(
+        land_areas=ChangePosition(
+            changed_at=land_areas[-1].updated_at, id=land_areas[-1].id
+        ) if land_areas else cursor.land_areas,
+        tasks=ChangePosition(
+            changed_at=tasks[-1].updated_at, id=tasks[-1].id
+        ) if tasks else cursor.tasks,
+        deleted=ChangePosition(
+            changed_at=deleted[-1].deleted_at, id=deleted[-1].id
+        ) if deleted else cursor.deleted
+    )
+    return ChangesResponseDTO(
+        land_areas=[
+            construct_trusted(LandAreaChangeDTO, vars(land_area))
+            for land_area in land_areas
+        ],
+        tasks=[
+            construct_trusted(TaskChangeDTO, vars(task)) for task in tasks
+        ],
+        deleted=[
+            DeletedRecordDTO(
+                entity=cast(ChangeEntity, record.entity),
+                id=record.entity_id,
+                deleted_at=record.deleted_at
+            )
+            for record in deleted
+        ],
+        next_cursor=next_cursor,
+        has_more=more_land_areas or more_tasks or more_deleted
+    )
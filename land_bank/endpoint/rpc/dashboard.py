@@ -0,0 +1,53 @@
+from datetime import datetime
+from typing import List, Optional, Sequence, Union
+
+from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from application.auth.dependency import authentication
+from domain.dashboard.schema import (
+    DashboardResponseDTO,
+    LandAreaRollupDTO,
+    TaskRollupDTO
+)
+from domain.trusted import construct_trusted
+from infrastructure.database.model import LandAreaRollup, TaskRollup
+from infrastructure.database.session import ASYNC_CONTEXT_SESSION
+from infrastructure.database.transaction import in_read_only_transaction
+from infrastructure.exception import rpc_exceptions
+from infrastructure.rpc import BatchEntrypoint
+from storage.dashboard import DashboardRepository
+
+router = BatchEntrypoint(
+    path='/api/v1/dashboard',
+    tags=['DASHBOARD'],
+    dependencies=[Depends(authentication)]
+)
+dashboard_repository: DashboardRepository = DashboardRepository()
+
+
+@router.method(
+    errors=[rpc_exceptions.AuthenticationError]
+)
+@in_read_only_transaction
+async def get_dashboard() -> DashboardResponseDTO:
+    session: AsyncSession = ASYNC_CONTEXT_SESSION.get()
+    land_areas: Sequence[
+        LandAreaRollup] = await dashboard_repository.get_land_area_rollups(
+        session)
+    tasks: Sequence[TaskRollup] = await dashboard_repository.get_task_rollups(
+        session)
+    rollups: List[Union[LandAreaRollup, TaskRollup]] = [*land_areas, *tasks]
+    refreshed_at: Optional[datetime] = max(
+        (rollup.refreshed_at for rollup in rollups), default=None)
+    land_area_rollups: List[LandAreaRollupDTO] = [
+        construct_trusted(LandAreaRollupDTO, rollup) for rollup in land_areas
+    ]
+    task_rollups: List[TaskRollupDTO] = [
+        construct_trusted(TaskRollupDTO, rollup) for rollup in tasks
+    ]
+    return DashboardResponseDTO(
+        refreshed_at=refreshed_at,
+        land_areas=land_area_rollups,
+        tasks=task_rollups
+    )
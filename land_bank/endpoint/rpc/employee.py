@@ -3,24 +3,31 @@ from typing import Optional
 from uuid import UUID
 
 from fastapi import Depends
-from fastapi_jsonrpc import Entrypoint
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from application.auth.dependency import AuthenticationDependency
+from application.auth.dependency import authentication
 from domain.employee.schema import (
     EmployeeReadSchema,
     EmployeeRelatedResponse,
     ProfilePhotoResponseDTO,
     EditProfileDTO
 )
+from domain.trusted import construct_trusted
 from infrastructure.aws.s3_storage import S3Storage
 from infrastructure.database.model import Employee
 from infrastructure.database.session import ASYNC_CONTEXT_SESSION
-from infrastructure.database.transaction import in_transaction
+from infrastructure.database.transaction import (
+    in_read_only_transaction,
+    in_transaction
+)
 from infrastructure.exception import rpc_exceptions
+from infrastructure.rpc import BatchEntrypoint
 from storage.employee import EmployeeRepository
 
-router = Entrypoint(path='/api/v1/employee', tags=['USER RPC'])
+router = BatchEntrypoint(
+    path='/api/v1/employee', tags=['USER RPC'],
+    dependencies=[Depends(authentication)]
+)
 s3 = S3Storage()
 employee_repository: EmployeeRepository = EmployeeRepository()
 
@@ -28,9 +35,9 @@ employee_repository: EmployeeRepository = EmployeeRepository()
 @router.method(
     errors=[rpc_exceptions.AuthenticationError],
 )
-@in_transaction
+@in_read_only_transaction
 async def get_profile(
-        employee: Employee = Depends(AuthenticationDependency()),
+        employee: Employee = Depends(authentication),
 ) -> EmployeeRelatedResponse:
     """Профиль текущего пользователя"""
     session: AsyncSession = ASYNC_CONTEXT_SESSION.get()
@@ -38,15 +45,13 @@ async def get_profile(
         Employee] = await employee_repository.employee_profile(
         session, employee.id
     )
-    return EmployeeRelatedResponse.model_validate(
-        profile_data, from_attributes=True)
+    return construct_trusted(EmployeeRelatedResponse, profile_data)
 
 
 @router.method(
-    errors=[rpc_exceptions.AuthenticationError],
-    dependencies=[Depends(AuthenticationDependency())]
+    errors=[rpc_exceptions.AuthenticationError]
 )
-@in_transaction
+@in_read_only_transaction
 async def get_employee_profile_by_id(
         employee_id: UUID,
 ) -> EmployeeRelatedResponse:
@@ -56,16 +61,13 @@ async def get_employee_profile_by_id(
         session, employee_id)
     if not employee:
         raise rpc_exceptions.ObjectNotFoundError(data='No employee by this ID')
-    return EmployeeRelatedResponse.model_validate(
-        employee, from_attributes=True
-    )
+    return construct_trusted(EmployeeRelatedResponse, employee)
 
 
 @router.method(
-    errors=[rpc_exceptions.AuthenticationError],
-    dependencies=[Depends(AuthenticationDependency())]
+    errors=[rpc_exceptions.AuthenticationError]
 )
-@in_transaction
+@in_read_only_transaction
 async def get_employee_profile_photo(
         employee_id: UUID,
 ) -> ProfilePhotoResponseDTO:
@@ -96,7 +98,7 @@ async def get_employee_profile_photo(
 @in_transaction
 async def update_profile_info(
         edited_info: EditProfileDTO,
-        employee: Employee = Depends(AuthenticationDependency()),
+        employee: Employee = Depends(authentication),
 ) -> EmployeeReadSchema:
     session: AsyncSession = ASYNC_CONTEXT_SESSION.get()
     edited_employee: Employee = await employee_repository.update_employee(
@@ -104,5 +106,4 @@ async def update_profile_info(
         Employee.id == employee.id,
         **edited_info.model_dump()
     )
-    return EmployeeReadSchema.model_validate(
-        edited_employee, from_attributes=True)
+    return construct_trusted(EmployeeReadSchema, edited_employee)
@@ -2,22 +2,26 @@ from typing import Optional
 from uuid import UUID
 
 from fastapi import Depends
-from fastapi_jsonrpc import Entrypoint
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from application.auth.dependency import AuthenticationDependency
+from application.auth.dependency import authentication
 from domain.extra_data.schemas import (
     ExtraDataResponseSchema,
     ExtraDataRequestSchema,
     ExtraDataEditSchema
 )
+from domain.trusted import construct_trusted
 from infrastructure.database.model import ExtraAreaData
 from infrastructure.database.session import ASYNC_CONTEXT_SESSION
 from infrastructure.database.transaction import in_transaction
 from infrastructure.exception import rpc_exceptions
+from infrastructure.rpc import BatchEntrypoint
 from storage.extra_data import ExtraDataRepository
 
-router = Entrypoint('/api/v1/extra_data', tags=['EXTRA DATA'])
+router = BatchEntrypoint(
+    '/api/v1/extra_data', tags=['EXTRA DATA'],
+    dependencies=[Depends(authentication)]
+)
 extra_data_repository: ExtraDataRepository = ExtraDataRepository()
 
 
@@ -25,8 +29,7 @@ extra_data_repository: ExtraDataRepository = ExtraDataRepository()
 @router.method(
     errors=[
         rpc_exceptions.TransactionError,
-        rpc_exceptions.AuthenticationError],
-    dependencies=[Depends(AuthenticationDependency())]
+        rpc_exceptions.AuthenticationError]
 )
 @in_transaction
 async def create_extra_data(
@@ -36,15 +39,14 @@ async def create_extra_data(
     created_data: ExtraAreaData = await extra_data_repository.create_data(
         session, **data.model_dump()
     )
-    return ExtraDataResponseSchema.model_validate(created_data,
-                                                  from_attributes=True)
+    return construct_trusted(ExtraDataResponseSchema, created_data)
 
 
 @router.method(
     errors=[
         rpc_exceptions.TransactionError,
-        rpc_exceptions.AuthenticationError],
-    dependencies=[Depends(AuthenticationDependency())]
+        rpc_exceptions.AuthenticationError,
+        rpc_exceptions.ObjectNotFoundError]
 )
 @in_transaction
 async def edit_extra_data(
@@ -52,35 +54,31 @@ async def edit_extra_data(
         data: ExtraDataEditSchema,
 ) -> ExtraDataResponseSchema:
     session: AsyncSession = ASYNC_CONTEXT_SESSION.get()
-    data_orm: Optional[ExtraAreaData] = await extra_data_repository.get_data(
-        session, ExtraAreaData.id == extra_data_id)
-    if not data_orm:
-        raise rpc_exceptions.ObjectNotFoundError(
-            data='Area extra data does not exists')
-    updated_data: ExtraAreaData = await extra_data_repository.update_data(
+    updated_data: Optional[
+        ExtraAreaData] = await extra_data_repository.update_data(
         session, ExtraAreaData.id == extra_data_id, **data.model_dump()
     )
-    return ExtraDataResponseSchema.model_validate(updated_data,
-                                                  from_attributes=True)
+    if not updated_data:
+        raise rpc_exceptions.ObjectNotFoundError(
+            data='Area extra data does not exists')
+    return construct_trusted(ExtraDataResponseSchema, updated_data)
 
 
 @router.method(
     errors=[
         rpc_exceptions.TransactionError,
-        rpc_exceptions.AuthenticationError
-    ],
-    dependencies=[Depends(AuthenticationDependency())]
+        rpc_exceptions.AuthenticationError,
+        rpc_exceptions.ObjectNotFoundError
+    ]
 )
 @in_transaction
 async def delete_extra_data(
         extra_data_id: UUID
 ) -> None:
     session: AsyncSession = ASYNC_CONTEXT_SESSION.get()
-    data: Optional[ExtraAreaData] = await extra_data_repository.get_data(
-        session, ExtraAreaData.id == extra_data_id)
-    if not data:
+    if not await extra_data_repository.delete_data(
+            session, ExtraAreaData.id == extra_data_id):
         raise rpc_exceptions.ObjectNotFoundError(
             data='Area extra data does not exists'
         )
-    await extra_data_repository.delete_data(session, data)
     return None
@@ -1,75 +1,92 @@
-from typing import List, Optional
+from typing import Dict, List, Optional
 from uuid import UUID
 
 from fastapi import Depends
-from fastapi_jsonrpc import Entrypoint
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
-from application.auth.dependency import AuthenticationDependency
+from application.auth.dependency import authentication
+from application.cache import juristic_options_cache
 from domain.juristic_data.schemas import (
     LimitSchema,
     PermittedUseSchema,
-    JuristicDataResponseDTO
-)
-from infrastructure.database.model import (
-    LandArea,
-    LandAreaLimit,
-    LandAreaPermittedUse
+    JuristicDataResponseDTO,
+    JuristicOptionsResponseDTO
 )
+from domain.trusted import construct_trusted
+from infrastructure.database.model import LandArea
 from infrastructure.database.session import ASYNC_CONTEXT_SESSION
-from infrastructure.database.transaction import in_transaction
+from infrastructure.database.transaction import (
+    in_read_only_transaction,
+    in_transaction
+)
 from infrastructure.exception import rpc_exceptions
+from infrastructure.rpc import BatchEntrypoint
 from storage.land_area import LandAreaRepository
 from storage.limit import LimitRepository
 from storage.permitted_use import PermittedUseRepository
 
-router = Entrypoint('/api/v1/juristic_data', tags=['JURISTIC DATA'])
+router = BatchEntrypoint(
+    '/api/v1/juristic_data', tags=['JURISTIC DATA'],
+    dependencies=[Depends(authentication)]
+)
 land_area_repository: LandAreaRepository = LandAreaRepository()
 limit_repository: LimitRepository = LimitRepository()
 permitted_use_repository: PermittedUseRepository = PermittedUseRepository()
 
 
+def _selected_options(
+        selected: List[LimitSchema],
+        options: List[LimitSchema]
+) -> List[LimitSchema]:
+    """
+    Выбранные записи справочника без повторов, с названиями из справочника
+    """
+    options_by_id: Dict[UUID, LimitSchema] = {
+        option.id: option for option in options
+    }
+    unique: Dict[UUID, LimitSchema] = {
+        schema.id: schema for schema in selected
+    }
+    return [options_by_id.get(_id, schema) for _id, schema in unique.items()]
+
+
 @router.method(
-    errors=[rpc_exceptions.AuthenticationError],
-    dependencies=[Depends(AuthenticationDependency())]
+    errors=[rpc_exceptions.AuthenticationError]
 )
-@in_transaction
+@in_read_only_transaction
 async def get_area_juristic_data(
         land_area_id: UUID
 ) -> JuristicDataResponseDTO:
     session: AsyncSession = ASYNC_CONTEXT_SESSION.get()
     land_area: LandArea = await land_area_repository.get_area_with_limits_uses(
         session, land_area_id)
-    return JuristicDataResponseDTO.model_validate(
-        land_area, from_attributes=True
-    )
+    return construct_trusted(JuristicDataResponseDTO, land_area)
 
 
 @router.method(
-    errors=[rpc_exceptions.AuthenticationError],
-    dependencies=[Depends(AuthenticationDependency())]
+    errors=[rpc_exceptions.AuthenticationError]
 )
-@in_transaction
-async def get_juristic_options() -> JuristicDataResponseDTO:
-    session: AsyncSession = ASYNC_CONTEXT_SESSION.get()
-    limits = await limit_repository.select_all(session)
-    permitted_uses = await permitted_use_repository.select_all(session)
-    return JuristicDataResponseDTO(
-        limits=[
-            LimitSchema.model_validate(_limit, from_attributes=True)
-            for _limit in limits
-        ],
-        permitted_uses=[
-            PermittedUseSchema.model_validate(use, from_attributes=True)
-            for use in permitted_uses
-        ]
+async def get_juristic_options(
+        etag: Optional[str] = None
+) -> JuristicOptionsResponseDTO:
+    """
+    Справочники ограничений и разрешенного пользования из кэша.
+    Если передан etag последнего ответа и справочники не изменились,
+    возвращается not_modified=True без данных
+    """
+    options, current_etag = await juristic_options_cache.get()
+    if etag == current_etag:
+        return JuristicOptionsResponseDTO(
+            etag=current_etag, not_modified=True)
+    return JuristicOptionsResponseDTO(
+        etag=current_etag,
+        limits=options.limits,
+        permitted_uses=options.permitted_uses
     )
 
 
 @router.method(
-    errors=[rpc_exceptions.AuthenticationError],
-    dependencies=[Depends(AuthenticationDependency())]
+    errors=[rpc_exceptions.AuthenticationError]
 )
 @in_transaction
 async def update_area_juristic_data(
@@ -84,24 +101,13 @@ async def update_area_juristic_data(
     if not land_area:
         raise rpc_exceptions.ObjectNotFoundError(
             data="No land area by this ID")
-    await limit_repository.delete_from_association(
-        session, LandAreaLimit.land_area_id == land_area_id)
-    await permitted_use_repository.delete_from_association(
-        session, LandAreaPermittedUse.land_area_id == land_area_id
-    )
-    limit_associations = await limit_repository.create_associations(
-        session, land_area_id, limits)
-    uses_associations = await permitted_use_repository.create_associations(
+    await limit_repository.sync_associations(session, land_area_id, limits)
+    await permitted_use_repository.sync_associations(
         session, land_area_id, permitted_uses)
-    updated_land_area = await land_area_repository.get_land_area(
-        session,
-        filters=[
-            LandArea.id == land_area_id
-        ],
-        options=[
-            selectinload(LandArea.limits),
-            selectinload(LandArea.permitted_uses)
-        ]
+    # Названия берутся из кэша справочников, перечитывать участок не нужно
+    options, _ = await juristic_options_cache.get()
+    return JuristicDataResponseDTO(
+        limits=_selected_options(limits, options.limits),
+        permitted_uses=_selected_options(
+            permitted_uses, options.permitted_uses)
     )
-    return JuristicDataResponseDTO.model_validate(
-        updated_land_area, from_attributes=True)
@@ -1,57 +1,133 @@
-from typing import Iterable, List, Optional
+from typing import Dict, List, Optional, Sequence
 from uuid import UUID
 
-import fastapi_jsonrpc as jsonrpc
-from fastapi import Depends
+from fastapi import Body, Depends
+from sqlalchemy import RowMapping
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
-from application.auth.dependency import AuthenticationDependency
+from application.auth.dependency import authentication
+from application.cache import get_land_area_total
 from domain.land_area.schema import (
     LandAreaListResponseDTO,
+    LandAreaPageResponseDTO,
     LandAreaRequestDTO,
+    LandAreaSearchResponseDTO,
     OwnerRequestDTO,
     BuildingRequestDTO,
     LandAreaRelatedResponseDTO,
+    LandAreaResponseDTO,
     OwnerResponseDTO,
     BuildingResponseDTO,
+    PageTotalDTO,
+    LandAreaRelation,
+    LAND_AREA_RELATIONS
 )
-from domain.request_params.schema import SortParams, LimitOffset
+from domain.request_params.schema import (
+    LandAreaFilterParams,
+    LimitOffset,
+    SortParams
+)
+from domain.trusted import construct_trusted
 from infrastructure.database.model import Building, LandArea, LandOwner
 from infrastructure.database.session import ASYNC_CONTEXT_SESSION
-from infrastructure.database.transaction import in_transaction
+from infrastructure.database.transaction import (
+    in_read_only_transaction,
+    in_transaction
+)
 from infrastructure.exception import rpc_exceptions
+from infrastructure.repository.loading import eager_load
+from infrastructure.rpc import BatchEntrypoint
+from storage.area_comment import AreaCommentRepository
 from storage.building import BuildingRepository
 from storage.land_area import LandAreaRepository
 from storage.owner import OwnerRepository
 
-router = jsonrpc.Entrypoint(
+router = BatchEntrypoint(
     path='/api/v1/areas',
-    tags=['AREAS']
+    tags=['AREAS'],
+    dependencies=[Depends(authentication)]
 )
 owner_repository: OwnerRepository = OwnerRepository()
 building_repository: BuildingRepository = BuildingRepository()
 land_area_repository: LandAreaRepository = LandAreaRepository()
+area_comment_repository: AreaCommentRepository = AreaCommentRepository()
 
 
-@router.method(
-    errors=[rpc_exceptions.AuthenticationError],
-    dependencies=[
-        Depends(AuthenticationDependency())
+async def _select_land_area_items(
+        session: AsyncSession,
+        limit_offset: LimitOffset,
+        sort_params: Optional[SortParams],
+        filter_params: Optional[LandAreaFilterParams]
+) -> List[LandAreaListResponseDTO]:
+    land_areas: Sequence[
+        RowMapping] = await land_area_repository.get_ordered_land_rows(
+        session, limit_offset, sort_params, LandAreaListResponseDTO,
+        filter_params)
+    owners: Dict[
+        UUID, List[RowMapping]] = await owner_repository.get_area_owner_rows(
+        session, (land_area['id'] for land_area in land_areas),
+        OwnerResponseDTO)
+
+    return [
+        construct_trusted(
+            LandAreaListResponseDTO,
+            {**land_area, 'owners': owners[land_area['id']]})
+        for land_area in land_areas
     ]
+
+
+@router.method(
+    errors=[rpc_exceptions.AuthenticationError]
 )
-@in_transaction
+@in_read_only_transaction
 async def select_land_area(
         limit_offset: LimitOffset,
         sort_params: Optional[SortParams] = None,
+        filter_params: Optional[LandAreaFilterParams] = None,
 ) -> List[LandAreaListResponseDTO]:
     session: AsyncSession = ASYNC_CONTEXT_SESSION.get()
-    land_areas: Iterable[
-        LandArea] = await land_area_repository.get_ordered_lands(
-        session, limit_offset, sort_params)
+    return await _select_land_area_items(
+        session, limit_offset, sort_params, filter_params)
+
+
+@router.method(
+    errors=[rpc_exceptions.AuthenticationError]
+)
+@in_read_only_transaction
+async def select_land_area_page(
+        limit_offset: LimitOffset,
+        sort_params: Optional[SortParams] = None,
+        filter_params: Optional[LandAreaFilterParams] = None,
+) -> LandAreaPageResponseDTO:
+    session: AsyncSession = ASYNC_CONTEXT_SESSION.get()
+    items: List[LandAreaListResponseDTO] = await _select_land_area_items(
+        session, limit_offset, sort_params, filter_params)
+    total: PageTotalDTO = await get_land_area_total(session, filter_params)
+    return LandAreaPageResponseDTO(
+        items=items, total=total.total, is_estimate=total.is_estimate)
+
+
+@router.method(
+    errors=[rpc_exceptions.AuthenticationError]
+)
+@in_read_only_transaction
+async def search_land_areas(
+        query: str,
+        limit_offset: LimitOffset,
+) -> List[LandAreaSearchResponseDTO]:
+    session: AsyncSession = ASYNC_CONTEXT_SESSION.get()
+    land_areas: Sequence[
+        RowMapping] = await land_area_repository.search_land_rows(
+        session, query, limit_offset, LandAreaSearchResponseDTO)
+    owners: Dict[
+        UUID, List[RowMapping]] = await owner_repository.get_area_owner_rows(
+        session, (land_area['id'] for land_area in land_areas),
+        OwnerResponseDTO)
 
     return [
-        LandAreaListResponseDTO.model_validate(land_area, from_attributes=True)
+        construct_trusted(
+            LandAreaSearchResponseDTO,
+            {**land_area, 'owners': owners[land_area['id']]})
         for land_area in land_areas
     ]
 
@@ -60,34 +136,42 @@ async def select_land_area(
     errors=[
         rpc_exceptions.AuthenticationError,
         rpc_exceptions.ObjectNotFoundError
-    ],
-    dependencies=[
-        Depends(AuthenticationDependency())
     ]
 )
-@in_transaction
+@in_read_only_transaction
 async def get_land_area(
-        land_area_id: UUID
+        land_area_id: UUID,
+        comments_limit: Optional[int] = Body(
+            None, ge=0, le=100,
+            description='Only the newest comments and their total'),
+        include: Optional[List[LandAreaRelation]] = Body(
+            None, description='Relations to load, all by default; '
+                              'the rest are returned as null'),
 ) -> LandAreaRelatedResponseDTO:
     session: AsyncSession = ASYNC_CONTEXT_SESSION.get()
+    relations: Sequence[LandAreaRelation] = (
+        LAND_AREA_RELATIONS if include is None else include)
     land_area: Optional[
         LandArea] = await land_area_repository.get_land_area_relations(
-        session, land_area_id)
+        session, land_area_id, comments_limit, relations)
     if not land_area:
         raise rpc_exceptions.ObjectNotFoundError(
             data='No such land area by this id'
         )
 
-    return LandAreaRelatedResponseDTO.model_validate(
-        land_area,
-        from_attributes=True
-    )
+    # Только загруженные атрибуты: незапрошенные отношения остаются None
+    # и не подгружаются лениво
+    response = construct_trusted(LandAreaRelatedResponseDTO, vars(land_area))
+    if comments_limit is not None and 'comments' in relations:
+        response.comments_total = await area_comment_repository.count_comments(
+            session, land_area_id)
+    return response
 
 
 @router.method(
-    errors=[rpc_exceptions.AuthenticationError],
-    dependencies=[
-        Depends(AuthenticationDependency())
+    errors=[
+        rpc_exceptions.AuthenticationError,
+        rpc_exceptions.TransactionError
     ]
 )
 @in_transaction
@@ -109,68 +193,72 @@ async def create_cadastral_land_area(
         session,
         filters=[LandArea.id == land_area_orm.id],
         options=[
-            selectinload(LandArea.area_buildings),
-            selectinload(LandArea.owners),
-            selectinload(LandArea.comments),
-            selectinload(LandArea.extra_data)
+            eager_load(LandArea.area_buildings),
+            eager_load(LandArea.owners),
+            eager_load(LandArea.comments),
+            eager_load(LandArea.extra_data)
         ]
     )
-    return LandAreaRelatedResponseDTO.model_validate(
-        rel_land_area, from_attributes=True)
+    return construct_trusted(LandAreaRelatedResponseDTO, rel_land_area)
 
 
 @router.method(
     errors=[
         rpc_exceptions.AuthenticationError,
-        rpc_exceptions.TransactionError
-    ],
-    dependencies=[
-        Depends(AuthenticationDependency())
+        rpc_exceptions.TransactionError,
+        rpc_exceptions.ObjectNotFoundError,
+        rpc_exceptions.ConcurrentModificationError
     ]
 )
 @in_transaction
 async def update_cadastral_land_area(
         land_area_id: UUID,
         land_area: LandAreaRequestDTO,
-) -> LandAreaRequestDTO:
+        expected_version: Optional[int] = Body(
+            None, ge=1,
+            description='Update only if the object still has this version'),
+) -> LandAreaResponseDTO:
     session: AsyncSession = ASYNC_CONTEXT_SESSION.get()
     updated_land_area: Optional[LandArea] = await (
         land_area_repository.update_land_area(
-            session, land_area_id, **land_area.model_dump()
+            session, land_area_id, expected_version,
+            **land_area.model_dump()
         ))
-    return LandAreaRequestDTO.model_validate(
-        updated_land_area,
-        from_attributes=True
-    )
+    if not updated_land_area:
+        raise rpc_exceptions.ObjectNotFoundError(
+            data='No such land area by this id'
+        )
+    return construct_trusted(LandAreaResponseDTO, updated_land_area)
 
 
 @router.method(
     errors=[
         rpc_exceptions.TransactionError,
-        rpc_exceptions.AuthenticationError
-    ],
-    dependencies=[
-        Depends(AuthenticationDependency())
+        rpc_exceptions.AuthenticationError,
+        rpc_exceptions.ObjectNotFoundError,
+        rpc_exceptions.ConcurrentModificationError
     ]
 )
 @in_transaction
 async def update_owner(
         owner_id: UUID,
         owner: OwnerRequestDTO,
+        expected_version: Optional[int] = Body(
+            None, ge=1,
+            description='Update only if the object still has this version'),
 ) -> OwnerResponseDTO:
     session: AsyncSession = ASYNC_CONTEXT_SESSION.get()
     orm_owner: Optional[LandOwner] = await owner_repository.update_owner(
-        session, owner_id, **owner.model_dump())
-    return OwnerResponseDTO.model_validate(orm_owner, from_attributes=True)
+        session, owner_id, expected_version, **owner.model_dump())
+    if not orm_owner:
+        raise rpc_exceptions.ObjectNotFoundError(data='No owner by this id')
+    return construct_trusted(OwnerResponseDTO, orm_owner)
 
 
 @router.method(
     errors=[
         rpc_exceptions.TransactionError,
         rpc_exceptions.AuthenticationError
-    ],
-    dependencies=[
-        Depends(AuthenticationDependency())
     ]
 )
 @in_transaction
@@ -182,17 +270,13 @@ async def update_building(
     orm_building: Optional[
         Building] = await building_repository.update_building(
         session, building_id, **building.model_dump())
-    return BuildingResponseDTO.model_validate(
-        orm_building, from_attributes=True)
+    return construct_trusted(BuildingResponseDTO, orm_building)
 
 
 @router.method(
     errors=[
         rpc_exceptions.TransactionError,
         rpc_exceptions.AuthenticationError,
-    ],
-    dependencies=[
-        Depends(AuthenticationDependency())
     ]
 )
 @in_transaction
@@ -208,16 +292,13 @@ async def add_owner(
             data='No such Land Area by this id')
     owner: LandOwner = await owner_repository.create_owner(
         session, **owner_schema.model_dump(), land_area_id=land_area_id)
-    return OwnerResponseDTO.model_validate(owner, from_attributes=True)
+    return construct_trusted(OwnerResponseDTO, owner)
 
 
 @router.method(
     errors=[
         rpc_exceptions.TransactionError,
         rpc_exceptions.AuthenticationError,
-    ],
-    dependencies=[
-        Depends(AuthenticationDependency())
     ]
 )
 @in_transaction
@@ -233,4 +314,4 @@ async def add_building(
             data='No such Land Area by this id')
     building: Building = await building_repository.create_building(
         session, **building_schema.model_dump(), land_area_id=land_area_id)
-    return BuildingResponseDTO.model_validate(building, from_attributes=True)
+    return construct_trusted(BuildingResponseDTO, building)
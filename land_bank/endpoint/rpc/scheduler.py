@@ -1,36 +1,60 @@
-from typing import Iterable, List, Optional
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Sequence
 from uuid import UUID
 
-from fastapi import Depends
-from fastapi_jsonrpc import Entrypoint
+from fastapi import Body, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from application.auth.dependency import AuthenticationDependency
+from application.auth.dependency import authentication
 from domain.scheduler_task.schema import (
     SchedulerTaskResponseDTO,
     TaskListResponseDTO,
     TaskRequestDTO,
     TaskRelatedResponseDTO,
     TaskEditRequestDTO,
-    TaskResponseDTO
+    TaskResponseDTO,
+    TaskRelation,
+    TASK_RELATIONS,
+    TaskBulkCreateResultDTO,
+    TaskStatusChangeResultDTO,
+    DeadlineTaskResponseDTO,
+    MAX_BULK_TASKS
+)
+from domain.request_params.schema import (
+    KeysetCursor,
+    KeysetParams,
+    LimitOffset
 )
 from domain.task_comment.schema import (
+    TaskCommentPageResponseDTO,
     TaskCommentRequestDTO,
     TaskCommentRelatedRequestDTO
 )
+from domain.trusted import construct_trusted
 from infrastructure.database.model import Employee, LandAreaTask, TaskComment
 from infrastructure.database.session import ASYNC_CONTEXT_SESSION
-from infrastructure.database.transaction import in_transaction
+from infrastructure.database.transaction import (
+    in_read_only_transaction,
+    in_transaction
+)
 from infrastructure.exception import rpc_exceptions
+from infrastructure.rpc import BatchEntrypoint
+from storage.change_feed import ChangeFeedRepository
+from storage.employee import EmployeeRepository
+from storage.land_area import LandAreaRepository
 from storage.scheduler_task import LandAreaTaskRepository
 from storage.task_comment import TaskCommentRepository
 
-router = Entrypoint(
+router = BatchEntrypoint(
     path='/api/v1/scheduler',
-    tags=['SCHEDULER']
+    tags=['SCHEDULER'],
+    dependencies=[Depends(authentication)]
 )
 task_repository: LandAreaTaskRepository = LandAreaTaskRepository()
 task_comment_repository: TaskCommentRepository = TaskCommentRepository()
+land_area_repository: LandAreaRepository = LandAreaRepository()
+employee_repository: EmployeeRepository = EmployeeRepository()
+change_feed_repository: ChangeFeedRepository = ChangeFeedRepository()
 
 
 @router.method(
@@ -42,47 +66,91 @@ task_comment_repository: TaskCommentRepository = TaskCommentRepository()
 @in_transaction
 async def create_land_area_task(
         task: TaskRequestDTO,
-        employee: Employee = Depends(AuthenticationDependency()),
+        employee: Employee = Depends(authentication),
 ) -> TaskRelatedResponseDTO:
     session: AsyncSession = ASYNC_CONTEXT_SESSION.get()
     created_task: LandAreaTask = await task_repository.create_task(
         session, **task.model_dump(), author_id=employee.id
     )
-    return TaskRelatedResponseDTO.model_validate(
-        created_task, from_attributes=True
-    )
+    return construct_trusted(TaskRelatedResponseDTO, created_task)
 
 
 @router.method(
     errors=[
         rpc_exceptions.AuthenticationError,
         rpc_exceptions.TransactionError
-    ],
-    dependencies=[
-        Depends(AuthenticationDependency())
+    ]
+)
+@in_transaction
+async def create_land_area_tasks(
+        tasks: List[TaskRequestDTO] = Body(
+            ..., min_length=1, max_length=MAX_BULK_TASKS),
+        employee: Employee = Depends(authentication),
+) -> List[TaskBulkCreateResultDTO]:
+    """
+    Создает задачи пакетом: участки и исполнители проверяются двумя
+    запросами, все корректные задачи вставляются одним INSERT. Задачи
+    с несуществующим участком или исполнителем не создаются, для них
+    возвращается ошибка
+    """
+    session: AsyncSession = ASYNC_CONTEXT_SESSION.get()
+    land_area_ids = await land_area_repository.select_existing_ids(
+        session, (task.land_area_id for task in tasks))
+    executor_ids = await employee_repository.select_existing_ids(
+        session, (task.executor_id for task in tasks))
+
+    results: List[TaskBulkCreateResultDTO] = []
+    valid_results: List[TaskBulkCreateResultDTO] = []
+    values: List[Dict[str, Any]] = []
+    for index, task in enumerate(tasks):
+        result = TaskBulkCreateResultDTO(index=index)
+        if task.land_area_id not in land_area_ids:
+            result.error = 'No land area by this id'
+        elif task.executor_id not in executor_ids:
+            result.error = 'No executor by this id'
+        else:
+            valid_results.append(result)
+            values.append({**task.model_dump(), 'author_id': employee.id})
+        results.append(result)
+
+    created_tasks: Sequence[
+        LandAreaTask] = await task_repository.create_tasks(
+        session, values)
+    for result, created_task in zip(valid_results, created_tasks):
+        result.task = construct_trusted(TaskResponseDTO, created_task)
+    return results
+
+
+@router.method(
+    errors=[
+        rpc_exceptions.AuthenticationError,
+        rpc_exceptions.TransactionError,
+        rpc_exceptions.ObjectNotFoundError,
+        rpc_exceptions.ConcurrentModificationError
     ]
 )
 @in_transaction
 async def update_land_area_task(
         task_id: UUID,
         edited_task: TaskEditRequestDTO,
+        expected_version: Optional[int] = Body(
+            None, ge=1,
+            description='Update only if the object still has this version'),
 ) -> TaskResponseDTO:
     session: AsyncSession = ASYNC_CONTEXT_SESSION.get()
-    if not await task_repository.is_task_exists(
-            session, LandAreaTask.id == task_id):
-        raise rpc_exceptions.ObjectNotFoundError()
-    task: LandAreaTask = await task_repository.update_task(
-        session, LandAreaTask.id == task_id, **edited_task.model_dump())
-    return TaskResponseDTO.model_validate(task, from_attributes=True)
+    task: Optional[LandAreaTask] = await task_repository.update_task(
+        session, LandAreaTask.id == task_id,
+        expected_version=expected_version, **edited_task.model_dump())
+    if not task:
+        raise rpc_exceptions.ObjectNotFoundError(data='No task by this id')
+    return construct_trusted(TaskResponseDTO, task)
 
 
 @router.method(
     errors=[
         rpc_exceptions.AuthenticationError,
+        rpc_exceptions.ObjectNotFoundError,
         rpc_exceptions.TransactionError
-    ],
-    dependencies=[
-        Depends(AuthenticationDependency())
     ]
 )
 @in_transaction
@@ -90,12 +158,10 @@ async def delete_land_area_task(
         task_id: UUID
 ) -> None:
     session: AsyncSession = ASYNC_CONTEXT_SESSION.get()
-    task: Optional[LandAreaTask] = await task_repository.get_record(
-        session, LandAreaTask.id == task_id)
-    if not task:
+    if not await task_repository.delete_task(session, task_id):
         raise rpc_exceptions.ObjectNotFoundError(
             data='No task by this ID')
-    await task_repository.delete_record(session, task)
+    await change_feed_repository.record_deletions(session, 'task', [task_id])
     return None
 
 
@@ -104,24 +170,48 @@ async def delete_land_area_task(
         rpc_exceptions.AuthenticationError,
     ]
 )
-@in_transaction
+@in_read_only_transaction
 async def get_employee_tasks(
-        employee: Employee = Depends(AuthenticationDependency()),
+        employee: Employee = Depends(authentication),
 ) -> List[SchedulerTaskResponseDTO]:
     session: AsyncSession = ASYNC_CONTEXT_SESSION.get()
     tasks: Iterable[LandAreaTask] = await task_repository.get_employee_tasks(
         session, employee.id)
     return [
-        SchedulerTaskResponseDTO.model_validate(task, from_attributes=True)
+        construct_trusted(SchedulerTaskResponseDTO, task)
         for task in tasks
     ]
 
 
 @router.method(
-    errors=[rpc_exceptions.AuthenticationError],
-    dependencies=[Depends(AuthenticationDependency())]
+    errors=[rpc_exceptions.AuthenticationError]
 )
-@in_transaction
+@in_read_only_transaction
+async def get_deadline_tasks(
+        limit_offset: LimitOffset,
+        within_hours: int = Body(
+            0, ge=0, le=24 * 30,
+            description='0 - only overdue tasks'),
+        executor_id: Optional[UUID] = Body(None),
+) -> List[DeadlineTaskResponseDTO]:
+    """
+    Незавершенные задачи, срок которых прошел или наступит в ближайшие
+    within_hours часов, ближайшие первыми
+    """
+    session: AsyncSession = ASYNC_CONTEXT_SESSION.get()
+    tasks = await task_repository.get_deadline_tasks(
+        session, datetime.now() + timedelta(hours=within_hours),
+        executor_id, limit_offset.limit, limit_offset.offset)
+    return [
+        construct_trusted(DeadlineTaskResponseDTO, task)
+        for task in tasks
+    ]
+
+
+@router.method(
+    errors=[rpc_exceptions.AuthenticationError]
+)
+@in_read_only_transaction
 async def get_area_tasks(
         land_area_id: UUID,
 ) -> List[TaskListResponseDTO]:
@@ -129,7 +219,7 @@ async def get_area_tasks(
     tasks: Iterable[LandAreaTask] = await task_repository.get_area_tasks(
         session, land_area_id)
     return [
-        TaskListResponseDTO.model_validate(task, from_attributes=True)
+        construct_trusted(TaskListResponseDTO, task)
         for task in tasks
     ]
 
@@ -138,27 +228,61 @@ async def get_area_tasks(
     errors=[
         rpc_exceptions.AuthenticationError,
         rpc_exceptions.ObjectNotFoundError
-    ],
-    dependencies=[Depends(AuthenticationDependency())]
+    ]
 )
-@in_transaction
+@in_read_only_transaction
 async def get_task_by_id(
         task_id: UUID,
+        comments_limit: Optional[int] = Body(
+            None, ge=0, le=100,
+            description='Only the newest comments and their total'),
+        include: Optional[List[TaskRelation]] = Body(
+            None, description='Relations to load, all by default; '
+                              'the rest are returned as null'),
 ) -> TaskRelatedResponseDTO:
     session: AsyncSession = ASYNC_CONTEXT_SESSION.get()
+    relations: Sequence[TaskRelation] = (
+        TASK_RELATIONS if include is None else include)
     task: Optional[LandAreaTask] = await task_repository.get_task_related(
-        session, task_id)
+        session, task_id, comments_limit, relations)
     if not task:
         raise rpc_exceptions.ObjectNotFoundError(data='No task by this id')
-    return TaskRelatedResponseDTO.model_validate(task, from_attributes=True)
+    # Только загруженные атрибуты: незапрошенные отношения остаются None
+    # и не подгружаются лениво
+    response = construct_trusted(TaskRelatedResponseDTO, vars(task))
+    if comments_limit is not None and 'task_comments' in relations:
+        response.task_comments_total = (
+            await task_comment_repository.count_comments(session, task_id))
+    return response
+
+
+@router.method(
+    errors=[rpc_exceptions.AuthenticationError]
+)
+@in_read_only_transaction
+async def get_task_comments(
+        task_id: UUID,
+        page: KeysetParams,
+) -> TaskCommentPageResponseDTO:
+    session: AsyncSession = ASYNC_CONTEXT_SESSION.get()
+    comments, has_next = await task_comment_repository.get_comment_page(
+        session, task_id, page.limit, page.after)
+    return TaskCommentPageResponseDTO(
+        items=[
+            construct_trusted(TaskCommentRelatedRequestDTO, comment)
+            for comment in comments
+        ],
+        next_cursor=KeysetCursor(
+            created_at=comments[-1].created_at, id=comments[-1].id
+        ) if has_next else None
+    )
 
 
 @router.method(
     errors=[
         rpc_exceptions.AuthenticationError,
         rpc_exceptions.ObjectNotFoundError
-    ],
-    dependencies=[Depends(AuthenticationDependency())]
+    ]
 )
 @in_transaction
 async def change_task_status(
@@ -166,39 +290,66 @@ async def change_task_status(
         status_name: str,
 ) -> TaskResponseDTO:
     session: AsyncSession = ASYNC_CONTEXT_SESSION.get()
-    if not await task_repository.is_task_exists(
-            session, LandAreaTask.id == task_id):
-        raise rpc_exceptions.ObjectNotFoundError()
-    task: LandAreaTask = await task_repository.update_task(
+    task: Optional[LandAreaTask] = await task_repository.update_task(
         session, LandAreaTask.id == task_id, status=status_name)
-    return TaskResponseDTO.model_validate(task, from_attributes=True)
+    if not task:
+        raise rpc_exceptions.ObjectNotFoundError(data='No task by this id')
+    return construct_trusted(TaskResponseDTO, task)
 
 
 @router.method(
-    errors=[rpc_exceptions.TransactionError]
+    errors=[rpc_exceptions.AuthenticationError]
+)
+@in_transaction
+async def change_tasks_status(
+        task_ids: List[UUID] = Body(
+            ..., min_length=1, max_length=MAX_BULK_TASKS),
+        status_name: str = Body(...),
+) -> List[TaskStatusChangeResultDTO]:
+    """
+    Переводит задачи в статус одним UPDATE. Результат - по одному на
+    каждый переданный ID, для несуществующих задач - ошибка
+    """
+    session: AsyncSession = ASYNC_CONTEXT_SESSION.get()
+    task_ids = list(dict.fromkeys(task_ids))
+    tasks: Dict[UUID, LandAreaTask] = {
+        task.id: task
+        for task in await task_repository.change_tasks_status(
+            session, task_ids, status_name)
+    }
+    return [
+        TaskStatusChangeResultDTO(
+            task_id=task_id,
+            task=construct_trusted(TaskResponseDTO, tasks[task_id])
+        ) if task_id in tasks else TaskStatusChangeResultDTO(
+            task_id=task_id, error='No task by this id')
+        for task_id in task_ids
+    ]
+
+
+@router.method(
+    errors=[
+        rpc_exceptions.TransactionError,
+        rpc_exceptions.ObjectNotFoundError
+    ]
 )
 @in_transaction
 async def add_task_comment(
         comment: TaskCommentRequestDTO,
-        employee: Employee = Depends(AuthenticationDependency()),
+        employee: Employee = Depends(authentication),
 ) -> TaskCommentRelatedRequestDTO:
     session: AsyncSession = ASYNC_CONTEXT_SESSION.get()
-    if not await task_repository.is_task_exists(
-            session, LandAreaTask.id == comment.task_id):
-        raise rpc_exceptions.ObjectNotFoundError(data='No task by this id')
     orm_comment: TaskComment = await task_comment_repository.create_comment(
         session, **comment.model_dump(), employee_id=employee.id
     )
-    return TaskCommentRelatedRequestDTO.model_validate(
-        orm_comment, from_attributes=True
-    )
+    return construct_trusted(TaskCommentRelatedRequestDTO, orm_comment)
 
 
 @router.method(errors=[rpc_exceptions.TransactionError])
 @in_transaction
 async def delete_task_comment(
         task_comment_id: UUID,
-        employee: Employee = Depends(AuthenticationDependency())
+        employee: Employee = Depends(authentication)
 ) -> None:
     session: AsyncSession = ASYNC_CONTEXT_SESSION.get()
     comment: Optional[
@@ -1,12 +1,15 @@
 from typing import Iterable, List
 
 from fastapi import APIRouter
-from fastapi_jsonrpc import API, Entrypoint
+from fastapi_jsonrpc import API, Entrypoint, JsonRpcMiddleware
 from sqlalchemy.exc import IntegrityError, PendingRollbackError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from application.cache import juristic_options_cache
+from infrastructure.database.index_audit import check_foreign_key_indexes
 from infrastructure.database.session import ASYNC_CONTEXT_SESSION
 from infrastructure.database.transaction import in_transaction
+from infrastructure.logger import configure_logging
 from storage.limit import LimitRepository
 from storage.permitted_use import PermittedUseRepository
 
@@ -49,31 +52,43 @@ async def create_permitted_uses(session: AsyncSession) -> None:
 
 
 @in_transaction
-async def init_database_variables() -> None:
+async def create_database_variables() -> None:
     session: AsyncSession = ASYNC_CONTEXT_SESSION.get()
     await create_limits(session)
     await create_permitted_uses(session)
 
 
+async def init_database_variables() -> None:
+    await create_database_variables()
+    # Версия кэша меняется только после фиксации, иначе другой воркер
+    # может закэшировать старые справочники под новой версией
+    await juristic_options_cache.invalidate()
+
+
 def create_app(
         rpc_entrypoints: Iterable[Entrypoint],
         rest_entrypoints: Iterable[APIRouter],
+        rpc_middlewares: Iterable[JsonRpcMiddleware] = (),
         **kwargs
 ) -> API:
     """Application FastAPI factory
     :param rpc_entrypoints: REST-API роутеры
     :param rest_entrypoints: JSON-RPC роутеры
+    :param rpc_middlewares: Middleware для каждого JSON-RPC вызова
     :param kwargs: APP settings
     :return: Application variable
     """
+    configure_logging()
     app: API = API(**kwargs)
 
     for entrypoint in rpc_entrypoints:
+        entrypoint.middlewares.extend(rpc_middlewares)
         app.bind_entrypoint(entrypoint)
 
     for api_router in rest_entrypoints:
         app.include_router(api_router)
 
     # asyncio.create_task(init_database_variables())
+    check_foreign_key_indexes()
 
     return app
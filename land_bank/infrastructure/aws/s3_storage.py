@@ -1,4 +1,5 @@
 import os
+from typing import BinaryIO
 
 import aioboto3
 from fastapi import File, UploadFile
@@ -33,6 +34,22 @@ class S3Storage:
             )
         return file_name
 
+    async def download_file(self, file_name: str, file: BinaryIO) -> None:
+        """
+        Скачивает файл из s3 хранилища в файловый объект
+        :param file_name: Название файла
+        :param file: Файловый объект, открытый на запись в бинарном режиме
+        """
+        async with self.__session.client(
+                self.__service_name,
+                endpoint_url=S3Settings.S3_ENDPOINT_URL
+        ) as client:
+            await client.download_fileobj(
+                S3Settings.BUCKET_NAME,
+                file_name,
+                file
+            )
+
     async def get_pre_signed_url(self, file_name) -> str:
         """
         Возвращает ссылку на файл из s3 хранилища
@@ -1 +1,7 @@
-from .tasks import send_message
+from .client import celery_client
+from .tasks import (
+    import_land_areas,
+    refresh_dashboard_rollups,
+    remind_task_deadlines,
+    send_message
+)
@@ -1,6 +1,6 @@
 import celery
 
-from infrastructure.settings import RedisSettings
+from infrastructure.settings import AppSettings, RedisSettings
 
 _URL = f'redis://{RedisSettings.REDIS_HOST}:{RedisSettings.REDIS_PORT}'
 
@@ -9,3 +9,17 @@ celery_client = celery.Celery(
     broker=_URL,
     backend=_URL
 )
+
+celery_client.conf.beat_schedule = {
+    'refresh-dashboard-rollups': {
+        'task': 'infrastructure.celery.tasks.refresh_dashboard_rollups',
+        'schedule': AppSettings.DASHBOARD_REFRESH_SECONDS,
+        # Не копить пересчеты, если воркер не успевает
+        'options': {'expires': AppSettings.DASHBOARD_REFRESH_SECONDS}
+    },
+    'remind-task-deadlines': {
+        'task': 'infrastructure.celery.tasks.remind_task_deadlines',
+        'schedule': AppSettings.DEADLINE_SCAN_SECONDS,
+        'options': {'expires': AppSettings.DEADLINE_SCAN_SECONDS}
+    }
+}
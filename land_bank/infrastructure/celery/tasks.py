@@ -1,9 +1,19 @@
+import asyncio
+from datetime import datetime
+
+from application.dashboard import refresh_rollups
+from application.land_area_import import run_land_area_import
 from application.message import IMessage
 from application.smtp import SendMessage
+from application.task_deadline import send_deadline_reminders
+from domain.land_area_import.schema import ImportReportDTO
 from .client import celery_client
 
 __all__ = [
-    'send_message'
+    'send_message',
+    'refresh_dashboard_rollups',
+    'import_land_areas',
+    'remind_task_deadlines'
 ]
 
 
@@ -11,3 +21,24 @@ __all__ = [
 def send_message(message: 'IMessage') -> None:
     sender = SendMessage(message)
     sender.send_mail()
+
+
+@celery_client.task()
+def refresh_dashboard_rollups() -> None:
+    asyncio.run(refresh_rollups())
+
+
+@celery_client.task()
+def remind_task_deadlines() -> int:
+    return asyncio.run(
+        send_deadline_reminders(send_message.delay, datetime.now()))
+
+
+@celery_client.task(bind=True)
+def import_land_areas(self, file_name: str) -> dict:
+    def report_progress(report: 'ImportReportDTO') -> None:
+        self.update_state(
+            state='PROGRESS', meta=report.model_dump(exclude={'errors'}))
+
+    report = asyncio.run(run_land_area_import(file_name, report_progress))
+    return report.model_dump()
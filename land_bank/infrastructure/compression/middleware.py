@@ -0,0 +1,196 @@
+import zlib
+from typing import Callable, Dict, List, Optional, Sequence, Set, Tuple
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from infrastructure.settings import CompressionSettings
+
+try:
+    import brotli
+except ImportError:  # br поддерживается, только если brotli установлен
+    brotli = None
+
+__all__ = [
+    'CompressionMiddleware'
+]
+
+# Остальные типы (изображения, архивы) уже сжаты
+_COMPRESSIBLE_TYPES: Tuple[str, ...] = (
+    'text/',
+    'application/json',
+    'application/x-ndjson'
+)
+
+# (сжать очередную часть, завершить поток)
+Compressor = Tuple[Callable[[bytes], bytes], Callable[[], bytes]]
+
+
+def _gzip_compressor() -> Compressor:
+    compressor = zlib.compressobj(
+        CompressionSettings.COMPRESSION_GZIP_LEVEL,
+        zlib.DEFLATED,
+        16 + zlib.MAX_WBITS
+    )
+    return compressor.compress, compressor.flush
+
+
+def _brotli_compressor() -> Compressor:
+    compressor = brotli.Compressor(
+        quality=CompressionSettings.COMPRESSION_BROTLI_QUALITY)
+    return compressor.process, compressor.finish
+
+
+_COMPRESSORS: Dict[str, Callable[[], Compressor]] = {
+    'gzip': _gzip_compressor
+}
+if brotli is not None:
+    _COMPRESSORS['br'] = _brotli_compressor
+
+
+def _configured_encodings() -> List[str]:
+    encodings = (
+        encoding.strip().lower()
+        for encoding in CompressionSettings.COMPRESSION_ENCODINGS.split(',')
+    )
+    return [encoding for encoding in encodings if encoding in _COMPRESSORS]
+
+
+def _parse_accept_encoding(header: str) -> Tuple[Set[str], Set[str]]:
+    """
+    :param header: Значение Accept-Encoding
+    :return: (принимаемые кодировки, явно запрещенные через q=0)
+    """
+    accepted: Set[str] = set()
+    rejected: Set[str] = set()
+    for item in header.lower().split(','):
+        encoding, _, params = item.partition(';')
+        encoding = encoding.strip()
+        if not encoding:
+            continue
+        quality = params.strip().removeprefix('q=')
+        try:
+            is_rejected = bool(params.strip()) and float(quality) == 0
+        except ValueError:
+            is_rejected = False
+        (rejected if is_rejected else accepted).add(encoding)
+    return accepted, rejected
+
+
+class _CompressingSend:
+    """Обертка send одного ответа: решает по первой части тела, сжимать ли"""
+
+    def __init__(self, send: Send, encoding: str, minimum_size: int):
+        self.send = send
+        self.encoding = encoding
+        self.minimum_size = minimum_size
+        self.start_message: Optional[Message] = None
+        self.compressor: Optional[Compressor] = None
+        self.passthrough: bool = False
+
+    async def __call__(self, message: Message) -> None:
+        if message['type'] == 'http.response.start':
+            self.start_message = message
+            return
+        if message['type'] != 'http.response.body' or self.passthrough:
+            await self.send(message)
+            return
+
+        body: bytes = message.get('body', b'')
+        more_body: bool = message.get('more_body', False)
+        compressor: Optional[Compressor] = self.compressor
+        if compressor is None:
+            start_message: Optional[Message] = self.start_message
+            if start_message is None:
+                raise RuntimeError(
+                    'http.response.body sent before http.response.start')
+            headers = MutableHeaders(scope=start_message)
+            if (not self.is_compressible(headers)
+                    or not more_body and len(body) < self.minimum_size):
+                self.passthrough = True
+                await self.send(start_message)
+                await self.send(message)
+                return
+            compressor = self.compressor = _COMPRESSORS[self.encoding]()
+            headers['Content-Encoding'] = self.encoding
+            headers.add_vary_header('Accept-Encoding')
+            del headers['Content-Length']
+            if not more_body:
+                body = self.compress(compressor, body, finish=True)
+                headers['Content-Length'] = str(len(body))
+                await self.send(start_message)
+                await self.send({'type': 'http.response.body', 'body': body})
+                return
+            await self.send(start_message)
+
+        chunk = self.compress(compressor, body, finish=not more_body)
+        if chunk or not more_body:
+            await self.send({
+                'type': 'http.response.body',
+                'body': chunk,
+                'more_body': more_body
+            })
+
+    @staticmethod
+    def compress(compressor: Compressor, body: bytes, finish: bool) -> bytes:
+        compress, flush = compressor
+        chunk = compress(body)
+        return chunk + flush() if finish else chunk
+
+    @staticmethod
+    def is_compressible(headers: MutableHeaders) -> bool:
+        content_type = headers.get('content-type', '')
+        return 'content-encoding' not in headers and content_type.startswith(
+            _COMPRESSIBLE_TYPES)
+
+
+class CompressionMiddleware:
+    """
+    ASGI middleware: сжимает ответы текстовых типов кодировкой, которую
+    принимает клиент (Accept-Encoding). Ответ одной частью меньше
+    minimum_size отдается как есть, потоковый ответ сжимается по частям
+    без буферизации целиком
+    """
+
+    def __init__(
+            self,
+            app: ASGIApp,
+            encodings: Optional[Sequence[str]] = None,
+            minimum_size: Optional[int] = None
+    ):
+        """
+        :param app: ASGI приложение
+        :param encodings: Кодировки в порядке предпочтения, по умолчанию
+        из CompressionSettings
+        :param minimum_size: Порог сжатия в байтах
+        """
+        self.app = app
+        self.encodings: List[str] = [
+            encoding for encoding in encodings or _configured_encodings()
+            if encoding in _COMPRESSORS
+        ]
+        self.minimum_size: int = (
+            CompressionSettings.COMPRESSION_MIN_SIZE
+            if minimum_size is None else minimum_size
+        )
+
+    def choose_encoding(self, accept_encoding: str) -> Optional[str]:
+        accepted, rejected = _parse_accept_encoding(accept_encoding)
+        for encoding in self.encodings:
+            if encoding in rejected:
+                continue
+            if encoding in accepted or '*' in accepted:
+                return encoding
+        return None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope['type'] != 'http' or not self.encodings:
+            await self.app(scope, receive, send)
+            return
+        encoding = self.choose_encoding(
+            Headers(scope=scope).get('accept-encoding', ''))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+        compressing_send = _CompressingSend(send, encoding, self.minimum_size)
+        await self.app(scope, receive, compressing_send)
@@ -0,0 +1,19 @@
+from sqlalchemy.exc import IntegrityError
+
+__all__ = [
+    'FOREIGN_KEY_VIOLATION',
+    'is_foreign_key_violation'
+]
+
+# SQLSTATE нарушения внешнего ключа в Postgres
+FOREIGN_KEY_VIOLATION: str = '23503'
+
+
+def is_foreign_key_violation(error: IntegrityError) -> bool:
+    """
+    Проверяет, что запись ссылается на несуществующую строку (или
+    удаляется строка, на которую есть ссылки)
+    :param error: Ошибка целостности от драйвера
+    :return: True, если это нарушение внешнего ключа
+    """
+    return getattr(error.orig, 'sqlstate', None) == FOREIGN_KEY_VIOLATION
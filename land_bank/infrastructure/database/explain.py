@@ -0,0 +1,41 @@
+import json
+from typing import Any, Dict
+
+from sqlalchemy import Executable
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import ClauseElement
+
+__all__ = [
+    'Explain',
+    'plan_rows'
+]
+
+
+class Explain(Executable, ClauseElement):
+    """
+    EXPLAIN (FORMAT JSON) для запроса. Параметры запроса передаются как
+    обычные bind-параметры, сам запрос не выполняется
+    """
+    inherit_cache = False
+
+    def __init__(self, statement: Executable):
+        self.statement: Executable = statement
+
+
+@compiles(Explain, 'postgresql')
+def _compile_explain(element: Explain, compiler, **kwargs) -> str:
+    return 'EXPLAIN (FORMAT JSON) ' + compiler.process(
+        element.statement, **kwargs)
+
+
+def plan_rows(explain_result: Any) -> int:
+    """
+    Оценка количества строк верхнего узла плана
+    :param explain_result: Результат EXPLAIN (FORMAT JSON) - строка или
+    уже разобранный JSON, в зависимости от драйвера
+    :return: Оценка планировщика
+    """
+    if isinstance(explain_result, str):
+        explain_result = json.loads(explain_result)
+    plan: Dict[str, Any] = explain_result[0]['Plan']
+    return int(plan['Plan Rows'])
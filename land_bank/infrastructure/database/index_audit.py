@@ -0,0 +1,59 @@
+import logging
+from typing import List
+
+from sqlalchemy import Column, MetaData, Table, UniqueConstraint
+
+from .model import Base
+
+__all__ = [
+    'find_unindexed_foreign_keys',
+    'check_foreign_key_indexes'
+]
+
+
+def _leading_columns(table: Table) -> List[Column]:
+    """
+    Возвращает первые колонки всех индексов, первичного ключа и
+    ограничений уникальности таблицы - только по ним Postgres может
+    эффективно искать строки по одной колонке
+    """
+    column_groups = [list(table.primary_key.columns)]
+    column_groups.extend(list(index.columns) for index in table.indexes)
+    column_groups.extend(
+        list(constraint.columns) for constraint in table.constraints
+        if isinstance(constraint, UniqueConstraint)
+    )
+    return [columns[0] for columns in column_groups if columns]
+
+
+def find_unindexed_foreign_keys(
+        metadata: MetaData = Base.metadata
+) -> List[str]:
+    """
+    Ищет колонки внешних ключей, по которым нет индекса.
+    Колонка считается проиндексированной, если она первая в каком-либо
+    индексе, первичном ключе или ограничении уникальности
+    :param metadata: Метаданные моделей
+    :return: Список колонок вида "table.column"
+    """
+    unindexed: List[str] = []
+    for table in metadata.sorted_tables:
+        leading_columns = _leading_columns(table)
+        for foreign_key in table.foreign_keys:
+            column = foreign_key.parent
+            if not any(column is leading for leading in leading_columns):
+                unindexed.append(f'{table.name}.{column.name}')
+    return unindexed
+
+
+def check_foreign_key_indexes(metadata: MetaData = Base.metadata) -> bool:
+    """
+    Логирует внешние ключи без индекса, чтобы подгрузка отношений через
+    selectinload (WHERE fk IN (...)) не превращалась в полный скан таблицы
+    :param metadata: Метаданные моделей
+    :return: True, если все внешние ключи проиндексированы
+    """
+    unindexed = find_unindexed_foreign_keys(metadata)
+    for column in unindexed:
+        logging.warning('Foreign key without index: %s', column)
+    return not unindexed
@@ -1,9 +1,10 @@
 from datetime import datetime
-from typing import List, Optional, TypeVar
+from typing import List, Optional, Tuple, TypeVar
 from uuid import UUID, uuid4
 
 import sqlalchemy
 from sqlalchemy import MetaData
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column, relationship, DeclarativeBase
 
 meta = MetaData()
@@ -19,6 +20,17 @@ class Base(DeclarativeBase):
 
 DatabaseEntity = TypeVar('DatabaseEntity', bound=Base)
 
+# Конфигурация полнотекстового поиска Postgres
+SEARCH_CONFIG: str = 'russian'
+
+# Момент изменения строки по часам БД, в UTC
+UTC_NOW = sqlalchemy.func.timezone('utc', sqlalchemy.func.now())
+
+# Статусы завершенных задач: такие задачи не считаются просроченными.
+# Входят в условие частичного индекса ix_land_area_tasks_open_deadline,
+# поэтому заданы в модели, а не в настройках окружения
+FINAL_TASK_STATUSES: Tuple[str, ...] = ('Выполнена', 'Отменена')
+
 
 class Employee(Base):
     """
@@ -51,17 +63,17 @@ class Employee(Base):
     position_id: Mapped[UUID] = mapped_column(
         sqlalchemy.ForeignKey(
             'land_bank_position.id', ondelete='RESTRICT'
-        ), nullable=True
+        ), nullable=True, index=True
     )
     department_id: Mapped[UUID] = mapped_column(
         sqlalchemy.ForeignKey(
             'land_bank_department.id', ondelete='RESTRICT'
-        ), nullable=True
+        ), nullable=True, index=True
     )
     employee_head_id: Mapped[UUID] = mapped_column(
         sqlalchemy.ForeignKey(
             'land_bank_employee.id', ondelete='RESTRICT'
-        ), nullable=True
+        ), nullable=True, index=True
     )
 
     employee_head: Mapped['Employee'] = relationship(
@@ -116,11 +128,11 @@ class PermissionPosition(Base):
 
     position_id: Mapped[int] = mapped_column(
         sqlalchemy.ForeignKey('land_bank_position.id', ondelete='RESTRICT'),
-        nullable=False
+        nullable=False, index=True
     )
     permission_id: Mapped[int] = mapped_column(
         sqlalchemy.ForeignKey('permissions.id', ondelete='CASCADE'),
-        nullable=False
+        nullable=False, index=True
     )
     position: Mapped['Position'] = relationship(
         'Position', back_populates='permissions'
@@ -144,15 +156,23 @@ class Permission(Base):
 
 class AreaComment(Base):
     __tablename__ = 'area_comments'
+    __table_args__ = (
+        # Лента комментариев участка: новые первыми, keyset по (created_at, id)
+        sqlalchemy.Index(
+            'ix_area_comments_land_area_id_created_at_id',
+            'land_area_id', 'created_at', 'id'
+        ),
+    )
 
     comment_text: Mapped[str] = mapped_column(
         sqlalchemy.String(128), nullable=False,
     )
     land_area_id: Mapped[UUID] = mapped_column(
-        sqlalchemy.ForeignKey('cadastral_land_area.id', ondelete='CASCADE'),
+        sqlalchemy.ForeignKey('cadastral_land_area.id', ondelete='CASCADE')
     )
     employee_id: Mapped[UUID] = mapped_column(
-        sqlalchemy.ForeignKey('land_bank_employee.id', ondelete='CASCADE')
+        sqlalchemy.ForeignKey('land_bank_employee.id', ondelete='CASCADE'),
+        index=True
     )
     created_at: Mapped[datetime] = mapped_column(
         sqlalchemy.DateTime, default=datetime.now
@@ -168,12 +188,42 @@ class AreaComment(Base):
 
 class LandArea(Base):
     __tablename__ = 'cadastral_land_area'
+    __table_args__ = (
+        sqlalchemy.Index(
+            'ix_cadastral_land_area_search_vector', 'search_vector',
+            postgresql_using='gin'
+        ),
+        # Поиск по префиксу кадастрового номера: LIKE '66:41:%'
+        sqlalchemy.Index(
+            'ix_cadastral_land_area_cadastral_number_pattern',
+            'cadastral_number',
+            postgresql_ops={'cadastral_number': 'varchar_pattern_ops'}
+        ),
+        # Фильтры списка участков (LandAreaFilterParams)
+        sqlalchemy.Index(
+            'ix_cadastral_land_area_stage_working_status_entered_at_base',
+            'stage', 'working_status', 'entered_at_base'
+        ),
+        sqlalchemy.Index(
+            'ix_cadastral_land_area_working_status_entered_at_base',
+            'working_status', 'entered_at_base'
+        ),
+        sqlalchemy.Index(
+            'ix_cadastral_land_area_area_category_entered_at_base',
+            'area_category', 'entered_at_base'
+        ),
+        # Лента изменений: keyset по (updated_at, id)
+        sqlalchemy.Index(
+            'ix_cadastral_land_area_updated_at_id', 'updated_at', 'id'
+        ),
+    )
 
     name: Mapped[str] = mapped_column(
         sqlalchemy.String(length=64), nullable=False
     )
+    # Уникален: по нему импорт обновляет существующие участки
     cadastral_number: Mapped[str] = mapped_column(
-        sqlalchemy.String(length=32), nullable=False,
+        sqlalchemy.String(length=32), nullable=False, unique=True
     )
     area_category: Mapped[str] = mapped_column(
         sqlalchemy.String(length=64), nullable=False,
@@ -182,16 +232,16 @@ class LandArea(Base):
         sqlalchemy.Double(), nullable=True
     )
     area_square: Mapped[float] = mapped_column(
-        sqlalchemy.Double, nullable=False,
+        sqlalchemy.Double, nullable=False, index=True
     )
     address: Mapped[str] = mapped_column(
         sqlalchemy.String(length=64), nullable=False
     )
     search_channel: Mapped[str] = mapped_column(
-        sqlalchemy.String(length=32), nullable=False
+        sqlalchemy.String(length=32), nullable=False, index=True
     )
     entered_at_base: Mapped[datetime] = mapped_column(
-        sqlalchemy.DateTime, default=datetime.now
+        sqlalchemy.DateTime, default=datetime.now, index=True
     )
     working_status: Mapped[str] = mapped_column(
         sqlalchemy.String(length=32), nullable=False,
@@ -199,6 +249,27 @@ class LandArea(Base):
     stage: Mapped[str] = mapped_column(
         sqlalchemy.String(length=32), nullable=False
     )
+    # Версия строки для оптимистичной блокировки: растет при каждом
+    # изменении через SQLAlchemyRepository.update_record
+    version: Mapped[int] = mapped_column(
+        sqlalchemy.Integer, nullable=False, default=1, server_default='1'
+    )
+    # Обновляется при каждой записи, в том числе UPDATE через Core
+    updated_at: Mapped[datetime] = mapped_column(
+        sqlalchemy.DateTime, nullable=False,
+        server_default=UTC_NOW, onupdate=UTC_NOW
+    )
+    # Вычисляется Postgres при каждой записи, в выборки не попадает
+    search_vector: Mapped[str] = mapped_column(
+        TSVECTOR,
+        sqlalchemy.Computed(
+            f"to_tsvector('{SEARCH_CONFIG}', "
+            "coalesce(name, '') || ' ' || coalesce(address, '') || ' ' || "
+            "coalesce(cadastral_number, ''))",
+            persisted=True
+        ),
+        deferred=True
+    )
 
     archive_info: Mapped[Optional['ArchiveInfo']] = relationship(
         'ArchiveInfo', back_populates='land_area'
@@ -246,7 +317,7 @@ class Building(Base):
     )
     land_area_id: Mapped[UUID] = mapped_column(
         sqlalchemy.ForeignKey('cadastral_land_area.id', ondelete='CASCADE'),
-        nullable=False
+        nullable=False, index=True
     )
 
     land_area: Mapped['LandArea'] = relationship(
@@ -256,6 +327,12 @@ class Building(Base):
 
 class LandOwner(Base):
     __tablename__ = 'land_area_objects_owners'
+    __table_args__ = (
+        sqlalchemy.Index(
+            'ix_land_area_objects_owners_search_vector', 'search_vector',
+            postgresql_using='gin'
+        ),
+    )
 
     name: Mapped[str] = mapped_column(
         sqlalchemy.String(length=64), nullable=False,
@@ -271,6 +348,19 @@ class LandOwner(Base):
     )
     land_area_id: Mapped[UUID] = mapped_column(
         sqlalchemy.ForeignKey('cadastral_land_area.id', ondelete='CASCADE'),
+        index=True
+    )
+    # Версия строки, см. LandArea.version
+    version: Mapped[int] = mapped_column(
+        sqlalchemy.Integer, nullable=False, default=1, server_default='1'
+    )
+    search_vector: Mapped[str] = mapped_column(
+        TSVECTOR,
+        sqlalchemy.Computed(
+            f"to_tsvector('{SEARCH_CONFIG}', coalesce(name, ''))",
+            persisted=True
+        ),
+        deferred=True
     )
 
     land_area: Mapped['LandArea'] = relationship(
@@ -289,7 +379,7 @@ class ArchiveInfo(Base):
     )
     land_area_id: Mapped[UUID] = mapped_column(
         sqlalchemy.ForeignKey('cadastral_land_area.id', ondelete='CASCADE'),
-        nullable=False
+        nullable=False, index=True
     )
 
     land_area: Mapped['LandArea'] = relationship(
@@ -299,6 +389,18 @@ class ArchiveInfo(Base):
 
 class LandAreaTask(Base):
     __tablename__ = 'land_area_tasks'
+    __table_args__ = (
+        # Поиск просроченных и близких к сроку задач: диапазон по deadline
+        # только среди незавершенных задач
+        sqlalchemy.Index(
+            'ix_land_area_tasks_open_deadline', 'deadline', 'id',
+            postgresql_where=sqlalchemy.column('status').not_in(
+                FINAL_TASK_STATUSES)
+        ),
+        sqlalchemy.Index(
+            'ix_land_area_tasks_updated_at_id', 'updated_at', 'id'
+        ),
+    )
 
     name: Mapped[str] = mapped_column(
         sqlalchemy.String(length=64),
@@ -311,17 +413,17 @@ class LandAreaTask(Base):
     executor_id: Mapped[UUID] = mapped_column(
         sqlalchemy.ForeignKey(
             'land_bank_employee.id', ondelete='RESTRICT'
-        ), nullable=False
+        ), nullable=False, index=True
     )
     author_id: Mapped[UUID] = mapped_column(
         sqlalchemy.ForeignKey(
             'land_bank_employee.id', ondelete='RESTRICT'
-        ), nullable=False
+        ), nullable=False, index=True
     )
     land_area_id: Mapped[UUID] = mapped_column(
         sqlalchemy.ForeignKey(
             'cadastral_land_area.id', ondelete='CASCADE'
-        ), nullable=False
+        ), nullable=False, index=True
     )
     status: Mapped[str] = mapped_column(
         sqlalchemy.String(length=32), nullable=False
@@ -332,6 +434,19 @@ class LandAreaTask(Base):
     deadline: Mapped[datetime] = mapped_column(
         sqlalchemy.DateTime, nullable=False
     )
+    # Срок, о котором исполнителю уже напомнили. Перенос срока снова
+    # включает напоминание
+    reminded_deadline: Mapped[Optional[datetime]] = mapped_column(
+        sqlalchemy.DateTime, nullable=True
+    )
+    # Версия строки, см. LandArea.version
+    version: Mapped[int] = mapped_column(
+        sqlalchemy.Integer, nullable=False, default=1, server_default='1'
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        sqlalchemy.DateTime, nullable=False,
+        server_default=UTC_NOW, onupdate=UTC_NOW
+    )
 
     executor: Mapped[Employee] = relationship(
         'Employee', backref='tasks', foreign_keys=[executor_id]
@@ -353,6 +468,13 @@ class TaskComment(Base):
     Комментарий к задаче
     """
     __tablename__ = 'task_comments'
+    __table_args__ = (
+        # Лента комментариев задачи: новые первыми, keyset по (created_at, id)
+        sqlalchemy.Index(
+            'ix_task_comments_task_id_created_at_id',
+            'task_id', 'created_at', 'id'
+        ),
+    )
 
     task_id: Mapped[UUID] = mapped_column(
         sqlalchemy.ForeignKey('land_area_tasks.id', ondelete='CASCADE'),
@@ -360,7 +482,7 @@ class TaskComment(Base):
     )
     employee_id: Mapped[UUID] = mapped_column(
         sqlalchemy.ForeignKey('land_bank_employee.id', ondelete='CASCADE'),
-        nullable=False
+        nullable=False, index=True
     )
     text: Mapped[str] = mapped_column(
         sqlalchemy.String(length=128), nullable=False
@@ -398,6 +520,9 @@ class LandAreaLimit(Base):
     """Ассоциативная таблица для таблиц cadastral_land_area и area_limits"""
 
     __tablename__ = 'land_area__limit'
+    __table_args__ = (
+        sqlalchemy.UniqueConstraint('land_area_id', 'limit_id'),
+    )
 
     limit_id: Mapped[UUID] = mapped_column(
         sqlalchemy.ForeignKey('area_limits.id', ondelete='CASCADE'),
@@ -413,6 +538,9 @@ class LandAreaPermittedUse(Base):
     """Ассоциативная таблица для таблиц permitted_uses и cadastral_land_area"""
 
     __tablename__ = 'land_area__permitted_uses'
+    __table_args__ = (
+        sqlalchemy.UniqueConstraint('land_area_id', 'permitted_use_id'),
+    )
 
     permitted_use_id: Mapped[UUID] = mapped_column(
         sqlalchemy.ForeignKey('permitted_uses.id', ondelete='CASCADE'),
@@ -420,7 +548,7 @@ class LandAreaPermittedUse(Base):
     )
     land_area_id: Mapped[UUID] = mapped_column(
         sqlalchemy.ForeignKey('cadastral_land_area.id', ondelete='CASCADE'),
-        primary_key=True,
+        primary_key=True
     )
 
 
@@ -446,7 +574,7 @@ class ExtraAreaData(Base):
 
     land_area_id: Mapped[UUID] = mapped_column(
         sqlalchemy.ForeignKey('cadastral_land_area.id', ondelete='CASCADE'),
-        nullable=False
+        nullable=False, index=True
     )
     engineering_networks: Mapped[str] = mapped_column(
         sqlalchemy.String(length=128), nullable=True
@@ -461,3 +589,85 @@ class ExtraAreaData(Base):
     land_area: Mapped['LandArea'] = relationship(
         'LandArea', back_populates='extra_data'
     )
+
+
+# Агрегаты для дашборда руководителей. Пересчитываются целиком задачей
+# Celery refresh_dashboard_rollups
+
+class LandAreaRollup(Base):
+    """Количество, площадь и стоимость участков по этапу и статусу"""
+    __tablename__ = 'land_area_rollup'
+    __table_args__ = (
+        sqlalchemy.UniqueConstraint(
+            'stage', 'working_status', 'area_category'),
+    )
+
+    stage: Mapped[str] = mapped_column(
+        sqlalchemy.String(length=32), nullable=False
+    )
+    working_status: Mapped[str] = mapped_column(
+        sqlalchemy.String(length=32), nullable=False
+    )
+    area_category: Mapped[str] = mapped_column(
+        sqlalchemy.String(length=64), nullable=False
+    )
+    land_area_count: Mapped[int] = mapped_column(
+        sqlalchemy.Integer, nullable=False
+    )
+    area_square_sum: Mapped[float] = mapped_column(
+        sqlalchemy.Double, nullable=False
+    )
+    cadastral_cost_sum: Mapped[float] = mapped_column(
+        sqlalchemy.Double, nullable=False
+    )
+    refreshed_at: Mapped[datetime] = mapped_column(
+        sqlalchemy.DateTime, nullable=False
+    )
+
+
+class TaskRollup(Base):
+    """Количество задач по исполнителю, статусу и просрочке"""
+    __tablename__ = 'task_rollup'
+    __table_args__ = (
+        sqlalchemy.UniqueConstraint('executor_id', 'status', 'is_overdue'),
+    )
+
+    executor_id: Mapped[UUID] = mapped_column(
+        sqlalchemy.ForeignKey('land_bank_employee.id', ondelete='CASCADE'),
+        nullable=False
+    )
+    status: Mapped[str] = mapped_column(
+        sqlalchemy.String(length=32), nullable=False
+    )
+    is_overdue: Mapped[bool] = mapped_column(
+        sqlalchemy.Boolean, nullable=False
+    )
+    task_count: Mapped[int] = mapped_column(
+        sqlalchemy.Integer, nullable=False
+    )
+    refreshed_at: Mapped[datetime] = mapped_column(
+        sqlalchemy.DateTime, nullable=False
+    )
+
+
+class DeletedRecord(Base):
+    """
+    Запись об удалении участка или задачи для ленты изменений: клиенты,
+    синхронизирующиеся инкрементально, узнают по ней об удалениях
+    """
+    __tablename__ = 'deleted_records'
+    __table_args__ = (
+        sqlalchemy.Index(
+            'ix_deleted_records_deleted_at_id', 'deleted_at', 'id'
+        ),
+    )
+
+    entity: Mapped[str] = mapped_column(
+        sqlalchemy.String(length=32), nullable=False
+    )
+    entity_id: Mapped[UUID] = mapped_column(
+        sqlalchemy.UUID, nullable=False
+    )
+    deleted_at: Mapped[datetime] = mapped_column(
+        sqlalchemy.DateTime, nullable=False, server_default=UTC_NOW
+    )
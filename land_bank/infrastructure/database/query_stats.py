@@ -0,0 +1,153 @@
+import logging
+import re
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from infrastructure.metrics import registry
+from infrastructure.settings import MonitoringSettings
+
+__all__ = [
+    'QueryStats',
+    'QUERY_STATS',
+    'collect_query_stats',
+    'instrument_engine',
+    'normalize_sql'
+]
+
+_MAX_SQL_LENGTH = 512
+_WHITESPACE = re.compile(r'\s+')
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r'\b\d+(?:\.\d+)?\b')
+_PLACEHOLDER = re.compile(r'\$\d+|%\(\w+\)s|:\w+')
+_PLACEHOLDER_LIST = re.compile(r'\?(?:\s*,\s*\?)+')
+
+RPC_DB_STATEMENTS = registry.histogram(
+    'land_bank_rpc_db_statements',
+    'SQL statements executed per JSON-RPC call',
+    label_names=('method',),
+    buckets=(1, 2, 3, 5, 8, 13, 21, 34, 55, 89)
+)
+RPC_DB_TIME = registry.histogram(
+    'land_bank_rpc_db_time_seconds',
+    'Total database time per JSON-RPC call',
+    label_names=('method',)
+)
+SLOW_STATEMENTS = registry.counter(
+    'land_bank_db_slow_statements_total',
+    'SQL statements slower than SLOW_QUERY_MS',
+    label_names=('method',)
+)
+
+
+def normalize_sql(statement: str) -> str:
+    """
+    Приводит SQL к виду без литералов и параметров, чтобы одинаковые
+    запросы с разными значениями группировались в логах
+    :param statement: SQL запрос
+    :return: Нормализованный SQL
+    """
+    statement = _STRING_LITERAL.sub('?', statement)
+    statement = _PLACEHOLDER.sub('?', statement)
+    statement = _NUMBER_LITERAL.sub('?', statement)
+    statement = _PLACEHOLDER_LIST.sub('?, ...', statement)
+    statement = _WHITESPACE.sub(' ', statement).strip()
+    return statement[:_MAX_SQL_LENGTH]
+
+
+class QueryStats:
+    """Статистика SQL запросов одного JSON-RPC вызова"""
+
+    def __init__(self, name: str = 'unknown'):
+        self.name: str = name
+        self.statements: int = 0
+        self.total_time: float = 0.0
+        self.slowest_time: float = 0.0
+        self.slowest_statement: Optional[str] = None
+
+    def record(self, statement: str, elapsed: float) -> None:
+        self.statements += 1
+        self.total_time += elapsed
+        if elapsed > self.slowest_time:
+            self.slowest_time = elapsed
+            self.slowest_statement = statement
+
+    def is_slow(self) -> bool:
+        return (
+            self.statements > MonitoringSettings.SLOW_RPC_STATEMENTS
+            or self.total_time * 1000 > MonitoringSettings.SLOW_RPC_DB_TIME_MS
+        )
+
+    def report(self) -> None:
+        """Экспортирует метрики и логирует вызов, если он превысил пороги"""
+        if not self.statements:
+            return
+        RPC_DB_STATEMENTS.observe(self.statements, self.name)
+        RPC_DB_TIME.observe(self.total_time, self.name)
+        if self.is_slow():
+            logging.warning(
+                'Heavy RPC call: method=%s statements=%d db_time_ms=%.1f '
+                'slowest_ms=%.1f slowest_sql=%s',
+                self.name, self.statements, self.total_time * 1000,
+                self.slowest_time * 1000,
+                normalize_sql(self.slowest_statement or '')
+            )
+
+
+QUERY_STATS: ContextVar[Optional[QueryStats]] = ContextVar(
+    'query_stats', default=None
+)
+
+
+@contextmanager
+def collect_query_stats(name: str = 'unknown') -> Iterator[QueryStats]:
+    """
+    Собирает статистику всех SQL запросов, выполненных внутри блока
+    :param name: Название JSON-RPC метода
+    :return: Статистика, которая будет выгружена при выходе из блока
+    """
+    stats = QueryStats(name)
+    token = QUERY_STATS.set(stats)
+    try:
+        yield stats
+    finally:
+        QUERY_STATS.reset(token)
+        stats.report()
+
+
+def _before_cursor_execute(
+        conn, cursor, statement, parameters, context, executemany
+) -> None:
+    context.query_started_at = time.perf_counter()
+
+
+def _after_cursor_execute(
+        conn, cursor, statement, parameters, context, executemany
+) -> None:
+    elapsed = time.perf_counter() - context.query_started_at
+    stats = QUERY_STATS.get()
+    if stats is not None:
+        stats.record(statement, elapsed)
+    if elapsed * 1000 > MonitoringSettings.SLOW_QUERY_MS:
+        name = stats.name if stats is not None else 'unknown'
+        SLOW_STATEMENTS.inc(name)
+        logging.warning(
+            'Slow query: method=%s duration_ms=%.1f sql=%s',
+            name, elapsed * 1000, normalize_sql(statement)
+        )
+
+
+def instrument_engine(engine: AsyncEngine) -> None:
+    """
+    Подписывается на события движка, чтобы считать запросы и время БД
+    для текущего JSON-RPC вызова
+    :param engine: Асинхронный движок SQLAlchemy
+    """
+    event.listen(
+        engine.sync_engine, 'before_cursor_execute', _before_cursor_execute)
+    event.listen(
+        engine.sync_engine, 'after_cursor_execute', _after_cursor_execute)
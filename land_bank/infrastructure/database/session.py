@@ -1,13 +1,16 @@
+from contextlib import asynccontextmanager
 from contextvars import ContextVar
-from typing import AsyncGenerator
+from typing import AsyncGenerator, AsyncIterator
 
 from sqlalchemy.ext.asyncio import (
     create_async_engine,
     AsyncSession,
     async_sessionmaker
 )
+from sqlalchemy.pool import NullPool
 
 from infrastructure.settings import DatabaseSettings
+from .query_stats import instrument_engine
 
 DATABASE_URL = (
     f'postgresql+asyncpg://'
@@ -18,7 +21,12 @@ DATABASE_URL = (
     f'/{DatabaseSettings.POSTGRES_DB}'
 )
 
-async_engine = create_async_engine(DATABASE_URL)
+async_engine = create_async_engine(
+    DATABASE_URL,
+    pool_size=DatabaseSettings.POOL_SIZE,
+    max_overflow=DatabaseSettings.MAX_OVERFLOW
+)
+instrument_engine(async_engine)
 
 async_session = async_sessionmaker(
     async_engine,
@@ -39,6 +47,23 @@ def get_async_session() -> AsyncSession:
     return async_session()
 
 
+@asynccontextmanager
+async def isolated_session() -> AsyncIterator[AsyncSession]:
+    """
+    Сессия на отдельном движке без пула соединений. Для кода, который
+    запускает собственный event loop (задачи Celery через asyncio.run):
+    соединения общего пула привязаны к циклу, в котором были открыты
+    :return: Сессия
+    """
+    engine = create_async_engine(DATABASE_URL, poolclass=NullPool)
+    instrument_engine(engine)
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            yield session
+    finally:
+        await engine.dispose()
+
+
 ASYNC_CONTEXT_SESSION: ContextVar[AsyncSession] = ContextVar(
     'async_context_session',
 )
@@ -1,49 +1,202 @@
+import asyncio
 import logging
+import random
+import time
+from contextvars import ContextVar
 from functools import wraps
-from typing import Any, Callable
+from typing import Any, Callable, List, Optional
 
-from fastapi_jsonrpc import BaseError
-from sqlalchemy.exc import IntegrityError, PendingRollbackError
+from fastapi_jsonrpc import BaseError, get_jsonrpc_request_id
+from sqlalchemy.exc import (
+    IntegrityError,
+    PendingRollbackError,
+    SQLAlchemyError
+)
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from infrastructure.exception import rpc_exceptions
+from infrastructure.settings import LoggingSettings
 from .session import ASYNC_CONTEXT_SESSION, get_async_session
 
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s %(levelname)s: %(message)s"
+__all__ = [
+    'BATCH_TRANSACTION',
+    'BatchTransaction',
+    'in_transaction',
+    'in_read_only_transaction'
+]
+
+logger = logging.getLogger('land_bank.transaction')
+
+
+def _log_transaction(
+        function_name: str,
+        outcome: str,
+        started_at: float,
+        error: Optional[Exception] = None
+) -> None:
+    """
+    Пишет одну итоговую строку на транзакцию. Успешные транзакции
+    сэмплируются, ошибки логируются всегда. Строка форматируется только
+    если запись действительно будет выведена
+    """
+    if outcome in ('commit', 'read'):
+        level = logging.INFO
+        if random.random() >= LoggingSettings.TRANSACTION_LOG_SAMPLE_RATE:
+            return
+    elif outcome == 'rpc_error':
+        level = logging.WARNING
+    else:
+        level = logging.ERROR
+    if not logger.isEnabledFor(level):
+        return
+    duration_ms = (time.perf_counter() - started_at) * 1000
+    fields = {
+        'function': function_name,
+        'outcome': outcome,
+        'duration_ms': round(duration_ms, 2),
+    }
+    if error is not None:
+        fields['error'] = repr(error)
+    logger.log(
+        level,
+        'Transaction %s: function=%s duration_ms=%.1f error=%r',
+        outcome, function_name, duration_ms, error,
+        extra={'fields': fields}
+    )
+
+
+async def _run_in_own_session(
+        func: Callable,
+        read_only: bool,
+        *args,
+        **kwargs
+) -> Any:
+    async_session: AsyncSession = get_async_session()
+    # Токен восстанавливает сессию вызывающей функции, если транзакции
+    # вложены (например, загрузка кэша внутри JSON-RPC метода)
+    token = ASYNC_CONTEXT_SESSION.set(async_session)
+
+    started_at = time.perf_counter()
+    outcome = 'error'
+    error: Optional[Exception] = None
+    try:
+        result: Any = await func(*args, **kwargs)
+        if read_only:
+            outcome = 'read'
+        else:
+            await async_session.commit()
+            outcome = 'commit'
+        return result
+    except BaseError as rpc_error:
+        outcome, error = 'rpc_error', rpc_error
+        await async_session.rollback()
+        raise rpc_error
+    except (IntegrityError, PendingRollbackError) as e:
+        outcome, error = 'integrity_error', getattr(e, 'orig', None) or e
+        await async_session.rollback()
+        raise rpc_exceptions.TransactionError(
+            data='Error while transaction executing')
+    except Exception as e:
+        error = e
+        raise
+    finally:
+        # Незафиксированная транзакция откатывается при закрытии сессии
+        await async_session.close()
+        ASYNC_CONTEXT_SESSION.reset(token)
+        _log_transaction(func.__name__, outcome, started_at, error)
+
+
+class BatchTransaction:
+    """
+    Общая транзакция пакетного (batch) JSON-RPC запроса.
+    Пишущие вызовы пакета выполняются по очереди в одной сессии, каждый в
+    своей точке сохранения: ошибка вызова откатывает только его изменения.
+    Фиксация выполняется один раз, после завершения всех вызовов пакета
+    """
+
+    def __init__(self):
+        self.session: Optional[AsyncSession] = None
+        self.write_request_ids: List[Any] = []
+        self._lock: asyncio.Lock = asyncio.Lock()
+        self._started_at: float = time.perf_counter()
+
+    async def execute(self, func: Callable, *args, **kwargs) -> Any:
+        """
+        Выполняет пишущий вызов пакета в точке сохранения общей сессии
+        :param func: Функция JSON-RPC метода
+        :return: Результат функции
+        """
+        async with self._lock:
+            if self.session is None:
+                self.session = get_async_session()
+            ASYNC_CONTEXT_SESSION.set(self.session)
+            try:
+                self.write_request_ids.append(get_jsonrpc_request_id())
+            except LookupError:
+                pass
+            try:
+                async with self.session.begin_nested():
+                    return await func(*args, **kwargs)
+            except (IntegrityError, PendingRollbackError):
+                raise rpc_exceptions.TransactionError(
+                    data='Error while transaction executing')
+
+    async def commit(self) -> bool:
+        """
+        Фиксирует изменения всех пишущих вызовов пакета
+        :return: False, если транзакция была откачена
+        """
+        if self.session is None:
+            return True
+        outcome = 'error'
+        error: Optional[Exception] = None
+        try:
+            await self.session.commit()
+            outcome = 'commit'
+            return True
+        except SQLAlchemyError as e:
+            error = getattr(e, 'orig', None) or e
+            await self.session.rollback()
+            return False
+        finally:
+            await self.session.close()
+            _log_transaction('batch', outcome, self._started_at, error)
+
+    async def close(self) -> None:
+        """Откатывает незафиксированные изменения пакета"""
+        if self.session is not None:
+            await self.session.close()
+
+
+BATCH_TRANSACTION: ContextVar[Optional[BatchTransaction]] = ContextVar(
+    'batch_transaction', default=None
 )
 
 
 def in_transaction(func: Callable):
+    """
+    Выполняет функцию в транзакции с фиксацией изменений.
+    Внутри пакетного запроса вызов присоединяется к общей транзакции пакета
+    """
     @wraps(func)
     async def wrapper(*args, **kwargs) -> Any:
-        async_session: AsyncSession = get_async_session()
-        ASYNC_CONTEXT_SESSION.set(async_session)
-
-        logging.info(
-            f'Transaction session is_active='
-            f'{ASYNC_CONTEXT_SESSION.get().is_active}, '
-            f'Function Name: {func.__name__}'
-        )
-        try:
-            result: Any = await func(*args, **kwargs)
-            await async_session.commit()
-            logging.info(f'Transaction success: {func.__name__}')
-            return result
-        except BaseError as rpc_error:
-            logging.error(f'Transaction error: {type(BaseError)}')
-            await async_session.rollback()
-            raise rpc_error
-        except (IntegrityError, PendingRollbackError) as e:
-            logging.error(
-                f'Transaction error: error type = {type(e)}')
-            await async_session.rollback()
-            print(e.args)
-            raise rpc_exceptions.TransactionError(
-                data='Error while transaction executing')
-        finally:
-            await async_session.close()
-            logging.info(f'Session closed: {func.__name__}')
+        batch: Optional[BatchTransaction] = BATCH_TRANSACTION.get()
+        if batch is not None:
+            return await batch.execute(func, *args, **kwargs)
+        return await _run_in_own_session(func, False, *args, **kwargs)
+
+    return wrapper
+
+
+def in_read_only_transaction(func: Callable):
+    """
+    Выполняет функцию в отдельной сессии без фиксации изменений.
+    Никогда не присоединяется к транзакции пакета, поэтому читающие вызовы
+    пакета выполняются параллельно на разных соединениях пула
+    """
+    @wraps(func)
+    async def wrapper(*args, **kwargs) -> Any:
+        return await _run_in_own_session(func, True, *args, **kwargs)
 
+    setattr(wrapper, 'is_read_only', True)
     return wrapper
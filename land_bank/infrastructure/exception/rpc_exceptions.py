@@ -66,3 +66,13 @@ class TransactionForbiddenError(BaseError):
     """
     CODE = -32008
     MESSAGE = 'Transaction is not available'
+
+
+class ConcurrentModificationError(BaseError):
+    """
+    Ошибка, если запись изменили после того, как клиент её прочитал
+    (не совпала ожидаемая версия)
+    HTTP Аналог - 409 Conflict
+    """
+    CODE = -32009
+    MESSAGE = 'Object was modified concurrently'
@@ -0,0 +1,6 @@
+from .config import JsonFormatter, configure_logging
+from .correlation import (
+    CORRELATION_ID,
+    CorrelationIdFilter,
+    CorrelationIdMiddleware
+)
@@ -0,0 +1,54 @@
+import json
+import logging
+from datetime import datetime, timezone
+from typing import Any, Dict
+
+from infrastructure.settings import LoggingSettings
+from .correlation import CorrelationIdFilter
+
+__all__ = [
+    'JsonFormatter',
+    'configure_logging'
+]
+
+TEXT_FORMAT = '%(asctime)s %(levelname)s [%(correlation_id)s]: %(message)s'
+
+
+class JsonFormatter(logging.Formatter):
+    """
+    Форматирует запись в одну JSON строку. Поля из extra={'fields': {...}}
+    попадают в запись как есть, чтобы их можно было фильтровать в
+    агрегаторе логов
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry: Dict[str, Any] = {
+            'ts': datetime.fromtimestamp(
+                record.created, tz=timezone.utc).isoformat(),
+            'level': record.levelname,
+            'logger': record.name,
+            'correlation_id': getattr(record, 'correlation_id', '-'),
+            'message': record.getMessage(),
+        }
+        entry.update(getattr(record, 'fields', {}))
+        if record.exc_info:
+            entry['exc_info'] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+def configure_logging() -> None:
+    """
+    Настраивает корневой логгер приложения: уровень, формат (text/json)
+    и correlation id в каждой записи
+    """
+    handler = logging.StreamHandler()
+    handler.addFilter(CorrelationIdFilter())
+    if LoggingSettings.LOG_FORMAT == 'json':
+        handler.setFormatter(JsonFormatter())
+    else:
+        handler.setFormatter(logging.Formatter(TEXT_FORMAT))
+    logging.basicConfig(
+        level=LoggingSettings.LOG_LEVEL,
+        handlers=[handler],
+        force=True
+    )
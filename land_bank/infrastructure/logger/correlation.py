@@ -0,0 +1,57 @@
+import logging
+import re
+from contextvars import ContextVar
+from uuid import uuid4
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+__all__ = [
+    'CORRELATION_ID',
+    'CorrelationIdFilter',
+    'CorrelationIdMiddleware'
+]
+
+CORRELATION_ID: ContextVar[str] = ContextVar('correlation_id', default='-')
+
+_VALID_CORRELATION_ID = re.compile(r'^[\w\-.]{1,64}$')
+
+
+class CorrelationIdFilter(logging.Filter):
+    """Добавляет в каждую запись лога correlation id текущего запроса"""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.correlation_id = CORRELATION_ID.get()
+        return True
+
+
+class CorrelationIdMiddleware:
+    """
+    ASGI middleware: берет correlation id из заголовка X-Request-ID или
+    генерирует новый и возвращает его в ответе
+    """
+    HEADER = 'X-Request-ID'
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        correlation_id = Headers(scope=scope).get(self.HEADER, '')
+        if not _VALID_CORRELATION_ID.match(correlation_id):
+            correlation_id = uuid4().hex
+
+        async def send_with_header(message: Message) -> None:
+            if message['type'] == 'http.response.start':
+                MutableHeaders(scope=message).append(
+                    self.HEADER, correlation_id)
+            await send(message)
+
+        token = CORRELATION_ID.set(correlation_id)
+        try:
+            await self.app(scope, receive, send_with_header)
+        finally:
+            CORRELATION_ID.reset(token)
@@ -0,0 +1 @@
+from .registry import Counter, Histogram, MetricsRegistry, registry
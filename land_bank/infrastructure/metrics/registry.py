@@ -0,0 +1,180 @@
+from abc import ABC, abstractmethod
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+__all__ = [
+    'Counter',
+    'Histogram',
+    'MetricsRegistry',
+    'registry'
+]
+
+LabelValues = Tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    return (
+        value.replace('\\', '\\\\')
+        .replace('\n', '\\n')
+        .replace('"', '\\"')
+    )
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ''
+    pairs = ','.join(
+        f'{name}="{_escape(str(value))}"'
+        for name, value in zip(names, values)
+    )
+    return '{' + pairs + '}'
+
+
+def _format_value(value: float) -> str:
+    if value == float('inf'):
+        return '+Inf'
+    return repr(float(value))
+
+
+class _Metric(ABC):
+    TYPE: str = 'untyped'
+
+    def __init__(
+            self,
+            name: str,
+            documentation: str,
+            label_names: Sequence[str] = ()
+    ):
+        """
+        :param name: Название метрики в формате Prometheus
+        :param documentation: Описание метрики (# HELP)
+        :param label_names: Названия меток
+        """
+        self.name: str = name
+        self.documentation: str = documentation
+        self.label_names: Tuple[str, ...] = tuple(label_names)
+
+    def _label_values(self, values: Sequence[str]) -> LabelValues:
+        if len(values) != len(self.label_names):
+            raise ValueError(
+                f'Metric {self.name} expects labels {self.label_names}')
+        return tuple(str(value) for value in values)
+
+    @abstractmethod
+    def samples(self) -> Iterable[str]:
+        """Строки значений метрики в формате Prometheus"""
+
+    def render(self) -> str:
+        lines = [
+            f'# HELP {self.name} {self.documentation}',
+            f'# TYPE {self.name} {self.TYPE}',
+        ]
+        lines.extend(self.samples())
+        return '\n'.join(lines)
+
+
+class Counter(_Metric):
+    """Монотонно возрастающий счетчик"""
+    TYPE = 'counter'
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.__values: Dict[LabelValues, float] = {}
+
+    def inc(self, *label_values: str, amount: float = 1.0) -> None:
+        key = self._label_values(label_values)
+        self.__values[key] = self.__values.get(key, 0.0) + amount
+
+    def samples(self) -> Iterable[str]:
+        for key, value in self.__values.items():
+            labels = _format_labels(self.label_names, key)
+            yield f'{self.name}{labels} {_format_value(value)}'
+
+
+class Histogram(_Metric):
+    """Распределение значений по корзинам (buckets)"""
+    TYPE = 'histogram'
+    DEFAULT_BUCKETS: Tuple[float, ...] = (
+        .005, .01, .025, .05, .1, .25, .5, 1.0, 2.5, 5.0, 10.0
+    )
+
+    def __init__(
+            self,
+            *args,
+            buckets: Sequence[float] = DEFAULT_BUCKETS,
+            **kwargs
+    ):
+        super().__init__(*args, **kwargs)
+        self.buckets: Tuple[float, ...] = tuple(sorted(buckets)) + (
+            float('inf'),)
+        self.__counts: Dict[LabelValues, List[int]] = {}
+        self.__sums: Dict[LabelValues, float] = {}
+
+    def observe(self, value: float, *label_values: str) -> None:
+        key = self._label_values(label_values)
+        counts = self.__counts.get(key)
+        if counts is None:
+            counts = self.__counts[key] = [0] * len(self.buckets)
+            self.__sums[key] = 0.0
+        for index, upper_bound in enumerate(self.buckets):
+            if value <= upper_bound:
+                counts[index] += 1
+                break
+        self.__sums[key] += value
+
+    def samples(self) -> Iterable[str]:
+        label_names = self.label_names + ('le',)
+        for key, counts in self.__counts.items():
+            cumulative = 0
+            for upper_bound, count in zip(self.buckets, counts):
+                cumulative += count
+                labels = _format_labels(
+                    label_names, key + (_format_value(upper_bound),))
+                yield f'{self.name}_bucket{labels} {cumulative}'
+            labels = _format_labels(self.label_names, key)
+            yield f'{self.name}_sum{labels} {_format_value(self.__sums[key])}'
+            yield f'{self.name}_count{labels} {cumulative}'
+
+
+class MetricsRegistry:
+    """
+    Реестр метрик процесса. Каждый воркер gunicorn хранит свои значения,
+    поэтому метрики собираются с каждого воркера отдельно
+    """
+
+    def __init__(self):
+        self.__metrics: Dict[str, _Metric] = {}
+
+    def register(self, metric: _Metric) -> _Metric:
+        if metric.name in self.__metrics:
+            raise ValueError(f'Metric {metric.name} is already registered')
+        self.__metrics[metric.name] = metric
+        return metric
+
+    def counter(
+            self,
+            name: str,
+            documentation: str,
+            label_names: Sequence[str] = ()
+    ) -> Counter:
+        return self.register(  # type: ignore
+            Counter(name, documentation, label_names))
+
+    def histogram(
+            self,
+            name: str,
+            documentation: str,
+            label_names: Sequence[str] = (),
+            buckets: Sequence[float] = Histogram.DEFAULT_BUCKETS
+    ) -> Histogram:
+        return self.register(  # type: ignore
+            Histogram(name, documentation, label_names, buckets=buckets))
+
+    def render(self) -> str:
+        """
+        :return: Все метрики в текстовом формате Prometheus
+        """
+        return '\n'.join(
+            metric.render() for metric in self.__metrics.values()) + '\n'
+
+
+registry: MetricsRegistry = MetricsRegistry()
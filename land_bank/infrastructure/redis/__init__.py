@@ -1 +1,2 @@
+from .cache import SignatureCache, VersionedCache
 from .session import redis, RedisObject, RedisService
@@ -0,0 +1,130 @@
+import asyncio
+import hashlib
+import json
+import logging
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Generic,
+    Optional,
+    Tuple,
+    TypeVar
+)
+
+from aioredis import RedisError
+from fastapi.encoders import jsonable_encoder
+
+from .session import redis
+
+__all__ = [
+    'VersionedCache',
+    'SignatureCache'
+]
+
+T = TypeVar('T')
+
+
+def _dump_json(value) -> str:
+    return json.dumps(
+        jsonable_encoder(value), sort_keys=True, ensure_ascii=False)
+
+
+def _compute_etag(value) -> str:
+    return hashlib.sha1(_dump_json(value).encode()).hexdigest()
+
+
+class VersionedCache(Generic[T]):
+    """
+    Read-through кэш редко меняющихся данных в памяти процесса.
+    Версия данных хранится в Redis: инвалидация увеличивает ее, и все
+    воркеры перечитывают данные при следующем обращении. Если Redis
+    недоступен, данные читаются напрямую через loader
+    """
+
+    def __init__(self, name: str, loader: Callable[[], Awaitable[T]]):
+        self.__version_key: str = f'cache_version:{name}'
+        self.__loader: Callable[[], Awaitable[T]] = loader
+        self.__lock: asyncio.Lock = asyncio.Lock()
+        self.__entry: Optional[Tuple[T, str]] = None
+        self.__version: Optional[bytes] = None
+
+    async def get(self) -> Tuple[T, str]:
+        """
+        Возвращает данные и их ETag, загружая их только при смене версии
+        :return: (данные, ETag)
+        """
+        try:
+            version: bytes = await redis.get(self.__version_key) or b'0'
+        except RedisError as error:
+            logging.warning(
+                'Cache %s: version check failed: %r',
+                self.__version_key, error)
+            value: T = await self.__loader()
+            return value, _compute_etag(value)
+
+        entry: Optional[Tuple[T, str]] = self.__entry
+        if entry is not None and self.__version == version:
+            return entry
+
+        async with self.__lock:
+            entry = self.__entry
+            if entry is None or self.__version != version:
+                value = await self.__loader()
+                entry = value, _compute_etag(value)
+                self.__entry, self.__version = entry, version
+            return entry
+
+    async def invalidate(self) -> None:
+        """Увеличивает версию данных, сбрасывая кэш во всех воркерах"""
+        self.__entry = None
+        try:
+            await redis.incr(self.__version_key)
+        except RedisError as error:
+            logging.warning(
+                'Cache %s: invalidation failed: %r',
+                self.__version_key, error)
+
+
+class SignatureCache:
+    """
+    Кэш результатов в Redis с коротким TTL по сигнатуре параметров
+    запроса. Значения должны сериализоваться в JSON. Без инвалидации:
+    данные могут отставать не больше чем на TTL. Если Redis недоступен,
+    данные читаются напрямую через loader
+    """
+
+    def __init__(self, name: str, ttl_seconds: int):
+        self.__name: str = name
+        self.__ttl_seconds: int = ttl_seconds
+
+    def __key(self, signature: Any) -> str:
+        digest = hashlib.sha1(_dump_json(signature).encode()).hexdigest()
+        return f'cache:{self.__name}:{digest}'
+
+    async def get(
+            self,
+            signature: Any,
+            loader: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """
+        Возвращает значение для сигнатуры, вызывая loader при промахе
+        :param signature: Параметры запроса, сериализуемые в JSON
+        :param loader: Функция загрузки значения
+        :return: Значение
+        """
+        key: str = self.__key(signature)
+        try:
+            cached: Optional[bytes] = await redis.get(key)
+        except RedisError as error:
+            logging.warning('Cache %s: read failed: %r', key, error)
+            return await loader()
+        if cached is not None:
+            return json.loads(cached)
+
+        value = await loader()
+        try:
+            await redis.setex(key, self.__ttl_seconds, _dump_json(value))
+        except RedisError as error:
+            logging.warning('Cache %s: write failed: %r', key, error)
+        return value
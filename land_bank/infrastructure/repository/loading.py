@@ -0,0 +1,61 @@
+from typing import Literal, cast
+
+from sqlalchemy.orm import (
+    MANYTOONE,
+    QueryableAttribute,
+    RelationshipProperty,
+    joinedload,
+    selectinload
+)
+from sqlalchemy.orm.strategy_options import _AbstractLoad
+
+__all__ = [
+    'LoadStrategy',
+    'eager_load'
+]
+
+# auto - joinedload для отношений к одному объекту, selectinload для списков
+LoadStrategy = Literal['auto', 'joined', 'selectin']
+
+
+def _is_joined(attribute: QueryableAttribute, strategy: LoadStrategy) -> bool:
+    if strategy == 'auto':
+        return not attribute.property.uselist
+    return strategy == 'joined'
+
+
+def _is_required(attribute: QueryableAttribute) -> bool:
+    """Связанная запись есть всегда: many-to-one по NOT NULL колонкам"""
+    relationship = cast(RelationshipProperty, attribute.property)
+    return relationship.direction is MANYTOONE and not any(
+        column.nullable for column in relationship.local_columns)
+
+
+def eager_load(
+        *path: QueryableAttribute,
+        strategy: LoadStrategy = 'auto'
+) -> _AbstractLoad:
+    """
+    Опция загрузки цепочки отношений. Отношение к одному объекту
+    подтягивается JOIN'ом в тот же запрос (INNER JOIN, если связь
+    обязательна), список - отдельным запросом WHERE fk IN (...), чтобы
+    JOIN не размножал строки родителя
+    :param path: Цепочка отношений, например
+    Employee.position, Position.permissions
+    :param strategy: auto, либо joined/selectin для всей цепочки
+    :return: Опция для Select.options
+    """
+    if not path:
+        raise ValueError('eager_load expects at least one relationship')
+    head, *tail = path
+    option: _AbstractLoad = (
+        joinedload(head, innerjoin=_is_required(head))
+        if _is_joined(head, strategy) else selectinload(head)
+    )
+    for attribute in tail:
+        option = (
+            option.joinedload(attribute, innerjoin=_is_required(attribute))
+            if _is_joined(attribute, strategy) else
+            option.selectinload(attribute)
+        )
+    return option
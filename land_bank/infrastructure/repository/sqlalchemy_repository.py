@@ -1,13 +1,45 @@
-from typing import Iterable, List, Optional, Type
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Type
+)
+from uuid import UUID
 
-from sqlalchemy import Executable, insert, select, update
+from pydantic import BaseModel
+from sqlalchemy import (
+    ColumnElement,
+    Executable,
+    RowMapping,
+    Select,
+    delete,
+    func,
+    insert,
+    inspect,
+    literal_column,
+    select,
+    tuple_,
+    update
+)
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import QueryableAttribute
 
+from infrastructure.database.explain import Explain, plan_rows
 from infrastructure.database.model import DatabaseEntity
+from infrastructure.exception import rpc_exceptions
 from .interface import Repository
 
 
 class SQLAlchemyRepository(Repository):
+    # Запросы, построенные один раз на процесс: (класс репозитория, ключ)
+    __statements: Dict[Tuple[type, str], Executable] = {}
+
     def __init__(
             self,
             model: Type[DatabaseEntity]
@@ -15,6 +47,42 @@ class SQLAlchemyRepository(Repository):
         """:param model: Модель"""
         self.__model: Type[DatabaseEntity] = model
 
+    def cached_statement(
+            self,
+            key: str,
+            build: Callable[[], Executable]
+    ) -> Executable:
+        """
+        Возвращает запрос из кэша процесса, строя его при первом обращении.
+        Значения в запросе должны передаваться через bindparam, тогда
+        SQLAlchemy также переиспользует скомпилированный SQL
+        :param key: Ключ запроса в пределах репозитория
+        :param build: Функция, строящая запрос
+        :return: Запрос
+        """
+        cache_key: Tuple[type, str] = (type(self), key)
+        statement: Optional[Executable] = self.__statements.get(cache_key)
+        if statement is None:
+            statement = self.__statements[cache_key] = build()
+        return statement
+
+    async def get_cached_record(
+            self,
+            session: AsyncSession,
+            key: str,
+            build: Callable[[], Executable],
+            **params
+    ) -> Optional[DatabaseEntity]:
+        """
+        Возвращает запись по закэшированному запросу
+        :param session: Сессия БД
+        :param key: Ключ запроса в пределах репозитория
+        :param build: Функция, строящая запрос с bindparam
+        :param params: Значения bindparam
+        :return: Запись
+        """
+        return await session.scalar(self.cached_statement(key, build), params)
+
     async def create_record(
             self,
             session: AsyncSession,
@@ -32,6 +100,24 @@ class SQLAlchemyRepository(Repository):
         result = await session.scalar(statement)
         return result
 
+    async def create_records(
+            self,
+            session: AsyncSession,
+            values: Sequence[Dict[str, Any]]
+    ) -> Sequence[DatabaseEntity]:
+        """
+        Создает записи многострочным INSERT ... RETURNING
+        :param session: Сессия БД
+        :param values: Значения записей, все - с одинаковым набором ключей
+        :return: Новые записи в порядке values
+        """
+        if not values:
+            return []
+        statement: Executable = insert(self.__model).returning(
+            self.__model, sort_by_parameter_order=True)
+        result = await session.scalars(statement, values)
+        return result.all()
+
     async def get_record(
             self,
             session: AsyncSession,
@@ -65,7 +151,7 @@ class SQLAlchemyRepository(Repository):
         :return: Список записей
         """
         limit, offset = kwargs.get('limit'), kwargs.get('offset')
-        statement: Executable = (
+        statement: Select = (
             select(self.__model)
             .where(*filters)
             .options(*options)
@@ -82,7 +168,7 @@ class SQLAlchemyRepository(Repository):
             filters,
             options
     ) -> Iterable[DatabaseEntity]:
-        statement: Executable = (
+        statement: Select = (
             select(self.__model)
             .where(*filters)
             .options(*options)
@@ -112,23 +198,90 @@ class SQLAlchemyRepository(Repository):
             self,
             session: AsyncSession,
             *filters,
+            expected_version: Optional[int] = None,
             **values_set
     ) -> DatabaseEntity | None:
         """
-        Обновляет запись и возвращает её
+        Обновляет запись и возвращает её. У версионируемых моделей
+        (с колонкой version) версия увеличивается, а при expected_version
+        запись обновляется, только если её версия совпадает (compare-and-set)
         :param session: Сессия БД
         :param filters: Параметры фильтрации
+        :param expected_version: Версия, которую видел клиент
         :param values_set: Параметры для установки
-        :return: Возвращает обновлённую запись
+        :return: Возвращает обновлённую запись или None, если её нет
+        :raises ConcurrentModificationError: Запись изменена после чтения
         """
+        version_filters = []
+        if expected_version is not None:
+            version_filters.append(self.__version_column() == expected_version)
         statement: Executable = (
             update(self.__model)
-            .where(*filters)
-            .values(**values_set)
+            .where(*filters, *version_filters)
+            .values(**self.__with_next_version(values_set))
             .returning(self.__model)
         )
         result = await session.execute(statement)
-        return result.scalar()
+        record: Optional[DatabaseEntity] = result.scalar()
+        if record is None and version_filters:
+            # Запрос только на неуспешном пути: записи нет или версия другая
+            current_version: Optional[int] = await session.scalar(
+                select(self.__version_column()).where(*filters))
+            if current_version is not None:
+                raise rpc_exceptions.ConcurrentModificationError(
+                    data={'current_version': current_version})
+        return record
+
+    async def update_records(
+            self,
+            session: AsyncSession,
+            *filters,
+            **values_set
+    ) -> Sequence[DatabaseEntity]:
+        """
+        Обновляет все подходящие записи одним UPDATE ... RETURNING
+        :param session: Сессия БД
+        :param filters: Параметры фильтрации
+        :param values_set: Параметры для установки
+        :return: Обновлённые записи
+        """
+        statement: Executable = (
+            update(self.__model)
+            .where(*filters)
+            .values(**self.__with_next_version(values_set))
+            .returning(self.__model)
+        )
+        result = await session.scalars(statement)
+        return result.all()
+
+    def __with_next_version(
+            self,
+            values_set: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        if 'version' not in inspect(self.__model).columns:
+            return values_set
+        return {**values_set, 'version': self.__version_column() + 1}
+
+    def __version_column(self) -> QueryableAttribute[int]:
+        return inspect(self.__model).attrs['version'].class_attribute
+
+    async def select_existing_ids(
+            self,
+            session: AsyncSession,
+            ids: Iterable[UUID]
+    ) -> Set[UUID]:
+        """
+        Проверяет существование записей одним запросом
+        :param session: Сессия БД
+        :param ids: ID записей
+        :return: Те из ids, для которых есть запись
+        """
+        ids = set(ids)
+        if not ids:
+            return set()
+        result = await session.scalars(
+            select(self.__model.id).where(self.__model.id.in_(ids)))
+        return set(result)
 
     async def get_record_with_relationships(
             self,
@@ -142,16 +295,143 @@ class SQLAlchemyRepository(Repository):
         :param options: Параметры подгрузки отношений
         :return:
         """
-        statement: Executable = (
+        statement: Select = (
             select(self.__model)
             .where(*filters)
             .options(*options)
         )
         return await session.scalar(statement)
 
+    def projection_columns(
+            self,
+            schema: Type[BaseModel]
+    ) -> List[ColumnElement]:
+        """
+        Возвращает колонки модели, совпадающие по имени с полями схемы.
+        Поля-отношения и вычисляемые поля схемы пропускаются
+        :param schema: Pydantic схема ответа
+        :return: Список колонок
+        """
+        column_names = inspect(self.__model).columns.keys()
+        return [
+            getattr(self.__model, name)
+            for name in schema.model_fields
+            if name in column_names
+        ]
+
+    async def select_projection(
+            self,
+            session: AsyncSession,
+            columns: Iterable[ColumnElement],
+            filters: Iterable = (),
+            orders: Iterable = (),
+            offset: Optional[int] = None,
+            limit: Optional[int] = None
+    ) -> Sequence[RowMapping]:
+        """
+        Выбирает только указанные колонки и возвращает строки-словари без
+        создания ORM объектов: без identity map и инструментирования.
+        Подходит для списков только для чтения
+        :param session: Сессия БД
+        :param columns: Колонки
+        :param filters: Параметры фильтрации
+        :param orders: Параметры для сортировки
+        :param offset: Смещение
+        :param limit: Количество строк
+        :return: Список строк
+        """
+        statement: Executable = (
+            select(*columns)
+            .where(*filters)
+            .order_by(*orders)
+            .offset(offset)
+            .limit(limit)
+        )
+        result = await session.execute(statement)
+        return result.mappings().all()
+
+    async def select_keyset_page(
+            self,
+            session: AsyncSession,
+            filters: Iterable,
+            keys: Sequence[QueryableAttribute],
+            after: Optional[Sequence] = None,
+            limit: int = 20,
+            options: Iterable = ()
+    ) -> Tuple[Sequence[DatabaseEntity], bool]:
+        """
+        Страница записей по убыванию keys, начиная после курсора.
+        В отличие от OFFSET не перечитывает пропущенные строки: при
+        индексе (фильтр, *keys) стоимость не зависит от номера страницы
+        :param session: Сессия БД
+        :param filters: Параметры фильтрации
+        :param keys: Уникальный в сумме набор колонок сортировки
+        :param after: Значения keys последней записи предыдущей страницы
+        :param limit: Размер страницы
+        :param options: Параметры подгрузки отношений
+        :return: (записи, есть ли следующая страница)
+        """
+        statement: Select = (
+            select(self.__model)
+            .where(*filters)
+            .options(*options)
+            .order_by(*(key.desc() for key in keys))
+            .limit(limit + 1)
+        )
+        if after is not None:
+            statement = statement.where(tuple_(*keys) < tuple_(*after))
+        records = (await session.scalars(statement)).all()
+        return records[:limit], len(records) > limit
+
+    async def count_records(
+            self,
+            session: AsyncSession,
+            filters: Iterable = (),
+            exact_limit: int = 10000
+    ) -> Tuple[int, bool]:
+        """
+        Считает записи точно, пока их не больше exact_limit: подсчет
+        останавливается на exact_limit + 1 строке. Для больших выборок
+        возвращает оценку планировщика из EXPLAIN, не сканируя таблицу
+        :param session: Сессия БД
+        :param filters: Параметры фильтрации
+        :param exact_limit: Максимальное количество для точного подсчета
+        :return: (количество, является ли оно оценкой)
+        """
+        matching: Select = (
+            select(literal_column('1'))
+            .select_from(self.__model)
+            .where(*filters)
+        )
+        total: int = await session.scalar(
+            select(func.count()).select_from(
+                matching.limit(exact_limit + 1).subquery())
+        ) or 0
+        if total <= exact_limit:
+            return total, False
+        estimate: int = plan_rows(await session.scalar(Explain(matching)))
+        return max(estimate, total), True
+
     async def delete_record(
             self,
             session: AsyncSession,
             instance: 'DatabaseEntity'
     ) -> None:
         await session.delete(instance)
+
+    async def delete_records(
+            self,
+            session: AsyncSession,
+            *filters
+    ) -> int:
+        """
+        Удаляет подходящие записи одним DELETE без предварительной выборки
+        :param session: Сессия БД
+        :param filters: Параметры фильтрации
+        :return: Число удалённых записей
+        """
+        result = await session.execute(
+            delete(self.__model).where(*filters),
+            execution_options={'synchronize_session': False}
+        )
+        return result.rowcount
@@ -0,0 +1,2 @@
+from .batch import BatchEntrypoint
+from .middlewares import query_stats_middleware, rpc_metrics_middleware
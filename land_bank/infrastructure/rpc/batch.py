@@ -0,0 +1,120 @@
+from typing import Any, List
+
+from fastapi import BackgroundTasks, Request, Response
+from fastapi_jsonrpc import (
+    Entrypoint,
+    EntrypointRoute,
+    InvalidRequest,
+    MethodRoute,
+    NoContent
+)
+
+from infrastructure.database.transaction import (
+    BATCH_TRANSACTION,
+    BatchTransaction
+)
+from infrastructure.exception import rpc_exceptions
+from infrastructure.settings import AppSettings
+from .etag import etag_matches, result_etag
+
+__all__ = [
+    'BatchEntrypoint',
+    'BatchEntrypointRoute'
+]
+
+
+def _rollback_responses(
+        responses: List[dict],
+        write_request_ids: List[Any]
+) -> List[dict]:
+    """
+    Заменяет успешные ответы пишущих вызовов на ошибку транзакции,
+    если общая транзакция пакета не была зафиксирована
+    """
+    error: dict = rpc_exceptions.TransactionError(
+        data='Batch transaction was rolled back').get_resp()['error']
+    return [
+        {'jsonrpc': '2.0', 'error': error, 'id': response['id']}
+        if 'result' in response and response['id'] in write_request_ids
+        else response
+        for response in responses
+    ]
+
+
+class BatchEntrypointRoute(EntrypointRoute):
+    """
+    Выполняет пакетный запрос так: зависимости уровня entrypoint
+    (аутентификация) решаются один раз, читающие вызовы идут параллельно,
+    пишущие - последовательно в одной транзакции, которая фиксируется
+    после завершения всего пакета.
+    Одиночный вызов читающего метода получает ETag результата и ответ
+    304 без тела, если результат совпал с If-None-Match
+    """
+
+    async def handle_http_request(self, http_request: Request):
+        response: Response = await super().handle_http_request(http_request)
+        if response.status_code == 304:
+            del response.headers['content-length']
+        return response
+
+    async def parse_body(self, http_request: Request) -> Any:
+        body: Any = await super().parse_body(http_request)
+        if (isinstance(body, list)
+                and len(body) > AppSettings.RPC_BATCH_MAX_SIZE):
+            raise InvalidRequest(data={'errors': [{
+                'loc': (), 'type': 'value_error.batch_size',
+                'msg': f'batch size exceeds '
+                       f'{AppSettings.RPC_BATCH_MAX_SIZE} calls'
+            }]})
+        return body
+
+    async def handle_body(
+            self,
+            http_request: Request,
+            background_tasks: BackgroundTasks,
+            sub_response: Response,
+            body: Any,
+    ) -> Any:
+        if not isinstance(body, list):
+            content = await super().handle_body(
+                http_request, background_tasks, sub_response, body)
+            if 'result' not in content or not self.is_read_only_call(body):
+                return content
+            etag: str = result_etag(content['result'])
+            sub_response.headers['ETag'] = etag
+            if etag_matches(http_request.headers.get('If-None-Match'), etag):
+                sub_response.status_code = 304
+                raise NoContent
+            return content
+
+        batch = BatchTransaction()
+        token = BATCH_TRANSACTION.set(batch)
+        try:
+            content = await super().handle_body(
+                http_request, background_tasks, sub_response, body)
+        except NoContent:
+            content = None
+        except BaseException:
+            await batch.close()
+            raise
+        finally:
+            BATCH_TRANSACTION.reset(token)
+
+        if not await batch.commit() and content is not None:
+            content = _rollback_responses(content, batch.write_request_ids)
+        if content is None:
+            raise NoContent
+        return content
+
+    def is_read_only_call(self, body: Any) -> bool:
+        """Вызван метод, выполняемый в in_read_only_transaction"""
+        method = body.get('method') if isinstance(body, dict) else None
+        for route in self.entrypoint.routes:
+            if isinstance(route, MethodRoute) and route.name == method:
+                return getattr(route.func, 'is_read_only', False)
+        return False
+
+
+class BatchEntrypoint(Entrypoint):
+    """Entrypoint с общей транзакцией для пакетных запросов"""
+    entrypoint_route_class = BatchEntrypointRoute
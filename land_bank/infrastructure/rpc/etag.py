@@ -0,0 +1,38 @@
+import hashlib
+import json
+from typing import Any, Optional
+
+__all__ = [
+    'result_etag',
+    'etag_matches'
+]
+
+
+def result_etag(result: Any) -> str:
+    """
+    Слабый ETag результата JSON-RPC вызова. Считается по результату без
+    id запроса, поэтому совпадает у повторных вызовов с тем же ответом
+    :param result: Сериализованный результат метода
+    :return: Значение заголовка ETag
+    """
+    serialized = json.dumps(
+        result, ensure_ascii=False, separators=(',', ':')).encode()
+    return f'W/"{hashlib.blake2b(serialized, digest_size=16).hexdigest()}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Слабое сравнение If-None-Match с ETag
+    :param if_none_match: Значение заголовка If-None-Match
+    :param etag: Текущий ETag
+    :return: True, если у клиента уже есть актуальный результат
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == '*':
+        return True
+    opaque_tag = etag.removeprefix('W/')
+    return any(
+        tag.strip().removeprefix('W/') == opaque_tag
+        for tag in if_none_match.split(',')
+    )
@@ -0,0 +1,76 @@
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+from fastapi_jsonrpc import JsonRpcContext, MethodRoute
+
+from infrastructure.database.query_stats import collect_query_stats
+from infrastructure.metrics import registry
+
+__all__ = [
+    'rpc_method_name',
+    'rpc_metrics_middleware',
+    'query_stats_middleware'
+]
+
+RPC_CALLS = registry.counter(
+    'land_bank_rpc_calls_total',
+    'JSON-RPC calls by method and result code (0 - success)',
+    label_names=('method', 'code')
+)
+RPC_LATENCY = registry.histogram(
+    'land_bank_rpc_call_duration_seconds',
+    'JSON-RPC call latency including dependencies',
+    label_names=('method',)
+)
+
+
+def rpc_method_name(ctx: JsonRpcContext) -> str:
+    """
+    Возвращает название вызванного метода. Неизвестные entrypoint'у методы
+    сводятся к "unknown", чтобы произвольные строки из запросов не
+    порождали новые метки метрик
+    :param ctx: Контекст JSON-RPC вызова
+    :return: Название метода
+    """
+    if ctx.method_route is not None:
+        return ctx.method_route.name
+    if not isinstance(ctx.raw_request, dict):
+        return 'unknown'
+    method = ctx.raw_request.get('method')
+    for route in ctx.entrypoint.routes:
+        if isinstance(route, MethodRoute) and route.name == method:
+            return method
+    return 'unknown'
+
+
+def rpc_result_code(ctx: JsonRpcContext) -> str:
+    """
+    :param ctx: Контекст завершенного JSON-RPC вызова
+    :return: Код ошибки из rpc_exceptions или "0" для успешного вызова
+    """
+    if ctx.raw_response is None:
+        return 'http_error'
+    error = ctx.raw_response.get('error')
+    if error is None:
+        return '0'
+    return str(error.get('code'))
+
+
+@asynccontextmanager
+async def rpc_metrics_middleware(ctx: JsonRpcContext) -> AsyncIterator[None]:
+    """Считает вызовы, коды ошибок и время выполнения JSON-RPC методов"""
+    started_at = time.perf_counter()
+    try:
+        yield
+    finally:
+        method = rpc_method_name(ctx)
+        RPC_LATENCY.observe(time.perf_counter() - started_at, method)
+        RPC_CALLS.inc(method, rpc_result_code(ctx))
+
+
+@asynccontextmanager
+async def query_stats_middleware(ctx: JsonRpcContext) -> AsyncIterator[None]:
+    """Привязывает статистику SQL запросов к JSON-RPC методу"""
+    with collect_query_stats(rpc_method_name(ctx)):
+        yield
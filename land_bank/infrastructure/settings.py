@@ -11,6 +11,9 @@ __all__ = [
     'AMQPSettings',
     'S3Settings',
     'RedisSettings',
+    'MonitoringSettings',
+    'CompressionSettings',
+    'LoggingSettings',
     'TestDatabaseSettings'
 ]
 
@@ -22,6 +25,9 @@ class DatabaseSettings:
     POSTGRES_PORT: int = int(os.getenv('POSTGRES_PORT', 5432))
     POSTGRES_USER: str = os.getenv('POSTGRES_USER', 'root')
     POSTGRES_PASSWORD: str = os.getenv('POSTGRES_PASSWORD', '')
+    # Connection pool
+    POOL_SIZE: int = int(os.getenv('POSTGRES_POOL_SIZE', 5))
+    MAX_OVERFLOW: int = int(os.getenv('POSTGRES_MAX_OVERFLOW', 10))
 
 
 class AppSettings:
@@ -36,6 +42,37 @@ class AppSettings:
     FRONTEND_HOST: str = os.getenv('FRONTEND_HOST', '')
     TESTING_APP: bool = bool(os.getenv('TESTING_APP', False))
 
+    # JSON-RPC
+    RPC_BATCH_MAX_SIZE: int = int(os.getenv('RPC_BATCH_MAX_SIZE', 20))
+
+    # Pagination totals
+    EXACT_COUNT_LIMIT: int = int(os.getenv('EXACT_COUNT_LIMIT', 10000))
+    COUNT_CACHE_TTL_SECONDS: int = int(
+        os.getenv('COUNT_CACHE_TTL_SECONDS', 30))
+
+    # Land area import
+    IMPORT_BATCH_SIZE: int = int(os.getenv('IMPORT_BATCH_SIZE', 1000))
+    IMPORT_MAX_REPORTED_ERRORS: int = int(
+        os.getenv('IMPORT_MAX_REPORTED_ERRORS', 1000))
+
+    # Land area export
+    EXPORT_PARTITION_SIZE: int = int(os.getenv('EXPORT_PARTITION_SIZE', 1000))
+
+    # Dashboard
+    DASHBOARD_REFRESH_SECONDS: int = int(
+        os.getenv('DASHBOARD_REFRESH_SECONDS', 300))
+
+    # Task deadline reminders
+    DEADLINE_SCAN_SECONDS: int = int(os.getenv('DEADLINE_SCAN_SECONDS', 900))
+    DEADLINE_REMINDER_HOURS: int = int(
+        os.getenv('DEADLINE_REMINDER_HOURS', 24))
+    DEADLINE_REMINDER_BATCH_SIZE: int = int(
+        os.getenv('DEADLINE_REMINDER_BATCH_SIZE', 500))
+
+    # Change feed
+    CHANGE_FEED_LAG_SECONDS: int = int(
+        os.getenv('CHANGE_FEED_LAG_SECONDS', 10))
+
 
 class RedisSettings:
     # Redis
@@ -65,6 +102,35 @@ class AMQPSettings:
     AMQP_PORT: str = os.getenv('AMQP_PORT', '')
 
 
+class MonitoringSettings:
+    # Slow query / N+1 detection
+    SLOW_QUERY_MS: float = float(os.getenv('SLOW_QUERY_MS', 200))
+    SLOW_RPC_DB_TIME_MS: float = float(os.getenv('SLOW_RPC_DB_TIME_MS', 500))
+    SLOW_RPC_STATEMENTS: int = int(os.getenv('SLOW_RPC_STATEMENTS', 15))
+
+
+class CompressionSettings:
+    # Допустимые кодировки в порядке предпочтения. По умолчанию только
+    # gzip; br включается явно ('br,gzip') и используется, только если
+    # установлен пакет brotli. Пустая строка выключает сжатие
+    COMPRESSION_ENCODINGS: str = os.getenv('COMPRESSION_ENCODINGS', 'gzip')
+    # Ответы меньше порога отдаются как есть
+    COMPRESSION_MIN_SIZE: int = int(os.getenv('COMPRESSION_MIN_SIZE', 1024))
+    COMPRESSION_GZIP_LEVEL: int = int(
+        os.getenv('COMPRESSION_GZIP_LEVEL', 6))
+    COMPRESSION_BROTLI_QUALITY: int = int(
+        os.getenv('COMPRESSION_BROTLI_QUALITY', 4))
+
+
+class LoggingSettings:
+    LOG_LEVEL: str = os.getenv('LOG_LEVEL', 'INFO').upper()
+    # text | json
+    LOG_FORMAT: str = os.getenv('LOG_FORMAT', 'text').lower()
+    # Доля успешных транзакций, попадающих в лог (ошибки логируются всегда)
+    TRANSACTION_LOG_SAMPLE_RATE: float = float(
+        os.getenv('TRANSACTION_LOG_SAMPLE_RATE', 1.0))
+
+
 class TestDatabaseSettings:
     TEST_DB: str = os.getenv('TEST_DB', 'postgres')
     TEST_HOST: str = os.getenv('TEST_HOST', 'localhost')
@@ -2,7 +2,9 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi_jsonrpc import API
 
 from endpoint import rest, rpc
-from infrastructure import application
+from infrastructure import application, rpc as rpc_infrastructure
+from infrastructure.compression import CompressionMiddleware
+from infrastructure.logger import CorrelationIdMiddleware
 from infrastructure.settings import AppSettings
 
 RPC_ENTRYPOINTS = (
@@ -12,21 +14,35 @@ RPC_ENTRYPOINTS = (
     rpc.land_area.router,
     rpc.scheduler.router,
     rpc.juristic_data.router,
-    rpc.extra_data.router
+    rpc.extra_data.router,
+    rpc.dashboard.router,
+    rpc.change_feed.router,
+    rpc.batch.router
 )
 
 REST_ENTRYPOINT = (
     rest.employee.router,
+    rest.land_area.router,
+    rest.metrics.router,
+)
+
+RPC_MIDDLEWARES = (
+    rpc_infrastructure.rpc_metrics_middleware,
+    rpc_infrastructure.query_stats_middleware,
 )
 
 app: API = application.create_app(
     rpc_entrypoints=RPC_ENTRYPOINTS,
-    rest_entrypoints=REST_ENTRYPOINT)
+    rest_entrypoints=REST_ENTRYPOINT,
+    rpc_middlewares=RPC_MIDDLEWARES)
 
 app.add_middleware(
     CORSMiddleware,
     allow_origins=[AppSettings.FRONTEND_HOST],
     allow_credentials=True,
     allow_methods=['POST'],
-    allow_headers=['*']
+    allow_headers=['*'],
+    expose_headers=['X-Request-ID', 'ETag']
 )
+app.add_middleware(CompressionMiddleware)
+app.add_middleware(CorrelationIdMiddleware)
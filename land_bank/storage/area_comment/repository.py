@@ -1,9 +1,12 @@
+from typing import Optional, Sequence, Tuple
 from uuid import UUID
 
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
+from domain.request_params.schema import KeysetCursor
 from infrastructure.database.model import AreaComment
+from infrastructure.repository.loading import eager_load
 from infrastructure.repository.sqlalchemy_repository import SQLAlchemyRepository
 
 __all__ = [
@@ -32,7 +35,7 @@ class AreaCommentRepository(SQLAlchemyRepository):
         return await self.get_record_with_relationships(
             session,
             filters=[AreaComment.id == comment.id],
-            options=[selectinload(AreaComment.employee)]
+            options=[eager_load(AreaComment.employee)]
         )
 
     async def edit_comment(
@@ -53,7 +56,7 @@ class AreaCommentRepository(SQLAlchemyRepository):
         return await self.get_record_with_relationships(
             session,
             filters=[AreaComment.id == updated_comment.id],
-            options=[selectinload(AreaComment.employee)]
+            options=[eager_load(AreaComment.employee)]
         )
 
     async def delete_comment(
@@ -61,3 +64,37 @@ class AreaCommentRepository(SQLAlchemyRepository):
             session: AsyncSession,
             area_comment: AreaComment) -> None:
         await self.delete_record(session, area_comment)
+
+    async def get_comment_page(
+            self,
+            session: AsyncSession,
+            land_area_id: UUID,
+            limit: int,
+            after: Optional[KeysetCursor] = None
+    ) -> Tuple[Sequence[AreaComment], bool]:
+        """
+        Комментарии участка с авторами, от новых к старым
+        :param session: Сессия БД
+        :param land_area_id: ID участка
+        :param limit: Размер страницы
+        :param after: Последний комментарий предыдущей страницы
+        :return: (комментарии, есть ли следующая страница)
+        """
+        return await self.select_keyset_page(
+            session,
+            filters=[AreaComment.land_area_id == land_area_id],
+            keys=[AreaComment.created_at, AreaComment.id],
+            after=(after.created_at, after.id) if after else None,
+            limit=limit,
+            options=[eager_load(AreaComment.employee)]
+        )
+
+    async def count_comments(
+            self,
+            session: AsyncSession,
+            land_area_id: UUID
+    ) -> int:
+        return await session.scalar(
+            select(func.count())
+            .where(AreaComment.land_area_id == land_area_id)
+        ) or 0
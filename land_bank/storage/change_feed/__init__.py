@@ -0,0 +1 @@
+from .repository import ChangeFeedRepository
@@ -0,0 +1,107 @@
+from datetime import timedelta
+from typing import Iterable, Optional, Sequence, Tuple, Type
+from uuid import UUID
+
+from sqlalchemy import insert, literal, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import QueryableAttribute
+
+from domain.change_feed.schema import ChangeEntity, ChangePosition
+from infrastructure.database.model import (
+    DatabaseEntity,
+    UTC_NOW,
+    DeletedRecord,
+    LandArea,
+    LandAreaTask
+)
+
+__all__ = ['ChangeFeedRepository']
+
+
+class ChangeFeedRepository:
+    async def record_deletions(
+            self,
+            session: AsyncSession,
+            entity: ChangeEntity,
+            ids: Iterable[UUID]
+    ) -> None:
+        """
+        Сохраняет записи об удалении в той же транзакции, что и DELETE
+        :param session: Сессия БД
+        :param entity: Тип удаленных записей
+        :param ids: ID удаленных записей
+        """
+        values = [{'entity': entity, 'entity_id': id_} for id_ in ids]
+        if values:
+            await session.execute(insert(DeletedRecord), values)
+
+    async def get_land_areas_changed(
+            self,
+            session: AsyncSession,
+            after: Optional[ChangePosition],
+            lag: timedelta,
+            limit: int
+    ) -> Tuple[Sequence[LandArea], bool]:
+        return await self.__select_changed(
+            session, LandArea, LandArea.updated_at, after, lag, limit)
+
+    async def get_tasks_changed(
+            self,
+            session: AsyncSession,
+            after: Optional[ChangePosition],
+            lag: timedelta,
+            limit: int
+    ) -> Tuple[Sequence[LandAreaTask], bool]:
+        return await self.__select_changed(
+            session, LandAreaTask, LandAreaTask.updated_at, after, lag,
+            limit)
+
+    async def get_deleted(
+            self,
+            session: AsyncSession,
+            after: Optional[ChangePosition],
+            lag: timedelta,
+            limit: int
+    ) -> Tuple[Sequence[DeletedRecord], bool]:
+        return await self.__select_changed(
+            session, DeletedRecord, DeletedRecord.deleted_at, after, lag,
+            limit)
+
+    async def __select_changed(
+            self,
+            session: AsyncSession,
+            model: Type[DatabaseEntity],
+            changed_at: QueryableAttribute,
+            after: Optional[ChangePosition],
+            lag: timedelta,
+            limit: int
+    ) -> Tuple[Sequence[DatabaseEntity], bool]:
+        """
+        Записи, измененные после позиции after, по возрастанию
+        (changed_at, id). Читается по индексу (changed_at, id) без
+        сортировки и без OFFSET.
+        changed_at - момент начала пишущей транзакции, а видна запись
+        становится после фиксации. Изменения моложе lag не отдаются, чтобы
+        начатая раньше транзакция не зафиксировалась позади курсора.
+        Граница считается по часам БД, как и сами changed_at
+        :param session: Сессия БД
+        :param model: Модель
+        :param changed_at: Колонка момента изменения
+        :param after: Последняя запись предыдущей порции
+        :param lag: Задержка, с которой отдаются изменения
+        :param limit: Размер порции
+        :return: (записи, есть ли следующая порция)
+        """
+        keys = (changed_at, model.id)
+        statement = (
+            select(model)
+            .where(changed_at < UTC_NOW - lag)
+            .order_by(*keys)
+            .limit(limit + 1)
+        )
+        if after is not None:
+            statement = statement.where(
+                tuple_(*keys) > tuple_(
+                    literal(after.changed_at), literal(after.id)))
+        records = (await session.scalars(statement)).all()
+        return records[:limit], len(records) > limit
@@ -0,0 +1,103 @@
+from datetime import datetime
+from typing import Sequence
+
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from infrastructure.database.model import (
+    FINAL_TASK_STATUSES,
+    LandArea,
+    LandAreaRollup,
+    LandAreaTask,
+    TaskRollup
+)
+
+__all__ = ['DashboardRepository']
+
+
+class DashboardRepository:
+    async def refresh_rollups(
+            self,
+            session: AsyncSession,
+            refreshed_at: datetime
+    ) -> None:
+        """
+        Пересчитывает агрегаты участков и задач. Выполняется в одной
+        транзакции: до ее фиксации читатели видят предыдущие агрегаты.
+        Параллельный пересчет упадет на ограничении уникальности и будет
+        откатан
+        :param session: Сессия БД
+        :param refreshed_at: Момент пересчета, от него считается просрочка
+        """
+        land_area_rows = await session.execute(
+            select(
+                LandArea.stage,
+                LandArea.working_status,
+                LandArea.area_category,
+                func.count().label('land_area_count'),
+                func.coalesce(
+                    func.sum(LandArea.area_square), 0
+                ).label('area_square_sum'),
+                func.coalesce(
+                    func.sum(LandArea.cadastral_cost), 0
+                ).label('cadastral_cost_sum')
+            )
+            .group_by(
+                LandArea.stage, LandArea.working_status,
+                LandArea.area_category
+            )
+        )
+        tasks = select(
+            LandAreaTask.executor_id,
+            LandAreaTask.status,
+            (
+                (LandAreaTask.deadline < refreshed_at)
+                & LandAreaTask.status.not_in(FINAL_TASK_STATUSES)
+            ).label('is_overdue')
+        ).subquery()
+        task_rows = await session.execute(
+            select(
+                tasks.c.executor_id,
+                tasks.c.status,
+                tasks.c.is_overdue,
+                func.count().label('task_count')
+            )
+            .group_by(
+                tasks.c.executor_id, tasks.c.status, tasks.c.is_overdue)
+        )
+
+        await session.execute(delete(LandAreaRollup))
+        await session.execute(delete(TaskRollup))
+        land_area_values = [
+            {**row, 'refreshed_at': refreshed_at}
+            for row in land_area_rows.mappings()
+        ]
+        task_values = [
+            {**row, 'refreshed_at': refreshed_at}
+            for row in task_rows.mappings()
+        ]
+        if land_area_values:
+            await session.execute(insert(LandAreaRollup), land_area_values)
+        if task_values:
+            await session.execute(insert(TaskRollup), task_values)
+
+    async def get_land_area_rollups(
+            self,
+            session: AsyncSession
+    ) -> Sequence[LandAreaRollup]:
+        result = await session.execute(
+            select(LandAreaRollup).order_by(
+                LandAreaRollup.stage, LandAreaRollup.working_status,
+                LandAreaRollup.area_category)
+        )
+        return result.scalars().all()
+
+    async def get_task_rollups(
+            self,
+            session: AsyncSession
+    ) -> Sequence[TaskRollup]:
+        result = await session.execute(
+            select(TaskRollup).order_by(
+                TaskRollup.executor_id, TaskRollup.status)
+        )
+        return result.scalars().all()
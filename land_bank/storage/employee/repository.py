@@ -1,12 +1,13 @@
 from typing import Optional
 from uuid import UUID
 
+from sqlalchemy import bindparam, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
 from application.auth.hasher import Hasher
 from infrastructure.database.model import Employee, PermissionPosition, Position
 from infrastructure.exception import rpc_exceptions
+from infrastructure.repository.loading import eager_load
 from infrastructure.repository.sqlalchemy_repository import SQLAlchemyRepository
 
 __all__ = [
@@ -30,6 +31,25 @@ class EmployeeRepository(SQLAlchemyRepository):
             raise rpc_exceptions.ObjectNotFoundError()
         return employee
 
+    async def get_employee_by_email(
+            self,
+            session: AsyncSession,
+            email: str
+    ) -> Optional[Employee]:
+        """
+        Возвращает пользователя по email или None. Используется при
+        аутентификации каждого запроса, поэтому запрос кэшируется
+        :param session: Сессия БД
+        :param email: Email пользователя
+        :return: Пользователь
+        """
+        return await self.get_cached_record(
+            session, 'get_employee_by_email',
+            lambda: select(Employee).where(
+                Employee.email == bindparam('email')),
+            email=email
+        )
+
     async def get_employee_with_permissions(
             self,
             session: AsyncSession,
@@ -44,9 +64,11 @@ class EmployeeRepository(SQLAlchemyRepository):
         return await (
             self.get_record_with_relationships(
                 session, filters=filters, options=[
-                    selectinload(Employee.position)
-                    .selectinload(Position.permissions)
-                    .selectinload(PermissionPosition.permission)
+                    eager_load(
+                        Employee.position,
+                        Position.permissions,
+                        PermissionPosition.permission
+                    )
                 ]
             ))
 
@@ -73,12 +95,17 @@ class EmployeeRepository(SQLAlchemyRepository):
         :param employee_id: ID сотрудника
         :return:
         """
-        employee: Employee = await self.get_record_with_relationships(
-            session, filters=[Employee.id == employee_id],
-            options=[
-                selectinload(Employee.employee_head),
-                selectinload(Employee.position),
-                selectinload(Employee.department)
-            ]
+        employee: Employee = await self.get_cached_record(
+            session, 'employee_profile',
+            lambda: (
+                select(Employee)
+                .where(Employee.id == bindparam('employee_id'))
+                .options(
+                    eager_load(Employee.employee_head),
+                    eager_load(Employee.position),
+                    eager_load(Employee.department)
+                )
+            ),
+            employee_id=employee_id
         )
         return employee
@@ -24,15 +24,15 @@ class ExtraDataRepository(SQLAlchemyRepository):
             session: AsyncSession,
             *filters,
             **values_set
-    ) -> ExtraAreaData:
+    ) -> Optional[ExtraAreaData]:
         return await self.update_record(session, *filters, **values_set)
 
     async def delete_data(
             self,
             session: AsyncSession,
-            instance: ExtraAreaData
-    ) -> None:
-        await self.delete_record(session, instance)
+            *filters
+    ) -> int:
+        return await self.delete_records(session, *filters)
 
     async def get_data(self, session, *filters) -> Optional[ExtraAreaData]:
         return await self.get_record(session, *filters)
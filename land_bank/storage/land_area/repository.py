@@ -1,16 +1,63 @@
-from typing import Callable, Iterable, List, Optional
+import re
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type
+)
 from uuid import UUID
 
-from sqlalchemy import UnaryExpression, asc, desc
+from pydantic import BaseModel
+from sqlalchemy import (
+    ColumnElement,
+    RowMapping,
+    UnaryExpression,
+    asc,
+    bindparam,
+    desc,
+    func,
+    or_,
+    select
+)
+from sqlalchemy.dialects import postgresql
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import QueryableAttribute, selectinload
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy.orm.strategy_options import _AbstractLoad
 
-from domain.request_params.schema import LimitOffset, SortParams
-from infrastructure.database.model import AreaComment, LandArea
+from domain.land_area.schema import LAND_AREA_RELATIONS, LandAreaRelation
+from domain.request_params.schema import (
+    LandAreaFilterParams,
+    LimitOffset,
+    SortParams
+)
+from infrastructure.database.model import (
+    SEARCH_CONFIG,
+    UTC_NOW,
+    AreaComment,
+    LandArea,
+    LandOwner
+)
+from infrastructure.repository.loading import eager_load
 from infrastructure.repository.sqlalchemy_repository import SQLAlchemyRepository
 
 __all__ = ['LandAreaRepository']
 
+_SEARCH_WORD = re.compile(r'\w+')
+_CADASTRAL_PREFIX = re.compile(r'^[0-9]{2}:[0-9:]*$')
+_RELATION_OPTIONS: Dict[LandAreaRelation, _AbstractLoad] = {
+    'area_buildings': eager_load(LandArea.area_buildings),
+    'owners': eager_load(LandArea.owners),
+    'comments': eager_load(LandArea.comments, AreaComment.employee),
+    'extra_data': eager_load(LandArea.extra_data)
+}
+
 
 class LandAreaRepository(SQLAlchemyRepository):
     def __init__(self):
@@ -19,6 +66,73 @@ class LandAreaRepository(SQLAlchemyRepository):
     async def create_land_area(self, session, **values_set) -> LandArea:
         return await self.create_record(session, **values_set)
 
+    async def upsert_land_areas(
+            self,
+            session: AsyncSession,
+            values: List[Dict[str, Any]]
+    ) -> Dict[str, UUID]:
+        """
+        Создает участки одним INSERT, а участки с уже существующим
+        кадастровым номером обновляет. Кадастровые номера в values должны
+        быть уникальны, все словари - с одинаковым набором ключей
+        :param session: Сессия БД
+        :param values: Значения колонок участков
+        :return: {кадастровый номер: ID участка}
+        """
+        if not values:
+            return {}
+        insert_values = postgresql.insert(LandArea).values(values)
+        statement = insert_values.on_conflict_do_update(
+            index_elements=[LandArea.cadastral_number],
+            set_={
+                **{
+                    name: insert_values.excluded[name]
+                    for name in values[0]
+                    if name != 'cadastral_number'
+                },
+                'version': LandArea.version + 1,
+                # onupdate колонки к ON CONFLICT DO UPDATE не применяется
+                'updated_at': UTC_NOW
+            }
+        ).returning(LandArea.cadastral_number, LandArea.id)
+        result = await session.execute(statement)
+        return {row.cadastral_number: row.id for row in result}
+
+    async def stream_land_areas(
+            self,
+            session: AsyncSession,
+            filter_params: Optional[LandAreaFilterParams],
+            partition_size: int
+    ) -> AsyncIterator[Sequence[LandArea]]:
+        """
+        Читает участки серверным курсором частями по partition_size вместе
+        с собственниками, строениями, ограничениями и видами разрешенного
+        пользования (selectinload - по запросу на отношение на часть).
+        После обработки части ее участки удаляются из сессии, а связанные
+        объекты уходят из слабого identity map вместе с частью, поэтому
+        память не растет с размером выборки
+        :param session: Сессия БД, в которой открыта транзакция
+        :param filter_params: Параметры фильтрации
+        :param partition_size: Количество участков в части
+        :return: Асинхронный итератор частей
+        """
+        result = await session.stream(
+            select(LandArea)
+            .where(*self.__get_filter_expressions(filter_params))
+            .order_by(LandArea.id)
+            .options(
+                selectinload(LandArea.owners),
+                selectinload(LandArea.area_buildings),
+                selectinload(LandArea.limits),
+                selectinload(LandArea.permitted_uses)
+            )
+            .execution_options(yield_per=partition_size)
+        )
+        async for partition in result.scalars().partitions():
+            yield partition
+            for land_area in partition:
+                session.expunge(land_area)
+
     async def get_ordered_lands(
             self,
             session: AsyncSession,
@@ -32,6 +146,138 @@ class LandAreaRepository(SQLAlchemyRepository):
             orders=orders
         )
 
+    async def get_ordered_land_rows(
+            self,
+            session: AsyncSession,
+            limit_offset: LimitOffset,
+            sort_params: Optional[SortParams],
+            schema: Type[BaseModel],
+            filter_params: Optional[LandAreaFilterParams] = None
+    ) -> Sequence[RowMapping]:
+        """
+        Страница участков в виде строк только с колонками схемы ответа
+        :param session: Сессия БД
+        :param limit_offset: Пагинация
+        :param sort_params: Параметры сортировки
+        :param schema: Схема ответа
+        :param filter_params: Параметры фильтрации
+        :return: Список строк
+        """
+        return await self.select_projection(
+            session,
+            columns=self.projection_columns(schema),
+            filters=self.__get_filter_expressions(filter_params),
+            orders=self.__get_sort_expressions(sort_params),
+            offset=limit_offset.offset,
+            limit=limit_offset.limit
+        )
+
+    async def count_land_areas(
+            self,
+            session: AsyncSession,
+            filter_params: Optional[LandAreaFilterParams],
+            exact_limit: int
+    ) -> Tuple[int, bool]:
+        """
+        Количество участков по фильтрам: точное до exact_limit, выше - оценка
+        :param session: Сессия БД
+        :param filter_params: Параметры фильтрации
+        :param exact_limit: Максимальное количество для точного подсчета
+        :return: (количество, является ли оно оценкой)
+        """
+        return await self.count_records(
+            session,
+            filters=self.__get_filter_expressions(filter_params),
+            exact_limit=exact_limit
+        )
+
+    async def search_land_rows(
+            self,
+            session: AsyncSession,
+            query: str,
+            limit_offset: LimitOffset,
+            schema: Type[BaseModel]
+    ) -> Sequence[RowMapping]:
+        """
+        Полнотекстовый поиск участков по названию, адресу, кадастровому
+        номеру и именам собственников. Каждое слово запроса ищется как
+        префикс, запрос вида "66:41:" - как префикс кадастрового номера.
+        Строки отсортированы по релевантности и содержат колонку "rank"
+        :param session: Сессия БД
+        :param query: Поисковая строка
+        :param limit_offset: Пагинация
+        :param schema: Схема ответа
+        :return: Список строк
+        """
+        words: List[str] = _SEARCH_WORD.findall(query)
+        if not words:
+            return []
+        ts_query = func.to_tsquery(
+            SEARCH_CONFIG, ' & '.join(f'{word}:*' for word in words))
+        owner_rank = (
+            select(func.max(func.ts_rank(LandOwner.search_vector, ts_query)))
+            .where(
+                LandOwner.land_area_id == LandArea.id,
+                LandOwner.search_vector.bool_op('@@')(ts_query)
+            )
+            .scalar_subquery()
+        )
+        conditions: List[ColumnElement[bool]] = [
+            LandArea.search_vector.bool_op('@@')(ts_query),
+            LandArea.id.in_(
+                select(LandOwner.land_area_id)
+                .where(LandOwner.search_vector.bool_op('@@')(ts_query))
+            )
+        ]
+        query = query.strip()
+        if _CADASTRAL_PREFIX.match(query):
+            conditions.append(
+                LandArea.cadastral_number.startswith(query, autoescape=True))
+        rank = func.greatest(
+            func.ts_rank(LandArea.search_vector, ts_query),
+            func.coalesce(owner_rank, 0)
+        ).label('rank')
+        return await self.select_projection(
+            session,
+            columns=[*self.projection_columns(schema), rank],
+            filters=[or_(*conditions)],
+            orders=[desc(rank), LandArea.id],
+            offset=limit_offset.offset,
+            limit=limit_offset.limit
+        )
+
+    @staticmethod
+    def __get_filter_expressions(
+            filter_params: Optional[LandAreaFilterParams]
+    ) -> List[ColumnElement]:
+        if not filter_params:
+            return []
+        expressions: List[ColumnElement] = []
+        for field_name in (
+                'stage', 'working_status', 'area_category', 'search_channel'
+        ):
+            values: Optional[List[str]] = getattr(filter_params, field_name)
+            if values:
+                column = getattr(LandArea, field_name)
+                expressions.append(
+                    column == values[0] if len(values) == 1 else
+                    column.in_(values)
+                )
+        ranges: List[Tuple[QueryableAttribute, Any, Any]] = [
+            (LandArea.area_square, filter_params.area_square_from,
+             filter_params.area_square_to),
+            (LandArea.cadastral_cost, filter_params.cadastral_cost_from,
+             filter_params.cadastral_cost_to),
+            (LandArea.entered_at_base, filter_params.entered_from,
+             filter_params.entered_to)
+        ]
+        for column, lower, upper in ranges:
+            if lower is not None:
+                expressions.append(column >= lower)
+            if upper is not None:
+                expressions.append(column <= upper)
+        return expressions
+
     @staticmethod
     def __get_sort_expressions(
             sort_params: Optional[SortParams]
@@ -57,29 +303,78 @@ class LandAreaRepository(SQLAlchemyRepository):
     async def get_land_area_relations(
             self,
             session: AsyncSession,
-            land_area_id: UUID
-    ) -> LandArea:
-        return await self.get_record_with_relationships(
-            session,
-            filters=[LandArea.id == land_area_id],
-            options=[
-                selectinload(LandArea.area_buildings),
-                selectinload(LandArea.owners),
-                selectinload(LandArea.comments).selectinload(
-                    AreaComment.employee),
-                selectinload(LandArea.extra_data)
-            ]
+            land_area_id: UUID,
+            comments_limit: Optional[int] = None,
+            include: Iterable[LandAreaRelation] = LAND_AREA_RELATIONS
+    ) -> Optional[LandArea]:
+        """
+        Участок с запрошенными отношениями: строениями, собственниками,
+        доп. данными и комментариями. Незапрошенные отношения не
+        загружаются
+        :param session: Сессия БД
+        :param land_area_id: ID участка
+        :param comments_limit: Если задан - только столько последних
+        комментариев, иначе все
+        :param include: Загружаемые отношения
+        :return: Участок
+        """
+        relations = set(include)
+        newest_comments_limit: Optional[int] = (
+            comments_limit if 'comments' in relations else None)
+        if newest_comments_limit is not None:
+            relations.discard('comments')
+        loaded = tuple(sorted(relations))
+        land_area: Optional[LandArea] = await self.get_cached_record(
+            session, f'get_land_area_relations:{",".join(loaded)}',
+            lambda: (
+                select(LandArea)
+                .where(LandArea.id == bindparam('land_area_id'))
+                .options(*(_RELATION_OPTIONS[name] for name in loaded))
+            ),
+            land_area_id=land_area_id
+        )
+        if land_area is not None and newest_comments_limit is not None:
+            set_committed_value(
+                land_area, 'comments',
+                await self.__get_newest_comments(
+                    session, land_area_id, newest_comments_limit)
+            )
+        return land_area
+
+    async def __get_newest_comments(
+            self,
+            session: AsyncSession,
+            land_area_id: UUID,
+            comments_limit: int
+    ) -> Sequence[AreaComment]:
+        comments = await session.scalars(
+            self.cached_statement(
+                'newest_area_comments',
+                lambda: (
+                    select(AreaComment)
+                    .where(AreaComment.land_area_id == bindparam(
+                        'land_area_id'))
+                    .order_by(
+                        AreaComment.created_at.desc(), AreaComment.id.desc())
+                    .limit(bindparam('comments_limit'))
+                    .options(eager_load(AreaComment.employee))
+                )
+            ),
+            {'land_area_id': land_area_id, 'comments_limit': comments_limit}
         )
+        return comments.all()
 
     async def update_land_area(
             self,
             session: AsyncSession,
             land_area_id: UUID,
+            expected_version: Optional[int] = None,
             **values_set
     ) -> Optional[LandArea]:
         return await self.update_record(
             session,
             LandArea.id == land_area_id,
+            expected_version=expected_version,
             **values_set)
 
     async def get_area_with_limits_uses(
@@ -87,12 +382,17 @@ class LandAreaRepository(SQLAlchemyRepository):
             session: AsyncSession,
             land_area_id: UUID
     ):
-        return await self.get_record_with_relationships(
-            session, filters=[LandArea.id == land_area_id],
-            options=[
-                selectinload(LandArea.limits),
-                selectinload(LandArea.permitted_uses)
-            ]
+        return await self.get_cached_record(
+            session, 'get_area_with_limits_uses',
+            lambda: (
+                select(LandArea)
+                .where(LandArea.id == bindparam('land_area_id'))
+                .options(
+                    selectinload(LandArea.limits),
+                    selectinload(LandArea.permitted_uses)
+                )
+            ),
+            land_area_id=land_area_id
         )
 
     async def update_limits(
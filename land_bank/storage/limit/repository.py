@@ -2,6 +2,7 @@ from typing import List
 from uuid import UUID
 
 from sqlalchemy import ScalarResult, delete, insert, select
+from sqlalchemy.dialects import postgresql
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from domain.juristic_data.schemas import LimitSchema
@@ -33,21 +34,35 @@ class LimitRepository:
         )
         await session.execute(statement)
 
-    async def create_associations(
+    async def sync_associations(
             self,
             session: AsyncSession,
             land_area_id: UUID,
             schemas: List[LimitSchema]
-    ) -> ScalarResult[LandAreaLimit]:
-        statement = (
-            insert(LandAreaLimit)
+    ) -> None:
+        """
+        Приводит связи участка к переданному списку: удаляет только
+        снятые, добавляет только новые, не трогая неизменившиеся строки
+        :param session: Сессия
+        :param land_area_id: ID земельного участка
+        :param schemas: Итоговый список
+        """
+        ids: List[UUID] = list(dict.fromkeys(schema.id for schema in schemas))
+        delete_statement = delete(LandAreaLimit).where(
+            LandAreaLimit.land_area_id == land_area_id)
+        if ids:
+            delete_statement = delete_statement.where(
+                LandAreaLimit.limit_id.not_in(ids))
+        await session.execute(delete_statement)
+        if not ids:
+            return
+        insert_statement = (
+            postgresql.insert(LandAreaLimit)
             .values([
-                {
-                    'limit_id': limit.id,
-                    'land_area_id': land_area_id
-                }
-                for limit in schemas
+                {'limit_id': _id, 'land_area_id': land_area_id}
+                for _id in ids
             ])
-            .returning(LandAreaLimit)
+            .on_conflict_do_nothing(
+                index_elements=['land_area_id', 'limit_id'])
         )
-        return await session.scalars(statement)
+        await session.execute(insert_statement)
@@ -1,6 +1,9 @@
-from typing import List, Optional
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Optional, Type
 from uuid import UUID
 
+from pydantic import BaseModel
+from sqlalchemy import RowMapping, insert, select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from domain.land_area.schema import OwnerRequestDTO
@@ -36,14 +39,78 @@ class OwnerRepository(SQLAlchemyRepository):
             )
         return owners
 
+    async def create_missing_owners(
+            self,
+            session: AsyncSession,
+            values: List[Dict[str, Any]]
+    ) -> int:
+        """
+        Создает одним INSERT собственников, которых еще нет у участка.
+        Собственник считается существующим, если у участка уже есть
+        собственник с тем же номером телефона
+        :param session: Сессия БД
+        :param values: Значения колонок собственников с land_area_id
+        :return: Количество созданных собственников
+        """
+        if not values:
+            return 0
+        existing = await session.execute(
+            select(LandOwner.land_area_id, LandOwner.phone_number).where(
+                tuple_(LandOwner.land_area_id, LandOwner.phone_number).in_(
+                    [(value['land_area_id'], value['phone_number'])
+                     for value in values]
+                )
+            )
+        )
+        existing_keys = set(existing.tuples())
+        missing = [
+            value for value in values
+            if (value['land_area_id'], value['phone_number'])
+            not in existing_keys
+        ]
+        if missing:
+            await session.execute(insert(LandOwner).values(missing))
+        return len(missing)
+
     async def update_owner(
             self,
             session: AsyncSession,
             owner_id: UUID,
+            expected_version: Optional[int] = None,
             **values_set
     ) -> Optional[LandOwner]:
         return await self.update_record(
             session,
             LandOwner.id == owner_id,
+            expected_version=expected_version,
             **values_set
         )
+
+    async def get_area_owner_rows(
+            self,
+            session: AsyncSession,
+            land_area_ids: Iterable[UUID],
+            schema: Type[BaseModel]
+    ) -> Dict[UUID, List[RowMapping]]:
+        """
+        Собственники участков одним запросом, сгруппированные по участку
+        :param session: Сессия БД
+        :param land_area_ids: ID участков
+        :param schema: Схема ответа собственника
+        :return: {ID участка: список строк}
+        """
+        owners: Dict[UUID, List[RowMapping]] = defaultdict(list)
+        land_area_ids = list(land_area_ids)
+        if not land_area_ids:
+            return owners
+        columns = self.projection_columns(schema)
+        if 'land_area_id' not in schema.model_fields:
+            columns.append(LandOwner.land_area_id.expression)
+        rows = await self.select_projection(
+            session,
+            columns=columns,
+            filters=[LandOwner.land_area_id.in_(land_area_ids)]
+        )
+        for row in rows:
+            owners[row['land_area_id']].append(row)
+        return owners
@@ -1,16 +1,48 @@
-from typing import Iterable, Optional
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Sequence
 from uuid import UUID
 
+from sqlalchemy import ColumnElement, bindparam, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy.orm.strategy_options import _AbstractLoad
 
-from infrastructure.database.model import LandAreaTask, TaskComment
+from domain.scheduler_task.schema import TASK_RELATIONS, TaskRelation
+from infrastructure.database.model import (
+    FINAL_TASK_STATUSES,
+    LandAreaTask,
+    TaskComment
+)
+from infrastructure.repository.loading import eager_load
 from infrastructure.repository.sqlalchemy_repository import SQLAlchemyRepository
 
 __all__ = [
     'LandAreaTaskRepository'
 ]
 
+_RELATION_OPTIONS: Dict[TaskRelation, _AbstractLoad] = {
+    'executor': eager_load(LandAreaTask.executor),
+    'author': eager_load(LandAreaTask.author),
+    'land_area': eager_load(LandAreaTask.land_area),
+    'task_comments': eager_load(
+        LandAreaTask.task_comments, TaskComment.employee)
+}
+
+
+def _open_deadline_filters(deadline_until: datetime) -> List[ColumnElement]:
+    """
+    Незавершенные задачи со сроком до deadline_until. Статусы
+    подставляются в SQL литералами, иначе Postgres не сможет использовать
+    частичный индекс ix_land_area_tasks_open_deadline для подготовленного
+    запроса
+    """
+    return [
+        LandAreaTask.status.not_in(bindparam(
+            'final_statuses', FINAL_TASK_STATUSES,
+            expanding=True, literal_execute=True)),
+        LandAreaTask.deadline <= deadline_until
+    ]
+
 
 class LandAreaTaskRepository(SQLAlchemyRepository):
     def __init__(self):
@@ -26,13 +58,59 @@ class LandAreaTaskRepository(SQLAlchemyRepository):
         )
         return await self.get_task_related(session, land_area_task.id)
 
+    async def create_tasks(
+            self,
+            session: AsyncSession,
+            values: List[Dict[str, Any]]
+    ) -> Sequence[LandAreaTask]:
+        """
+        Создает задачи одним INSERT
+        :param session: Сессия БД
+        :param values: Значения задач
+        :return: Задачи в порядке values
+        """
+        return await self.create_records(session, values)
+
+    async def change_tasks_status(
+            self,
+            session: AsyncSession,
+            task_ids: Iterable[UUID],
+            status: str
+    ) -> Sequence[LandAreaTask]:
+        """
+        Переводит задачи в статус одним UPDATE
+        :param session: Сессия БД
+        :param task_ids: ID задач
+        :param status: Новый статус
+        :return: Найденные и обновлённые задачи
+        """
+        return await self.update_records(
+            session, LandAreaTask.id.in_(task_ids), status=status)
+
     async def update_task(
             self,
             session: AsyncSession,
             *filters,
+            expected_version: Optional[int] = None,
             **values_set
-    ) -> LandAreaTask:
-        return await self.update_record(session, *filters, **values_set)
+    ) -> Optional[LandAreaTask]:
+        return await self.update_record(
+            session, *filters, expected_version=expected_version,
+            **values_set)
+
+    async def delete_task(
+            self,
+            session: AsyncSession,
+            task_id: UUID
+    ) -> bool:
+        """
+        Удаляет задачу, комментарии удаляются каскадно в БД
+        :param session: Сессия БД
+        :param task_id: ID задачи
+        :return: True, если задача была
+        """
+        return bool(
+            await self.delete_records(session, LandAreaTask.id == task_id))
 
     async def get_task(
             self,
@@ -49,7 +127,90 @@ class LandAreaTaskRepository(SQLAlchemyRepository):
         return await self.select_records(
             session,
             filters=[LandAreaTask.executor_id == employee_id],
-            options=[selectinload(LandAreaTask.land_area)]
+            options=[eager_load(LandAreaTask.land_area)]
+        )
+
+    async def get_deadline_tasks(
+            self,
+            session: AsyncSession,
+            deadline_until: datetime,
+            executor_id: Optional[UUID],
+            limit: int,
+            offset: int
+    ) -> Sequence[LandAreaTask]:
+        """
+        Незавершенные задачи со сроком до deadline_until, ближайшие первыми
+        :param session: Сессия БД
+        :param deadline_until: Верхняя граница срока
+        :param executor_id: Только задачи исполнителя, если задан
+        :param limit: Лимит
+        :param offset: Смещение
+        :return: Задачи с исполнителем и участком
+        """
+        filters = _open_deadline_filters(deadline_until)
+        if executor_id is not None:
+            filters.append(LandAreaTask.executor_id == executor_id)
+        result = await session.scalars(
+            select(LandAreaTask)
+            .where(*filters)
+            .order_by(LandAreaTask.deadline, LandAreaTask.id)
+            .limit(limit)
+            .offset(offset)
+            .options(
+                eager_load(LandAreaTask.executor),
+                eager_load(LandAreaTask.land_area)
+            )
+        )
+        return result.all()
+
+    async def lock_tasks_to_remind(
+            self,
+            session: AsyncSession,
+            deadline_until: datetime,
+            limit: int
+    ) -> Sequence[LandAreaTask]:
+        """
+        Блокирует пачку задач, о сроке которых еще не напоминали. Задачи,
+        заблокированные параллельным сканированием, пропускаются
+        :param session: Сессия БД
+        :param deadline_until: Верхняя граница срока
+        :param limit: Размер пачки
+        :return: Задачи с исполнителем
+        """
+        result = await session.scalars(
+            select(LandAreaTask)
+            .where(
+                *_open_deadline_filters(deadline_until),
+                LandAreaTask.reminded_deadline.is_distinct_from(
+                    LandAreaTask.deadline)
+            )
+            .order_by(LandAreaTask.deadline, LandAreaTask.id)
+            .limit(limit)
+            .options(eager_load(LandAreaTask.executor))
+            .with_for_update(skip_locked=True, of=LandAreaTask)
+        )
+        return result.all()
+
+    async def mark_reminded(
+            self,
+            session: AsyncSession,
+            task_ids: Iterable[UUID]
+    ) -> None:
+        """
+        Отмечает, что о текущем сроке задач напомнили
+        :param session: Сессия БД
+        :param task_ids: ID задач
+        """
+        await session.execute(
+            update(LandAreaTask)
+            .where(LandAreaTask.id.in_(task_ids))
+            # updated_at не меняется: напоминание не изменяет задачу и не
+            # должно попадать в ленту изменений
+            .values(
+                reminded_deadline=LandAreaTask.deadline,
+                updated_at=LandAreaTask.updated_at
+            ),
+            execution_options={'synchronize_session': False}
         )
 
     async def get_area_tasks(
@@ -60,30 +221,67 @@ class LandAreaTaskRepository(SQLAlchemyRepository):
         return await self.select_records(
             session,
             filters=[LandAreaTask.land_area_id == land_area_id],
-            options=[selectinload(LandAreaTask.executor)]
+            options=[eager_load(LandAreaTask.executor)]
         )
 
     async def get_task_related(
             self,
             session: AsyncSession,
-            task_id: UUID
+            task_id: UUID,
+            comments_limit: Optional[int] = None,
+            include: Iterable[TaskRelation] = TASK_RELATIONS
     ) -> Optional[LandAreaTask]:
-        return await self.get_record_with_relationships(
-            session, filters=[LandAreaTask.id == task_id],
-            options=[
-                selectinload(LandAreaTask.executor),
-                selectinload(LandAreaTask.author),
-                selectinload(LandAreaTask.land_area),
-                selectinload(
-                    LandAreaTask.task_comments
-                ).selectinload(
-                    TaskComment.employee
-                )
-            ]
+        """
+        Задача с запрошенными отношениями: исполнителем, автором, участком
+        и комментариями. Незапрошенные отношения не загружаются
+        :param session: Сессия БД
+        :param task_id: ID задачи
+        :param comments_limit: Если задан - только столько последних
+        комментариев, иначе все
+        :param include: Загружаемые отношения
+        :return: Задача
+        """
+        relations = set(include)
+        newest_comments_limit: Optional[int] = (
+            comments_limit if 'task_comments' in relations else None)
+        if newest_comments_limit is not None:
+            relations.discard('task_comments')
+        loaded = tuple(sorted(relations))
+        task: Optional[LandAreaTask] = await self.get_cached_record(
+            session, f'get_task_related:{",".join(loaded)}',
+            lambda: (
+                select(LandAreaTask)
+                .where(LandAreaTask.id == bindparam('task_id'))
+                .options(*(_RELATION_OPTIONS[name] for name in loaded))
+            ),
+            task_id=task_id
         )
+        if task is not None and newest_comments_limit is not None:
+            set_committed_value(
+                task, 'task_comments',
+                await self.__get_newest_comments(
+                    session, task_id, newest_comments_limit)
+            )
+        return task
 
-    async def is_task_exists(self, session: AsyncSession, *filters) -> bool:
-        task: LandAreaTask = await self.get_record(session, *filters)
-        if not task:
-            return False
-        return True
+    async def __get_newest_comments(
+            self,
+            session: AsyncSession,
+            task_id: UUID,
+            comments_limit: int
+    ) -> Sequence[TaskComment]:
+        comments = await session.scalars(
+            self.cached_statement(
+                'newest_task_comments',
+                lambda: (
+                    select(TaskComment)
+                    .where(TaskComment.task_id == bindparam('task_id'))
+                    .order_by(
+                        TaskComment.created_at.desc(), TaskComment.id.desc())
+                    .limit(bindparam('comments_limit'))
+                    .options(eager_load(TaskComment.employee))
+                )
+            ),
+            {'task_id': task_id, 'comments_limit': comments_limit}
+        )
+        return comments.all()
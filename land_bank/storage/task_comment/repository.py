@@ -1,10 +1,15 @@
-from typing import Optional
+from typing import Optional, Sequence, Tuple
 from uuid import UUID
 
+from sqlalchemy import func, select
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
+from domain.request_params.schema import KeysetCursor
+from infrastructure.database.errors import is_foreign_key_violation
 from infrastructure.database.model import TaskComment
+from infrastructure.exception import rpc_exceptions
+from infrastructure.repository.loading import eager_load
 from infrastructure.repository.sqlalchemy_repository import SQLAlchemyRepository
 
 
@@ -17,7 +22,21 @@ class TaskCommentRepository(SQLAlchemyRepository):
             session: AsyncSession,
             **values_set
     ) -> TaskComment:
-        comment: TaskComment = await self.create_record(session, **values_set)
+        """
+        Создает комментарий без проверки задачи: её отсутствие
+        обнаруживается по нарушению внешнего ключа
+        :param session: Сессия БД
+        :param values_set: Значения комментария
+        :return: Комментарий с автором
+        """
+        try:
+            comment: TaskComment = await self.create_record(
+                session, **values_set)
+        except IntegrityError as error:
+            if not is_foreign_key_violation(error):
+                raise
+            raise rpc_exceptions.ObjectNotFoundError(
+                data='No task by this id') from error
         return await self.get_comment_with_employee(session, comment.id)
 
     async def get_task_comment(
@@ -38,7 +57,7 @@ class TaskCommentRepository(SQLAlchemyRepository):
         return await self.get_record_with_relationships(
             session,
             filters=[TaskComment.id == comment_id],
-            options=[selectinload(TaskComment.employee)]
+            options=[eager_load(TaskComment.employee)]
         )
 
     async def delete_task_comment(
@@ -47,3 +66,37 @@ class TaskCommentRepository(SQLAlchemyRepository):
             task_comment: TaskComment
     ) -> None:
         await self.delete_record(session, task_comment)
+
+    async def get_comment_page(
+            self,
+            session: AsyncSession,
+            task_id: UUID,
+            limit: int,
+            after: Optional[KeysetCursor] = None
+    ) -> Tuple[Sequence[TaskComment], bool]:
+        """
+        Комментарии задачи с авторами, от новых к старым
+        :param session: Сессия БД
+        :param task_id: ID задачи
+        :param limit: Размер страницы
+        :param after: Последний комментарий предыдущей страницы
+        :return: (комментарии, есть ли следующая страница)
+        """
+        return await self.select_keyset_page(
+            session,
+            filters=[TaskComment.task_id == task_id],
+            keys=[TaskComment.created_at, TaskComment.id],
+            after=(after.created_at, after.id) if after else None,
+            limit=limit,
+            options=[eager_load(TaskComment.employee)]
+        )
+
+    async def count_comments(
+            self,
+            session: AsyncSession,
+            task_id: UUID
+    ) -> int:
+        return await session.scalar(
+            select(func.count())
+            .where(TaskComment.task_id == task_id)
+        ) or 0
@@ -0,0 +1,8 @@
+import os
+
+# Настройки читаются при импорте infrastructure.settings, токены в тестах
+# не проверяются внешними сервисами
+os.environ.setdefault('SECRET_KEY', 'test-secret-key')
+os.environ.setdefault('ALGORITHM', 'HS256')
+os.environ.setdefault('ACCESS_TOKEN_TTL_MINUTES', '5')
+os.environ.setdefault('REFRESH_TOKEN_TTL_DAYS', '1')
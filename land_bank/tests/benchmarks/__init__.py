@@ -0,0 +1,33 @@
+import time
+from typing import Awaitable, Callable
+
+__all__ = [
+    'best_of',
+    'report'
+]
+
+
+async def best_of(
+        call: Callable[[], Awaitable[object]],
+        calls: int,
+        repeats: int = 3
+) -> float:
+    """
+    Лучшее из repeats время calls последовательных вызовов
+    :return: Время одного вызова в микросекундах
+    """
+    await call()
+    best = float('inf')
+    for _ in range(repeats):
+        started_at = time.perf_counter()
+        for _ in range(calls):
+            await call()
+        best = min(best, time.perf_counter() - started_at)
+    return best / calls * 1_000_000
+
+
+def report(name: str, baseline_us: float, optimized_us: float) -> None:
+    print(
+        f'{name}: {baseline_us:.1f} us -> {optimized_us:.1f} us per call '
+        f'(x{baseline_us / optimized_us:.2f})'
+    )
@@ -0,0 +1,84 @@
+"""
+Страница select_land_area из 1000 участков с собственниками: ORM объекты
+с selectinload против выборки только колонок схемы ответа
+(select_projection). Оба варианта собирают ответ через model_validate,
+чтобы сравнивалась только выборка.
+Нужна тестовая БД (TestDatabaseSettings).
+Запуск из каталога land_bank: python -m tests.benchmarks.projection
+"""
+import asyncio
+from typing import List
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from domain.land_area.schema import LandAreaListResponseDTO, OwnerResponseDTO
+from domain.request_params.schema import LimitOffset
+from infrastructure.database.model import LandArea
+from storage.land_area import LandAreaRepository
+from storage.owner import OwnerRepository
+from tests.benchmarks import best_of, report
+from tests.database import create_test_engine
+from tests.factories import create_land_areas
+
+PAGE_SIZE = 1000
+CALLS = 20
+
+land_area_repository = LandAreaRepository()
+owner_repository = OwnerRepository()
+
+
+async def select_entities(
+        session: AsyncSession
+) -> List[LandAreaListResponseDTO]:
+    land_areas = await session.scalars(
+        select(LandArea)
+        .options(selectinload(LandArea.owners))
+        .order_by(LandArea.entered_at_base.desc())
+        .limit(PAGE_SIZE)
+    )
+    result = [
+        LandAreaListResponseDTO.model_validate(
+            land_area, from_attributes=True)
+        for land_area in land_areas
+    ]
+    session.expunge_all()
+    return result
+
+
+async def select_projection(
+        session: AsyncSession
+) -> List[LandAreaListResponseDTO]:
+    land_areas = await land_area_repository.get_ordered_land_rows(
+        session, LimitOffset(limit=PAGE_SIZE), None,
+        LandAreaListResponseDTO)
+    owners = await owner_repository.get_area_owner_rows(
+        session, (land_area['id'] for land_area in land_areas),
+        OwnerResponseDTO)
+    return [
+        LandAreaListResponseDTO.model_validate(
+            {**land_area, 'owners': owners[land_area['id']]})
+        for land_area in land_areas
+    ]
+
+
+async def main() -> None:
+    engine = await create_test_engine()
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            await create_land_areas(session, PAGE_SIZE, owners_per_area=2)
+            await session.commit()
+
+            entities_us = await best_of(
+                lambda: select_entities(session), CALLS)
+            projection_us = await best_of(
+                lambda: select_projection(session), CALLS)
+            report(f'select_land_area, {PAGE_SIZE} areas x 2 owners',
+                   entities_us, projection_us)
+    finally:
+        await engine.dispose()
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
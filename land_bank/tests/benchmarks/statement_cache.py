@@ -0,0 +1,58 @@
+"""
+get_task_related: запрос из cached_statement против запроса, который
+строится заново на каждый вызов (как до кэша запросов).
+Нужна тестовая БД (TestDatabaseSettings).
+Запуск из каталога land_bank: python -m tests.benchmarks.statement_cache
+"""
+import asyncio
+from uuid import UUID
+
+from sqlalchemy import Select, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from infrastructure.database.model import LandAreaTask, TaskComment
+from infrastructure.repository.loading import eager_load
+from storage.scheduler_task import LandAreaTaskRepository
+from tests.benchmarks import best_of, report
+from tests.database import create_test_engine
+from tests.factories import create_employee, create_land_areas, create_task
+
+CALLS = 2000
+
+
+def build_statement(task_id: UUID) -> Select:
+    return (
+        select(LandAreaTask)
+        .where(LandAreaTask.id == task_id)
+        .options(
+            eager_load(LandAreaTask.executor),
+            eager_load(LandAreaTask.author),
+            eager_load(LandAreaTask.land_area),
+            eager_load(LandAreaTask.task_comments, TaskComment.employee)
+        )
+    )
+
+
+async def main() -> None:
+    engine = await create_test_engine()
+    repository = LandAreaTaskRepository()
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            employee = await create_employee(session)
+            land_area, = await create_land_areas(session, 1)
+            task = await create_task(
+                session, land_area, employee, employee, comments=5)
+            await session.commit()
+
+            fresh_us = await best_of(
+                lambda: session.scalar(build_statement(task.id)), CALLS)
+            cached_us = await best_of(
+                lambda: repository.get_task_related(session, task.id), CALLS)
+            report('get_task_related, DB round trip included',
+                   fresh_us, cached_us)
+    finally:
+        await engine.dispose()
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,92 @@
+"""
+Сборка страницы select_land_area из 1000 участков с собственниками:
+model_validate против construct_trusted на тех же источниках, что и в
+эндпоинтах - строках RowMapping из БД и ORM объектах.
+Нужна тестовая БД (TestDatabaseSettings).
+Запуск из каталога land_bank: python -m tests.benchmarks.trusted_construction
+"""
+import asyncio
+from typing import Any, Callable, Dict, List, Sequence
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from domain.land_area.schema import LandAreaListResponseDTO, OwnerResponseDTO
+from domain.request_params.schema import LimitOffset
+from domain.trusted import construct_trusted
+from infrastructure.database.model import LandArea
+from storage.land_area import LandAreaRepository
+from storage.owner import OwnerRepository
+from tests.benchmarks import best_of, report
+from tests.database import create_test_engine
+from tests.factories import create_land_areas
+
+PAGE_SIZE = 1000
+CALLS = 20
+
+land_area_repository = LandAreaRepository()
+owner_repository = OwnerRepository()
+
+
+def validate(source: Any) -> LandAreaListResponseDTO:
+    return LandAreaListResponseDTO.model_validate(
+        source, from_attributes=True)
+
+
+def construct(source: Any) -> LandAreaListResponseDTO:
+    return construct_trusted(LandAreaListResponseDTO, source)
+
+
+async def build_page(
+        build: Callable[[Any], LandAreaListResponseDTO],
+        sources: Sequence[Any]
+) -> None:
+    for source in sources:
+        build(source)
+
+
+async def select_rows(session: AsyncSession) -> List[Dict[str, Any]]:
+    land_areas = await land_area_repository.get_ordered_land_rows(
+        session, LimitOffset(limit=PAGE_SIZE), None,
+        LandAreaListResponseDTO)
+    owners = await owner_repository.get_area_owner_rows(
+        session, (land_area['id'] for land_area in land_areas),
+        OwnerResponseDTO)
+    return [
+        {**land_area, 'owners': owners[land_area['id']]}
+        for land_area in land_areas
+    ]
+
+
+async def select_entities(session: AsyncSession) -> Sequence[LandArea]:
+    land_areas = await session.scalars(
+        select(LandArea)
+        .options(selectinload(LandArea.owners))
+        .limit(PAGE_SIZE)
+    )
+    return land_areas.all()
+
+
+async def compare(name: str, sources: Sequence[Any]) -> None:
+    validate_us = await best_of(lambda: build_page(validate, sources), CALLS)
+    construct_us = await best_of(
+        lambda: build_page(construct, sources), CALLS)
+    report(f'{name}, {PAGE_SIZE} areas x 2 owners', validate_us, construct_us)
+
+
+async def main() -> None:
+    engine = await create_test_engine()
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            await create_land_areas(session, PAGE_SIZE, owners_per_area=2)
+            await session.commit()
+
+            await compare('RowMapping', await select_rows(session))
+            await compare('ORM', await select_entities(session))
+    finally:
+        await engine.dispose()
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,22 @@
+from typing import AsyncIterator
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from tests.database import create_test_engine
+
+
+@pytest.fixture
+async def engine() -> AsyncIterator[AsyncEngine]:
+    try:
+        engine = await create_test_engine()
+    except OSError as error:
+        pytest.skip(f'Test database is not available: {error}')
+    yield engine
+    await engine.dispose()
+
+
+@pytest.fixture
+async def session(engine: AsyncEngine) -> AsyncIterator[AsyncSession]:
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        yield session
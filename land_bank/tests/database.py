@@ -0,0 +1,23 @@
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+from infrastructure.database.model import Base
+from infrastructure.database.query_stats import instrument_engine
+from infrastructure.settings import TestDatabaseSettings
+
+__all__ = [
+    'create_test_engine'
+]
+
+
+async def create_test_engine() -> AsyncEngine:
+    """
+    Движок тестовой БД (TestDatabaseSettings) с пересозданной схемой.
+    Запросы считаются так же, как в приложении, через QueryStats
+    :return: Движок
+    """
+    engine = create_async_engine(TestDatabaseSettings.url())
+    instrument_engine(engine)
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.drop_all)
+        await connection.run_sync(Base.metadata.create_all)
+    return engine
@@ -0,0 +1,97 @@
+from datetime import datetime, timedelta
+from typing import Any, List
+from uuid import uuid4
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from infrastructure.database.model import (
+    Employee,
+    LandArea,
+    LandAreaTask,
+    LandOwner,
+    TaskComment
+)
+
+__all__ = [
+    'create_employee',
+    'create_land_areas',
+    'create_task'
+]
+
+
+async def create_employee(session: AsyncSession, **values: Any) -> Employee:
+    employee = Employee(
+        email=values.pop('email', f'{uuid4().hex}@test.ru'),
+        hashed_password='hashed',
+        **values
+    )
+    session.add(employee)
+    await session.flush()
+    return employee
+
+
+async def create_land_areas(
+        session: AsyncSession,
+        count: int,
+        owners_per_area: int = 0
+) -> List[LandArea]:
+    """
+    Участки с собственниками, кадастровые номера - 66:41:0000000:<i>
+    :param session: Сессия БД
+    :param count: Количество участков
+    :param owners_per_area: Собственников у каждого участка
+    :return: Участки
+    """
+    land_areas = [
+        LandArea(
+            name=f'Участок {number}',
+            cadastral_number=f'66:41:0000000:{number}',
+            area_category='Земли населенных пунктов',
+            area_square=100 + number,
+            cadastral_cost=1000 + number,
+            address='г. Екатеринбург, ул. Ленина',
+            search_channel='Авито',
+            working_status='Новый',
+            stage='Поиск'
+        )
+        for number in range(count)
+    ]
+    session.add_all(land_areas)
+    await session.flush()
+    session.add_all(
+        LandOwner(
+            name=f'Собственник {number}',
+            phone_number=f'+7999000{number:04d}',
+            land_area_id=land_area.id
+        )
+        for land_area in land_areas
+        for number in range(owners_per_area)
+    )
+    await session.flush()
+    return land_areas
+
+
+async def create_task(
+        session: AsyncSession,
+        land_area: LandArea,
+        executor: Employee,
+        author: Employee,
+        comments: int = 0
+) -> LandAreaTask:
+    task = LandAreaTask(
+        name='Задача',
+        executor_id=executor.id,
+        author_id=author.id,
+        land_area_id=land_area.id,
+        status='Создана',
+        deadline=datetime.utcnow() + timedelta(days=7)
+    )
+    session.add(task)
+    await session.flush()
+    session.add_all(
+        TaskComment(
+            task_id=task.id, employee_id=author.id, text=f'Комментарий {i}')
+        for i in range(comments)
+    )
+    await session.flush()
+    return task
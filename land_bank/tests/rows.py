@@ -0,0 +1,40 @@
+from datetime import datetime
+from typing import Any, Dict, List
+from uuid import uuid4
+
+__all__ = [
+    'land_area_rows'
+]
+
+
+def land_area_rows(count: int, owners_per_area: int) -> List[Dict[str, Any]]:
+    """
+    Строки страницы select_land_area в том виде, в каком их собирает
+    эндпоинт: колонки участка и список строк собственников
+    """
+    rows = []
+    for number in range(count):
+        land_area_id = uuid4()
+        rows.append({
+            'id': land_area_id,
+            'name': f'Участок {number}',
+            'cadastral_number': f'66:41:0000000:{number}',
+            'area_category': 'Земли населенных пунктов',
+            'area_square': 100.0 + number,
+            'entered_at_base': datetime(2024, 1, 1),
+            'working_status': 'Новый',
+            'stage': 'Поиск',
+            'owners': [
+                {
+                    'id': uuid4(),
+                    'land_area_id': land_area_id,
+                    'name': f'Собственник {owner}',
+                    'email': None,
+                    'phone_number': f'+7999000{owner:04d}',
+                    'location': None,
+                    'version': 1
+                }
+                for owner in range(owners_per_area)
+            ]
+        })
+    return rows
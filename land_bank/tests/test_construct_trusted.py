@@ -0,0 +1,20 @@
+from domain.land_area.schema import LandAreaListResponseDTO, OwnerResponseDTO
+from domain.trusted import construct_trusted
+from tests.rows import land_area_rows
+
+
+def test_matches_model_validate():
+    for row in land_area_rows(3, owners_per_area=2):
+        trusted = construct_trusted(LandAreaListResponseDTO, row)
+        validated = LandAreaListResponseDTO.model_validate(row)
+        assert trusted == validated
+        assert trusted.model_dump_json() == validated.model_dump_json()
+        assert isinstance(trusted.owners[0], OwnerResponseDTO)
+
+
+def test_missing_optional_fields_are_none():
+    owner = land_area_rows(1, owners_per_area=1)[0]['owners'][0]
+    del owner['email'], owner['location']
+    trusted = construct_trusted(OwnerResponseDTO, owner)
+    assert trusted.email is None
+    assert trusted.location is None
@@ -0,0 +1,31 @@
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# Как в main.py: application.auth загружается раньше storage.employee,
+# который импортирует его модуль hasher
+import application.auth  # noqa: F401
+from infrastructure.database.model import LandAreaTask
+from storage.scheduler_task import LandAreaTaskRepository
+from tests.factories import create_employee, create_land_areas, create_task
+
+task_repository = LandAreaTaskRepository()
+
+
+async def test_mark_reminded_keeps_updated_at(session: AsyncSession):
+    land_area = (await create_land_areas(session, 1))[0]
+    executor = await create_employee(session)
+    task = await create_task(session, land_area, executor, executor)
+    await session.commit()
+    updated_at = await session.scalar(
+        select(LandAreaTask.updated_at).where(LandAreaTask.id == task.id))
+
+    await task_repository.mark_reminded(session, [task.id])
+    await session.commit()
+
+    row = (await session.execute(
+        select(LandAreaTask.reminded_deadline, LandAreaTask.updated_at)
+        .where(LandAreaTask.id == task.id)
+    )).one()
+    assert row.reminded_deadline == task.deadline
+    # Напоминание не попадает в ленту изменений по updated_at
+    assert row.updated_at == updated_at
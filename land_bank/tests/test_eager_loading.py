@@ -0,0 +1,54 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# Как в main.py: application.auth загружается раньше storage.employee,
+# который импортирует его модуль hasher
+import application.auth  # noqa: F401
+from infrastructure.database.model import Department, Position
+from infrastructure.database.query_stats import collect_query_stats
+from storage.employee import EmployeeRepository
+from storage.scheduler_task import LandAreaTaskRepository
+from tests.factories import create_employee, create_land_areas, create_task
+
+employee_repository = EmployeeRepository()
+task_repository = LandAreaTaskRepository()
+
+
+async def test_employee_profile_is_one_statement(session: AsyncSession):
+    position = Position(position_name='Юрист')
+    department = Department(department_name='Юридический отдел')
+    session.add_all([position, department])
+    await session.flush()
+    head = await create_employee(session)
+    employee = await create_employee(
+        session, position_id=position.id, department_id=department.id,
+        employee_head_id=head.id)
+    session.expunge_all()
+
+    with collect_query_stats('employee_profile') as stats:
+        profile = await employee_repository.employee_profile(
+            session, employee.id)
+    assert stats.statements == 1
+    assert profile is not None
+    assert profile.position.position_name == 'Юрист'
+    assert profile.department.department_name == 'Юридический отдел'
+    assert profile.employee_head.id == head.id
+
+
+async def test_task_related_loads_comments_separately(session: AsyncSession):
+    land_area = (await create_land_areas(session, 1))[0]
+    executor = await create_employee(session)
+    author = await create_employee(session)
+    task = await create_task(session, land_area, executor, author, comments=3)
+    session.expunge_all()
+
+    with collect_query_stats('get_task_related') as stats:
+        related = await task_repository.get_task_related(session, task.id)
+    # Задача с исполнителем, автором и участком - одним JOIN'ом,
+    # комментарии с авторами - вторым запросом
+    assert stats.statements == 2
+    assert related is not None
+    assert related.executor.id == executor.id
+    assert related.author.id == author.id
+    assert related.land_area.id == land_area.id
+    assert [comment.employee.id for comment in related.task_comments] == [
+        author.id] * 3
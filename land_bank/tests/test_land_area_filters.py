@@ -0,0 +1,51 @@
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Iterator
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from domain.land_area.schema import LandAreaListResponseDTO
+from domain.request_params.schema import LandAreaFilterParams, LimitOffset
+from storage.land_area import LandAreaRepository
+from tests.factories import create_land_areas
+
+land_area_repository = LandAreaRepository()
+
+MSK = timezone(timedelta(hours=3))
+
+
+@pytest.fixture(autouse=True)
+def server_timezone(monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
+    # Локальное время сервера UTC+05, чтобы оно отличалось и от UTC,
+    # и от часового пояса границ (POSIX TZ: знак смещения обратный)
+    monkeypatch.setenv('TZ', 'YEKT-5')
+    time.tzset()
+    yield
+    monkeypatch.undo()
+    time.tzset()
+
+
+def test_aware_bounds_are_converted_to_naive_local():
+    filter_params = LandAreaFilterParams.model_validate({
+        'entered_from': datetime(2024, 1, 1, 3, tzinfo=MSK),
+        'entered_to': datetime(2024, 1, 1, 6)
+    })
+    assert filter_params.entered_from == datetime(2024, 1, 1, 5)
+    assert filter_params.entered_to == datetime(2024, 1, 1, 6)
+
+
+async def test_aware_bounds_filter_entered_at_base(session: AsyncSession):
+    land_areas = await create_land_areas(session, 2)
+    land_areas[0].entered_at_base = datetime(2024, 1, 1, 17)
+    land_areas[1].entered_at_base = datetime(2024, 1, 2, 17)
+    await session.flush()
+
+    rows = await land_area_repository.get_ordered_land_rows(
+        session, LimitOffset(), None, LandAreaListResponseDTO,
+        LandAreaFilterParams.model_validate({
+            'entered_from': datetime(2024, 1, 1, 14, tzinfo=MSK),
+            'entered_to': datetime(2024, 1, 1, 16, tzinfo=MSK)
+        })
+    )
+    assert [row['id'] for row in rows] == [land_areas[0].id]
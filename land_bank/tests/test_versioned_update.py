@@ -0,0 +1,25 @@
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from infrastructure.exception import rpc_exceptions
+from storage.land_area import LandAreaRepository
+from tests.factories import create_land_areas
+
+land_area_repository = LandAreaRepository()
+
+
+async def test_update_bumps_version(session: AsyncSession):
+    land_area = (await create_land_areas(session, 1))[0]
+    updated = await land_area_repository.update_land_area(
+        session, land_area.id, 1, name='Новое название')
+    assert updated is not None
+    assert updated.version == 2
+
+
+async def test_stale_version_is_rejected(session: AsyncSession):
+    land_area = (await create_land_areas(session, 1))[0]
+    await land_area_repository.update_land_area(
+        session, land_area.id, name='Первое изменение')
+    with pytest.raises(rpc_exceptions.ConcurrentModificationError):
+        await land_area_repository.update_land_area(
+            session, land_area.id, 1, name='Второе изменение')
@@ -0,0 +1,56 @@
+from uuid import UUID, uuid4
+
+import pytest
+from sqlalchemy import delete
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+# Как в main.py: application.auth загружается раньше storage.employee,
+# который импортирует его модуль hasher
+import application.auth  # noqa: F401
+from domain.task_comment.schema import TaskCommentRequestDTO
+from endpoint.rpc.scheduler import add_task_comment
+from infrastructure.database import transaction
+from infrastructure.database.model import Employee
+from infrastructure.database.session import ASYNC_CONTEXT_SESSION
+from infrastructure.database.transaction import in_transaction
+from infrastructure.exception import rpc_exceptions
+from tests.factories import create_employee, create_land_areas, create_task
+
+
+@pytest.fixture(autouse=True)
+def transaction_session(
+        engine: AsyncEngine, monkeypatch: pytest.MonkeyPatch) -> None:
+    # Методы с in_transaction открывают сессии на тестовой БД
+    monkeypatch.setattr(
+        transaction, 'get_async_session',
+        lambda: AsyncSession(engine, expire_on_commit=False))
+
+
+@in_transaction
+async def delete_employee(employee_id: UUID) -> None:
+    session: AsyncSession = ASYNC_CONTEXT_SESSION.get()
+    await session.execute(delete(Employee).where(Employee.id == employee_id))
+
+
+async def test_comment_on_unknown_task_is_not_found(session: AsyncSession):
+    employee = await create_employee(session)
+    await session.commit()
+
+    with pytest.raises(rpc_exceptions.ObjectNotFoundError):
+        await add_task_comment(
+            TaskCommentRequestDTO.model_validate(
+                {'task_id': uuid4(), 'text': 'Комментарий'}),
+            employee)
+
+
+async def test_deleting_referenced_row_is_transaction_error(
+        session: AsyncSession):
+    land_area = (await create_land_areas(session, 1))[0]
+    executor = await create_employee(session)
+    author = await create_employee(session)
+    await create_task(session, land_area, executor, author)
+    await session.commit()
+
+    # Нарушение внешнего ключа при удалении - не "объект не найден"
+    with pytest.raises(rpc_exceptions.TransactionError):
+        await delete_employee(executor.id)